@@ -1,3 +1,4 @@
+import time
 from enola.base.common.auth.auth_service_provider import AuthServiceProvider
 
 class AuthServiceBloc():
@@ -14,8 +15,9 @@ class AuthServiceBloc():
         connectObject.huemulLogging.logMessageInfo("Ground Control station: " + authModel.urlService)
         connectObject.huemulCommon.setServiceUrl(value = authModel.urlService)
 
+        started = time.monotonic()
         while (continueInLoop):
-            result = AuthServiceProvider(connect_object=connectObject).authSignInService(
+            result = AuthServiceProvider(connect_object=connectObject, started=started).authSignInService(
                 consumer_id = authModel.consumer_id,
                 consumer_secret = authModel.consumer_secret,
                 org_id = authModel.org_id,
@@ -23,7 +25,10 @@ class AuthServiceBloc():
             )
 
             attempt +=1
-            continueInLoop = result.analyze_errors(attempt)
-        
+            continueInLoop = result.analyze_errors(attempt, started)
+
+        if (result.is_timeout()):
+            #stopped by the timeout or the deadline of the connection
+            raise result.to_exception(result.message)
 
         return result
\ No newline at end of file
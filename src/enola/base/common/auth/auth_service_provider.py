@@ -19,7 +19,7 @@ class AuthServiceProvider(HuemulResponseToBloc):
             bytes = dataIn.encode('ascii') #.getBytes(StandardCharsets.UTF_8)
             base64Str = base64.b64encode(bytes).decode('ascii')
 
-            huemulResponse = HuemulConnection(connect_object=self.connect_object).auth_request(
+            huemulResponse = HuemulConnection(connect_object=self.connect_object, started=self.started).auth_request(
                 route = "authService/v1/sign-in-service/",
                 data = base64Str,
                 org_id = org_id
@@ -1,18 +1,11 @@
+from enola.base.common.huemul_mapping import HuemulMapping
 
-class HuemulCommon:
+
+class HuemulCommon(HuemulMapping):
 
     def __init__(self):
         self._service_url = ""
 
-    def __getitem__(self, key):
-        return self.__dict__[key]
-
-    def __getattr__(self, key):
-        return self.__dict__[key]
-
-    def get(self, key, default=None):
-        return self.__dict__.get(key, default)
-
     #
     # return total attemps
     # @return int
@@ -0,0 +1,88 @@
+import gzip
+import threading
+from enola.base.common.huemul_mapping import HuemulMapping
+
+#
+# request body compression (Content-Encoding), used by post/put requests of a Connect object
+# @param encoding "gzip", "zstd" (needs zstandard package) or None to send bodies as they are
+# @param threshold min body size in bytes to compress, small bodies are cheaper uncompressed
+# @param level compression level, None for the default of each algorithm
+#
+class HuemulCompression(HuemulMapping):
+    ENCODINGS = ("gzip", "zstd")
+
+    def __init__(self, encoding = None, threshold: int = 1024, level = None):
+        if (encoding is not None and encoding not in self.ENCODINGS):
+            raise NameError(f"compression {encoding} not supported, use one of {self.ENCODINGS}")
+
+        self.encoding = encoding
+        self.threshold = threshold
+        self.level = level
+        # a ZstdCompressor can't be used by two threads at once, each thread gets its own
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+        if (encoding == "zstd"):
+            try:
+                import zstandard
+            except ImportError:
+                raise NameError("zstandard is required for zstd compression, install it with: pip install enola[zstd]")
+
+    #
+    # true if bodies are compressed
+    # @return Boolean
+    #
+    def is_enabled(self):
+        return self.encoding is not None
+
+    #
+    # stop compressing, used when the server doesn't accept compressed bodies
+    #
+    def disable(self):
+        with self._lock:
+            self.encoding = None
+
+    #
+    # compress body if enabled and bigger than threshold
+    # @param data str or bytes
+    # @return (body, Content-Encoding or None)
+    #
+    def compress(self, data):
+        # read once, disable() can run in another thread meanwhile
+        encoding = self.encoding
+        if (encoding is None or data is None):
+            return (data, None)
+
+        body = data.encode("utf-8") if isinstance(data, str) else data
+        if (len(body) < self.threshold):
+            return (data, None)
+
+        if (encoding == "zstd"):
+            return (self._get_zstd_compressor().compress(body), "zstd")
+
+        return (gzip.compress(body, compresslevel=6 if (self.level is None) else self.level), "gzip")
+
+    #
+    # zstd compressor of the current thread, created on first use
+    # @return zstandard.ZstdCompressor
+    #
+    def _get_zstd_compressor(self):
+        compressor = getattr(self._local, "zstd_compressor", None)
+        if (compressor is None):
+            import zstandard
+            compressor = zstandard.ZstdCompressor(level=3 if (self.level is None) else self.level)
+            self._local.zstd_compressor = compressor
+
+        return compressor
+
+    # locks and per-thread compressors can't be pickled, they are created again
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_local"]
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._lock = threading.Lock()
@@ -1,24 +1,39 @@
+import time
+from urllib.parse import quote
 import requests
 from enola.base.common.huemul_http_info import HuemulHttpInfo
 from enola.base.common.huemul_response_provider import HuemulResponseProvider
 from enola.base.common.huemul_response_error import HuemulResponseError
-import json
+from enola.base.common import huemul_json
 
 from enola.base.connect import Connect
-
-class HuemulConnection:
-    def __init__(self, connect_object: Connect):
+from enola.base.common.huemul_mapping import HuemulMapping
+
+#
+# @param connect_object Connect
+# @param started time.monotonic() when the operation started, used with the deadline of the connection
+#
+class HuemulConnection(HuemulMapping):
+    def __init__(self, connect_object: Connect, started = None):
         self.connectObject = connect_object
-        #self.httpClient: CloseableHttpClient = HttpClients.createDefault
+        #pooled keep-alive session, one per Connect object
+        self.transport = connect_object.huemul_transport
+        self.started = started
 
-    def __getitem__(self, key):
-        return self.__dict__[key]
+    #
+    # timeouts for the next request, shortened to the time left before the deadline
+    # @return (connect, read) seconds
+    #
+    def get_timeout(self):
+        deadline = self.connectObject.deadline
+        if (deadline is None or self.started is None):
+            return self.transport.timeout
 
-    def __getattr__(self, key):
-        return self.__dict__[key]
+        remaining = deadline - (time.monotonic() - self.started)
+        if (remaining <= 0):
+            raise requests.exceptions.Timeout(f"deadline of {deadline} seconds exceeded")
 
-    def get(self, key, default=None):
-        return self.__dict__.get(key, default)
+        return (min(self.transport.timeout[0], remaining), min(self.transport.timeout[1], remaining))
 
     #
     # get HTTP call to post method
@@ -43,8 +58,11 @@ class HuemulConnection:
             })
 
             payload = "".format("")
-            httpInfo = requests.request("POST", uriFinal, data=payload, headers=headers)
+            httpInfo = self.transport.request("POST", uriFinal, data=payload, headers=headers, timeout=self.get_timeout())
             # print(response.text)
+        except requests.exceptions.Timeout as timeout_err:
+            print(f'Timeout error occurred: {timeout_err}')
+            return self._timeout_response(timeout_err)
         except Exception as e:
             print(e)
             
@@ -66,9 +84,10 @@ class HuemulConnection:
         if (self.connectObject.huemul_common.get_service_url() == ""):
             raise NameError('API Url null or empty')
 
+        #values are url-encoded, "+" of dates with timezone and base64 filters would arrive as a space
         routeParams = ""
         for i in range(len(queryParams)):
-            routeParams = routeParams + ("?" if i == 0 else "&") + str(queryParams[i].get("name")) + "=" + str(queryParams[i].get("value"))
+            routeParams = routeParams + ("?" if i == 0 else "&") + quote(str(queryParams[i].get("name")), safe="") + "=" + quote(str(queryParams[i].get("value")), safe="")
         
         httpInfo = HuemulHttpInfo("", -1)
 
@@ -79,7 +98,7 @@ class HuemulConnection:
             #add header
             headers = self.get_header(headerParams=headerParams)
 
-            httpInfo = requests.request("GET", uriFinal, headers=headers)
+            httpInfo = self.transport.request("GET", uriFinal, headers=headers, timeout=self.get_timeout())
             # print(response.text)
 
             value = self._get_response(httpInfo)
@@ -90,12 +109,12 @@ class HuemulConnection:
             print(f'HTTP status code: {error_code}')
             
             huemul_response_on_error.errors.append(HuemulResponseError(errorId = error_code, errorTxt = str(http_err)))
-        except requests.exceptions.ConnectionError as conn_err:
-            print(f'Connection error occurred: {conn_err}')  # Nombre del error y descripción
-            huemul_response_on_error.errors.append(HuemulResponseError(errorId = "ConnectionError", errorTxt = str(conn_err)))
         except requests.exceptions.Timeout as timeout_err:
             print(f'Timeout error occurred: {timeout_err}')  # Nombre del error y descripción
             huemul_response_on_error.errors.append(HuemulResponseError(errorId = "Timeout", errorTxt = str(timeout_err)))
+        except requests.exceptions.ConnectionError as conn_err:
+            print(f'Connection error occurred: {conn_err}')  # Nombre del error y descripción
+            huemul_response_on_error.errors.append(HuemulResponseError(errorId = "ConnectionError", errorTxt = str(conn_err)))
         except requests.exceptions.RequestException as req_err:
             print(f'An error occurred: {req_err}')  # Nombre del error y descripción
             huemul_response_on_error.errors.append(HuemulResponseError(errorId = "RequestException", errorTxt = str(req_err)))
@@ -133,12 +152,24 @@ class HuemulConnection:
             #add header
             headers = self.get_header(headerParams=headerParams)
 
-            payload = data #"".format("")
-            httpInfo = requests.request("POST", uriFinal, data=payload, headers=headers)
+            payload, contentEncoding = self.connectObject.huemul_compression.compress(data) #"".format("")
+            if (contentEncoding is not None):
+                headers["Content-Encoding"] = contentEncoding
+
+            httpInfo = self.transport.request("POST", uriFinal, data=payload, headers=headers, timeout=self.get_timeout())
+            if (contentEncoding is not None and httpInfo.status_code == 415):
+                #server doesn't accept compressed bodies, send them plain from now on
+                self.connectObject.huemul_logging.log_message_info(message = f"{contentEncoding} compression not supported by server, disabled")
+                self.connectObject.huemul_compression.disable()
+                del headers["Content-Encoding"]
+                httpInfo = self.transport.request("POST", uriFinal, data=data, headers=headers, timeout=self.get_timeout())
             # print(response.text)
 
             value = self._get_response(httpInfo)
             return value
+        except requests.exceptions.Timeout as timeout_err:
+            print(f'Timeout error occurred: {timeout_err}')
+            return self._timeout_response(timeout_err)
         except Exception as e:
             print(e)
             huemulResponse = HuemulResponseProvider()
@@ -177,14 +208,27 @@ class HuemulConnection:
             headers = self.get_header(headerParams=None)
 
             payload = data #"".format("")
-            httpInfo = requests.request("PUT", uriFinal, data=payload, headers=headers)
+            httpInfo = self.transport.request("PUT", uriFinal, data=payload, headers=headers, timeout=self.get_timeout())
             # print(response.text)
+        except requests.exceptions.Timeout as timeout_err:
+            print(f'Timeout error occurred: {timeout_err}')
+            return self._timeout_response(timeout_err)
         except Exception as e:
             print(e)
             
         value = self._get_response(httpInfo)
         return value
 
+    #
+    # response of a request stopped by its timeout or the deadline
+    # @param timeout_err requests Timeout
+    # @return HuemulResponseProvider
+    #
+    def _timeout_response(self, timeout_err):
+        huemulResponse = HuemulResponseProvider()
+        huemulResponse.errors.append(HuemulResponseError(errorId = "Timeout", errorTxt = str(timeout_err)))
+        return huemulResponse
+
     #
     # common header for each http method
     # headerParams: Dictionary
@@ -234,16 +278,26 @@ class HuemulConnection:
     # return HuemulResponseProvider
     def _get_response(self, response):
         huemulResponse = HuemulResponseProvider()
+        if (not isinstance(response, requests.Response)):
+            #request failed before getting a response
+            huemulResponse.errors.append(HuemulResponseError(errorId = "ConnectionError", errorTxt = "no response from server"))
+            return huemulResponse
+
+        #real http status, used to decide retries (body may not be json, ex: 502 from a proxy)
+        huemulResponse.responseStatusCode = response.status_code
+        huemulResponse.retryAfter = response.headers.get("Retry-After")
 
         try:
-            if (response.text != ""):
-                dataFromJson = json.loads(response.text)
+            #parse raw bytes, avoids decoding the body to str first
+            if (len(response.content) > 0):
+                dataFromJson = huemul_json.loads(response.content)
                 huemulResponse.fromDict(**dataFromJson)
             else:
                 huemulResponse.isSuccessful = False
-                huemulResponse.errors.append(HuemulResponseError(errorId = "getResponseError", errorTxt = f'status {response.status_code}: response.text is empty'))
+                huemulResponse.errors.append(HuemulResponseError(errorId = "getResponseError", errorTxt = f'status {response.status_code}: response body is empty'))
                 huemulResponse.httpStatusCode = response.status_code
                 huemulResponse.message = response.reason
+
             
             #huemulResponse.fromDict(**dataFromJson) #HuemulResponseProvider.fromJson(response.text)
         except Exception as e:
@@ -1,9 +1,11 @@
+from enola.base.common.huemul_mapping import HuemulMapping
+
 #
 # @author Sebastián Rodríguez Robotham
 # Return datetime details
 # @param difDates endDateTime - StartDateTime (long)
 #
-class HuemulDateTimePart:
+class HuemulDateTimePart(HuemulMapping):
     def __init__(self, difDates):
         milliseconds = difDates
         calc = difDates / 1000
@@ -13,13 +15,4 @@ class HuemulDateTimePart:
         calc /= 60
         self.hour = calc % 24
         calc /= 24
-        self.days = calc
-
-    def __getitem__(self, key):
-        return self.__dict__[key]
-
-    def __getattr__(self, key):
-        return self.__dict__[key]
-
-    def get(self, key, default=None):
-        return self.__dict__.get(key, default)
\ No newline at end of file
+        self.days = calc
\ No newline at end of file
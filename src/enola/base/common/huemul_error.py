@@ -1,3 +1,5 @@
+from enola.base.common.huemul_mapping import HuemulMapping
+
  # errorTrace, 
  # errorClassName, 
  # errorFileName, 
@@ -6,7 +8,7 @@
  # errorMessage, 
  # errorIsError, 
  # errorCode
-class HuemulError:
+class HuemulError(HuemulMapping):
     def __init__(self, org_id, huemul_logging, **args):
         self.errorId = ""
         self.org_id = org_id
@@ -47,15 +49,6 @@ class HuemulError:
             self.error_is_error = args["errorIsError"] if args["errorIsError"] != None else args["error_is_error"]
             self.error_code = args["errorCode"] if args["errorCode"] != None else args["error_code"]
 
-    def __getitem__(self, key):
-        return self.__dict__[key]
-
-    def __getattr__(self, key):
-        return self.__dict__[key]
-
-    def get(self, key, default=None):
-        return self.__dict__.get(key, default)
-
     # return boolean
     def isOK(self):
         return not (self.error_is_error)
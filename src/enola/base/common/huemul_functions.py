@@ -1,18 +1,10 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from enola.base.common.huemul_mapping import HuemulMapping
 
-class HuemulFunctions:
+class HuemulFunctions(HuemulMapping):
     def __init__(self):
         self.started = True
     
-    def __getitem__(self, key):
-        return self.__dict__[key]
-
-    def __getattr__(self, key):
-        return self.__dict__[key]
-
-    def get(self, key, default=None):
-        return self.__dict__.get(key, default)
-    
     #
     # getCurrentDateTime: returns current datetime
     # from version 1.1
@@ -38,6 +30,15 @@ class HuemulFunctions:
 
         return dateString
     
+    # return date in string format, same as get_date_for_api
+    # ns: nanoseconds since epoch (time.time_ns())
+    def get_date_for_api_from_ns(self, ns):
+        seconds, nanoseconds = divmod(ns, 1_000_000_000)
+        newDate = datetime.fromtimestamp(seconds, timezone.utc) + timedelta(microseconds=nanoseconds // 1000)
+        dateString = newDate.isoformat(timespec='milliseconds')
+
+        return dateString
+
     def get_dif_seconds(self, dateFromIso, dateToIso):
         dateFrom = datetime.fromisoformat(dateFromIso)
         dateTo = datetime.fromisoformat(dateToIso)
@@ -48,6 +49,12 @@ class HuemulFunctions:
         dateTo = datetime.fromisoformat(dateToIso)
         return (dateTo - dateFrom).total_seconds() * 1000
 
+    # parse iso date or datetime, accepts "Z" as utc (fromisoformat doesn't before python 3.11)
+    # dateIso: string
+    # return datetime
+    def get_date_from_iso(self, dateIso):
+        return datetime.fromisoformat(dateIso[:-1] + "+00:00" if dateIso.endswith("Z") else dateIso)
+
     def delete_args(self, data):
         try:
             delattr(data, "args")
@@ -1,18 +1,11 @@
+from enola.base.common.huemul_mapping import HuemulMapping
+
 #
 # @author Sebastián Rodríguez Robotham
 # @param body http return body
 # @param httpCode http return code
 #
-class HuemulHttpInfo:
+class HuemulHttpInfo(HuemulMapping):
     def __init__(self, body, httpCode):
         self.body = body
-        self.httpCode = httpCode
-
-    def __getitem__(self, key):
-        return self.__dict__[key]
-
-    def __getattr__(self, key):
-        return self.__dict__[key]
-
-    def get(self, key, default=None):
-        return self.__dict__.get(key, default)
\ No newline at end of file
+        self.httpCode = httpCode
\ No newline at end of file
@@ -0,0 +1,104 @@
+import json
+
+#
+# json codec used to send and receive data from the server
+# uses the fastest library installed (orjson, msgspec, ujson), stdlib json otherwise
+# encode returns bytes and decode accepts bytes, so bodies are never converted to str
+#
+
+def _stdlib_dumps(obj, default = None):
+    return json.dumps(obj, default=default).encode("utf-8")
+
+
+def _stdlib_loads(data):
+    return json.loads(data)
+
+
+def _orjson_codec():
+    import orjson
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj, default = None):
+        return orjson.dumps(obj, default=default, option=options)
+
+    return (dumps, orjson.loads)
+
+
+def _msgspec_codec():
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+
+    def dumps(obj, default = None):
+        return msgspec.json.encode(obj, enc_hook=default)
+
+    return (dumps, decoder.decode)
+
+
+def _ujson_codec():
+    import ujson
+
+    def dumps(obj, default = None):
+        return ujson.dumps(obj, default=default).encode("utf-8")
+
+    return (dumps, ujson.loads)
+
+
+_BACKENDS = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "ujson": _ujson_codec,
+    "json": lambda: (_stdlib_dumps, _stdlib_loads),
+}
+
+#backend in use and its functions
+backend = "json"
+_dumps = _stdlib_dumps
+_loads = _stdlib_loads
+
+
+#
+# select json library
+# @param name "orjson", "msgspec", "ujson", "json" or None for the fastest one installed
+# @return name of the library selected
+#
+def set_backend(name = None):
+    global backend, _dumps, _loads
+
+    names = [name] if (name is not None) else ["orjson", "msgspec", "ujson", "json"]
+    for candidate in names:
+        if (candidate not in _BACKENDS):
+            raise NameError(f"json backend {candidate} not supported, use one of {list(_BACKENDS)}")
+
+        try:
+            (_dumps, _loads) = _BACKENDS[candidate]()
+            backend = candidate
+            return backend
+        except ImportError:
+            if (name is not None):
+                raise NameError(f"json backend {candidate} is not installed")
+
+    return backend
+
+
+#
+# serialize to json
+# @param obj dict, list or value
+# @param default function called for objects that can't be serialized
+# @return bytes (utf-8)
+#
+def dumps(obj, default = None):
+    return _dumps(obj, default=default)
+
+
+#
+# parse json
+# @param data bytes or str
+# @return dict, list or value
+#
+def loads(data):
+    return _loads(data)
+
+
+set_backend()
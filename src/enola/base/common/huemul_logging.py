@@ -1,19 +1,22 @@
 import logging
+import threading
+from enola.base.common.huemul_mapping import HuemulMapping
 
-class HuemulLogging:
-    def __init__(self):
-        FORMAT = '%(asctime)s %(message)s'
-        logging.basicConfig(format=FORMAT, level=logging.INFO)
-        self.logger = logging.getLogger('Enola')
-
-    def __getitem__(self, key):
-        return self.__dict__[key]
+#logging is configured once per process, not for each connection
+_configured = False
+_configure_lock = threading.Lock()
 
-    def __getattr__(self, key):
-        return self.__dict__[key]
+class HuemulLogging(HuemulMapping):
+    def __init__(self):
+        global _configured
+        if (not _configured):
+            with _configure_lock:
+                if (not _configured):
+                    FORMAT = '%(asctime)s %(message)s'
+                    logging.basicConfig(format=FORMAT, level=logging.INFO)
+                    _configured = True
 
-    def get(self, key, default=None):
-        return self.__dict__.get(key, default)
+        self.logger = logging.getLogger('Enola')
 
     #
     # logMessageDebug: Send {message} to log4j - Debug
@@ -31,7 +34,7 @@ class HuemulLogging:
     # logMessageWarn: Send {message} to log4j - Warning
     #
     def logMessageWarn(self, message):
-        self.logger.warn(message)
+        self.logger.warning(message)
 
     #
     # logMessageError: Send {message} to log4j - Error
@@ -0,0 +1,23 @@
+from typing import Any, Optional
+
+
+#
+# base of the enola classes, keeps obj["key"] and obj.get("key") working with normal attribute lookup
+# missing attributes raise AttributeError (KeyError with obj["key"]), so hasattr, copy and pickle work as usual
+# empty __slots__, subclasses with __slots__ don't get a __dict__
+#
+class HuemulMapping:
+    __slots__ = ()
+
+    # object.__getattribute__ skips the __getattr__ fallback of models that return None for missing attributes
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return object.__getattribute__(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        try:
+            return object.__getattribute__(self, key)
+        except AttributeError:
+            return default
@@ -1,19 +1,12 @@
+from enola.base.common.huemul_mapping import HuemulMapping
+
 #
 # @author Sebastián Rodríguez Robotham
 # receive some params
 # @param name param name
 # @param value param value
 #
-class HuemulParam:
+class HuemulParam(HuemulMapping):
     def __init__(self, name, value):
         self.name = name
-        self.value = value
-
-    def __getitem__(self, key):
-        return self.__dict__[key]
-
-    def __getattr__(self, key):
-        return self.__dict__[key]
-
-    def get(self, key, default=None):
-        return self.__dict__.get(key, default)
\ No newline at end of file
+        self.value = value
\ No newline at end of file
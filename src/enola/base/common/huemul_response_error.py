@@ -1,20 +1,12 @@
+from enola.base.common.huemul_mapping import HuemulMapping
+
 #
 # @author Sebastián Rodríguez Robotham
 # error class used by backend to return error info
 # @param errorId error Id
 # @param errorTxt error Message
 #
-class HuemulResponseError:
+class HuemulResponseError(HuemulMapping):
     def __init__(self, errorId, errorTxt):
         self.errorId = errorId
-        self.errorTxt = errorTxt
-
-
-    def __getitem__(self, key):
-        return self.__dict__[key]
-
-    def __getattr__(self, key):
-        return self.__dict__[key]
-
-    def get(self, key, default=None):
-        return self.__dict__.get(key, default)
\ No newline at end of file
+        self.errorTxt = errorTxt
\ No newline at end of file
@@ -1,3 +1,5 @@
+from enola.base.common.huemul_mapping import HuemulMapping
+
 #
 # @author Sebastián Rodríguez Robotham
 # base class to post/get http methods
@@ -12,8 +14,12 @@
 # data, 
 # extraInfo, 
 # endDate = ""
-class HuemulResponseProvider:
+class HuemulResponseProvider(HuemulMapping):
     def __init__(self, **args):
+        # status of the http response (None if the server was not reached) and its Retry-After header
+        self.responseStatusCode = None
+        self.retryAfter = None
+
         if (len(args) == 0):
             self.isSuccessful = False
             # status code: 200 OK, 500 error, etc
@@ -47,15 +53,6 @@ class HuemulResponseProvider:
                 extraInfo = args["extraInfo"] if "extraInfo" in args else "" ,
                 endDate = args["endDate"] if "endDate" in args else "" 
             )
-
-    def __getitem__(self, key):
-        return self.__dict__[key]
-
-    def __getattr__(self, key):
-        return self.__dict__[key]
-
-    def get(self, key, default=None):
-        return self.__dict__.get(key, default)
        
     """
     def load_huemul_response_from_json(self, json_data):
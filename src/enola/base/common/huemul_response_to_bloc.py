@@ -1,22 +1,29 @@
 from ast import Try
+import asyncio
 import json
 import time
 from warnings import catch_warnings
 from enola.base.common.huemul_connection import HuemulConnection
+from enola.base.common.huemul_response_error import HuemulResponseError
 from enola.base.common.huemul_response_provider import HuemulResponseProvider
+from enola.base.common.huemul_timeout_error import HuemulTimeoutError
 from enola.base.connect import Connect
 
 #
 # @author Sebastián Rodríguez Robotham
 # base class to create, get, getAll methods exposed to user
 # @tparam T class Model
+# @param started time.monotonic() when the operation started, used with the deadline of the connection
 #
 
 
 class HuemulResponseToBloc(HuemulResponseProvider):
-    def __init__(self, connect_object: Connect, **args):
+    def __init__(self, connect_object: Connect, started = None, **args):
         self.data = "" #huemulResponseProvider.dataRaw
         self.connect_object = connect_object
+        self.started = started
+        #true when the operation was stopped by the deadline
+        self.timedOut = False
         self.isSuccessful = False
         # status code: 200 OK, 500 error, etc
         self.httpStatusCode = ""
@@ -35,20 +42,29 @@ class HuemulResponseToBloc(HuemulResponseProvider):
         self.dataRaw = ""
         #extra info detail
         self.extraInfoRaw = ""
+        #http status and Retry-After of the response, used by the retry policy
+        self.responseStatusCode = None
+        self.retryAfter = None
 
         #print("paso 100")
         if (len(args) == 1 and "huemulResponseProvider" in args):
             #print("paso 200")
             self.from_response_provider(args["huemulResponseProvider"])
 
-    def __getitem__(self, key):
-        return self.__dict__[key]
-
-    def __getattr__(self, key):
-        return self.__dict__[key]
+    #
+    # true if the call failed by a timeout or the deadline of the operation
+    # @return Boolean
+    #
+    def is_timeout(self):
+        return self.timedOut or any(error.get("errorId") == "Timeout" for error in self.errors)
 
-    def get(self, key, default=None):
-        return self.__dict__.get(key, default)
+    #
+    # error to raise when the call failed
+    # @param message error message
+    # @return HuemulTimeoutError if is_timeout, NameError otherwise
+    #
+    def to_exception(self, message):
+        return HuemulTimeoutError(message) if (self.is_timeout()) else NameError(message)
 
 
     def from_response_provider(self, huemul_response_provider: HuemulResponseProvider):
@@ -72,85 +88,93 @@ class HuemulResponseToBloc(HuemulResponseProvider):
         self.dataRaw = huemul_response_provider.data_raw
         #extra info detail
         self.extraInfoRaw = huemul_response_provider.extraInfoRaw
+        self.responseStatusCode = huemul_response_provider.responseStatusCode
+        self.retryAfter = huemul_response_provider.retryAfter
         #print("paso 400")
 
     #
     #analyze error and determine attempts strategy
     # @param result create/get/getAll response (HuemulResponseBloc type)
     # @param attempt attempt number
+    # @param started time.monotonic() when the first attempt started, limits the total retry time
     # @return Boolean
     #
-    def analyze_errors(self, attempt):
-        #print("paso 500")
-        continueInLoop = True
+    def analyze_errors(self, attempt, started = None):
+        (continueInLoop, waitSeconds) = self._analyze_errors(attempt, started)
+        if (continueInLoop and waitSeconds > 0):
+            time.sleep(waitSeconds)
+
+        return continueInLoop
+
+    #
+    #same as analyze_errors, but waits without blocking the event loop
+    # @param attempt attempt number
+    # @param started time.monotonic() when the first attempt started, limits the total retry time
+    # @return Boolean
+    #
+    async def analyze_errors_async(self, attempt, started = None):
+        (continueInLoop, waitSeconds) = self._analyze_errors(attempt, started)
+        if (continueInLoop and waitSeconds > 0):
+            await asyncio.sleep(waitSeconds)
+
+        return continueInLoop
 
+    #
+    #determine attempts strategy with the retry policy of the connection
+    # @param attempt attempt number
+    # @param started time.monotonic() when the first attempt started
+    # @return (Boolean, seconds to wait before next attempt)
+    #
+    def _analyze_errors(self, attempt, started = None):
+        #print("paso 500")
         if (self.isSuccessful):
             #all right, exit
-            continueInLoop = False
-        elif (attempt < self.connect_object.huemul_common.get_total_attempt()):
-            #send errors
-            self.connect_object.huemul_logging.log_message_error(f"Error running service {self.message}")
-            #self.connectObject.huemulLogging.logMessageInfo(str(self.errors))
+            return (False, 0)
 
-            try:
-                #errorText = ';'.join(map(lambda x: str(x["errorId"]) + ": " + x["errorTxt"],self.errors))
-                errorText = self.message if (len(self.errors) == 0) else ';'.join(map(lambda x: str(x["errorId"]) + ": " + x["errorTxt"],self.errors))
-            except Exception as e:
-                try:
-                    #errorText = ';'.join(map(lambda x: str(x.errorId) + ": " + x.errorTxt,self.errors))
-                    errorText = self.message if (len(self.errors) == 0) else ';'.join(map(lambda x: str(x.errorId) + ": " + x.errorTxt,self.errors))
-                except Exception as e:
-                    if hasattr(e, 'doc') and e.doc is not None:
-                        errorText = "error try to catch error: " + e.doc
-                    else:
-                        errorText = "error try to catch error: " + str(e)
-
-            self.connect_object.huemul_logging.log_message_error("errors details: " + errorText)
-            self.connect_object.huemul_logging.log_message_error("errors transaction-id: " + self.transactionId)
-            #wait from second attempt
-            if (attempt > 1):
-                # wait 10 seconds and try to call again
-                self.connect_object.huemul_logging.log_message_error("waiting 5 seconds.....")
-                time.sleep(5)
-            
-
-            #get all possible errors
-            try:
-                connectionError = len(list(filter(lambda x: x.errorId == "APP-101" or x.errorId == "ConnectionError", self.errors)))
-            except Exception as e:
-                connectionError = len([error for error in self.errors if error.get("errorId") == "APP-101"])
-            connectionError = -1 if connectionError == 0 else connectionError
+        retryPolicy = self.connect_object.huemul_retry_policy
 
-            try:
-                unAuthorizedError = len(list(filter(lambda x: x["errorId"] == "2040", self.errors)))
-            except Exception as e:
-                unAuthorizedError = len([error for error in self.errors if error.get("errorId") == "2040"])
-            unAuthorizedError = -1 if unAuthorizedError == 0 else unAuthorizedError
+        #send errors
+        self.connect_object.huemul_logging.log_message_error(f"Error running service {self.message}")
+        #self.connectObject.huemulLogging.logMessageInfo(str(self.errors))
 
+        try:
+            #errorText = ';'.join(map(lambda x: str(x["errorId"]) + ": " + x["errorTxt"],self.errors))
+            errorText = self.message if (len(self.errors) == 0) else ';'.join(map(lambda x: str(x["errorId"]) + ": " + x["errorTxt"],self.errors))
+        except Exception as e:
             try:
-                forbiddenError = len(list(filter(lambda x: x["errorId"] == "2030", self.errors)))
+                #errorText = ';'.join(map(lambda x: str(x.errorId) + ": " + x.errorTxt,self.errors))
+                errorText = self.message if (len(self.errors) == 0) else ';'.join(map(lambda x: str(x.errorId) + ": " + x.errorTxt,self.errors))
             except Exception as e:
-                forbiddenError = len([error for error in self.errors if error.get("errorId") == "2030"])
-            forbiddenError = -1 if forbiddenError == 0 else forbiddenError
-
-            if (forbiddenError > 0):
-                self.connect_object.huemul_logging.log_message_error("forbidden")
-
-            if (unAuthorizedError > 0):
-                self.connect_object.huemul_logging.log_message_error("attempt " + str(attempt + 1) + " of " + str(self.connect_object.huemul_common.get_total_attempt()))
-                #check if error = unauthorized, try to login again
-                continueInLoop = True
-            elif (connectionError > 0):
-                self.connect_object.huemul_logging.log_message_error("attempt " + str(attempt + 1) + " of " + str(self.connect_object.huemul_common.get_total_attempt()))
-                #raised error from HuemulConnection method
-                continueInLoop = True
-            else:
-                #unknown error (maybe data), exit and return error
-                continueInLoop = False
-
-        else:
-            continueInLoop = False
-
-
-        return continueInLoop
-    
\ No newline at end of file
+                if hasattr(e, 'doc') and e.doc is not None:
+                    errorText = "error try to catch error: " + e.doc
+                else:
+                    errorText = "error try to catch error: " + str(e)
+
+        self.connect_object.huemul_logging.log_message_error("errors details: " + errorText)
+        self.connect_object.huemul_logging.log_message_error("errors transaction-id: " + self.transactionId)
+
+        if (self.responseStatusCode == 403):
+            self.connect_object.huemul_logging.log_message_error("forbidden")
+
+        if (not retryPolicy.is_retryable(self.responseStatusCode)):
+            #unknown error (maybe data), exit and return error
+            return (False, 0)
+
+        waitSeconds = retryPolicy.next_wait(attempt, started, self.responseStatusCode, self.retryAfter)
+        if (waitSeconds is None):
+            #no more attempts or time left
+            return (False, 0)
+
+        deadline = self.connect_object.deadline
+        if (deadline is not None and started is not None and time.monotonic() - started + waitSeconds >= deadline):
+            #next attempt would start after the deadline
+            self.connect_object.huemul_logging.log_message_error(f"deadline of {deadline} seconds exceeded")
+            self.timedOut = True
+            self.errors.append(HuemulResponseError(errorId = "Timeout", errorTxt = f"deadline of {deadline} seconds exceeded"))
+            return (False, 0)
+
+        self.connect_object.huemul_logging.log_message_error("attempt " + str(attempt + 1) + " of " + str(retryPolicy.max_attempts))
+        if (waitSeconds > 0):
+            self.connect_object.huemul_logging.log_message_error(f"waiting {waitSeconds:.2f} seconds.....")
+
+        return (True, waitSeconds)
@@ -0,0 +1,89 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from enola.base.common.huemul_mapping import HuemulMapping
+
+#
+# retry strategy shared by all blocs of a Connect object
+# waits grow exponentially with full jitter, so clients failing at the same time don't retry together
+# @param max_attempts max calls, including the first one
+# @param base_delay seconds to wait after the first failure (before jitter)
+# @param max_delay max seconds between two attempts
+# @param max_total_time max seconds spent retrying an operation, None for no limit
+# @param retry_status_codes http status codes that can be retried, calls without http response (connection errors) are always retried
+# @param respect_retry_after wait the Retry-After header sent with 429/503
+#
+class HuemulRetryPolicy(HuemulMapping):
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        max_total_time: float = 120.0,
+        retry_status_codes = (408, 425, 429, 500, 502, 503, 504),
+        respect_retry_after: bool = True,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_total_time = max_total_time
+        self.retry_status_codes = set(retry_status_codes)
+        self.respect_retry_after = respect_retry_after
+
+    #
+    # true if the failed call can be tried again
+    # @param status_code http status of the response, None if the server was not reached
+    # @return Boolean
+    #
+    def is_retryable(self, status_code):
+        if (status_code is None):
+            #connection error, timeout, etc
+            return True
+
+        return status_code in self.retry_status_codes
+
+    #
+    # seconds to wait before next attempt, None if the operation must stop
+    # @param attempt number of attempts already done
+    # @param started time.monotonic() when the operation started, None to ignore max_total_time
+    # @param status_code http status of the last response
+    # @param retry_after Retry-After header of the last response
+    # @return float or None
+    #
+    def next_wait(self, attempt, started = None, status_code = None, retry_after = None):
+        if (attempt >= self.max_attempts):
+            return None
+
+        # full jitter: random between 0 and the exponential delay
+        waitSeconds = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+        if (self.respect_retry_after and status_code in (429, 503)):
+            retryAfterSeconds = self.parse_retry_after(retry_after)
+            if (retryAfterSeconds is not None):
+                waitSeconds = max(waitSeconds, retryAfterSeconds)
+
+        if (started is not None and self.max_total_time is not None):
+            remaining = self.max_total_time - (time.monotonic() - started)
+            if (waitSeconds >= remaining):
+                return None
+
+        return waitSeconds
+
+    #
+    # Retry-After as seconds, accepts delay-seconds and http-date formats
+    # @param value header value
+    # @return float or None
+    #
+    def parse_retry_after(self, value):
+        if (value is None or value == ""):
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,6 @@
+#
+# raised when a call to Enola doesn't finish in time (request timeout or deadline of the operation)
+# extends NameError, the error raised for any other failed call, so existing handlers still catch it
+#
+class HuemulTimeoutError(NameError):
+    pass
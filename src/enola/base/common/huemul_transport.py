@@ -0,0 +1,97 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from enola.base.common.huemul_mapping import HuemulMapping
+
+#
+# long-lived HTTP transport shared by every provider of a Connect object
+# keeps a pool of keep-alive connections, so each call reuses the TCP + TLS session
+# @param pool_size max connections kept open per host
+# @param max_retries low level retries (connect errors) done by the adapter
+# @param keep_alive False to close the connection after each call
+# @param connect_timeout max seconds to open a connection
+# @param read_timeout max seconds waiting for data from the server
+#
+class HuemulTransport(HuemulMapping):
+    def __init__(self, pool_size: int = 10, max_retries: int = 0, keep_alive: bool = True, connect_timeout: float = 10.0, read_timeout: float = 60.0):
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.keep_alive = keep_alive
+        self.timeout = (connect_timeout, read_timeout)
+
+        #pool can grow while other threads send, ensure_pool_size changes it under this lock
+        self._lock = threading.Lock()
+        self.session = requests.Session()
+        self._adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=self.max_retries)
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+        #announce every encoding urllib3 can decode (gzip, deflate, br/zstd if installed), responses are decompressed transparently
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        if (not keep_alive):
+            self.session.headers["Connection"] = "close"
+
+        #worker threads used by async clients, created on first async call
+        self._executor = None
+
+    #
+    # grow the connection pool, used before sending with several workers
+    # transports are shared, so the pool only grows and the adapter stays mounted:
+    # a new pool manager replaces the old one, requests in flight finish with their connection
+    # @param pool_size min connections needed
+    #
+    def ensure_pool_size(self, pool_size: int):
+        with self._lock:
+            if (pool_size <= self.pool_size):
+                return
+
+            self.pool_size = pool_size
+            self._adapter.init_poolmanager(pool_size, pool_size, block=self._adapter._pool_block)
+
+    #
+    # send http request using pooled session
+    # @param method GET, POST, PUT
+    # @param url final url
+    # @param timeout (connect, read) seconds, None to use the transport timeouts
+    # @return requests.Response
+    #
+    def request(self, method, url, timeout = None, **kwargs):
+        return self.session.request(method, url, timeout=self.timeout if (timeout is None) else timeout, **kwargs)
+
+    #
+    # run a blocking call (provider + http request) without blocking the event loop
+    # calls run in a pool sized as the connection pool, so each one has its own keep-alive connection
+    # @param func blocking function
+    # @return awaitable with func result
+    #
+    def run_async(self, func, *args, **kwargs):
+        if (self._executor is None):
+            with self._lock:
+                if (self._executor is None):
+                    self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="enola-http")
+
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    #
+    # release all pooled connections
+    #
+    def close(self):
+        if (self._executor is not None):
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.session.close()
+
+    # locks and worker threads can't be pickled, they are created again
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_executor"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -1,15 +1,30 @@
 from enola.base.common.auth.auth_model import AuthModel
 from enola.base.common.huemul_common import HuemulCommon
+from enola.base.common.huemul_compression import HuemulCompression
 from enola.base.common.huemul_error import HuemulError
 from enola.base.common.huemul_logging import HuemulLogging
+from enola.base.common.huemul_retry_policy import HuemulRetryPolicy
+from enola.base.common.huemul_transport import HuemulTransport
 
 # authData: AuthModel
+# pool_size: max keep-alive connections kept open to the service
+# max_retries: low level retries done by the http adapter (connect errors)
+# keep_alive: False to close the connection after each call
+# retry_policy: HuemulRetryPolicy used by all calls, default exponential backoff with jitter
+# connect_timeout: max seconds to open a connection
+# read_timeout: max seconds waiting for data from the server
+# deadline: max seconds for an operation, including retries, None for no limit
+# compression: "gzip" or "zstd" to compress request bodies, None to send them plain
+# compression_threshold: min body size in bytes to compress
+# transport: HuemulTransport shared with other connections (see ConnectRegistry), None to create a new one
 class Connect:
-    def __init__(self, auth_data: AuthModel, show_message: bool = True):
+    def __init__(self, auth_data: AuthModel, show_message: bool = True, pool_size: int = 10, max_retries: int = 0, keep_alive: bool = True, retry_policy: HuemulRetryPolicy = None, connect_timeout: float = 10.0, read_timeout: float = 60.0, deadline: float = None, compression: str = None, compression_threshold: int = 1024, transport: HuemulTransport = None):
         self.authData = auth_data
         self.huemul_logging = HuemulLogging()
         self.show_message = show_message
-        if (self.show_message):
+        #start messages only for the first connection of a transport
+        self._show_start = show_message and transport is None
+        if (self._show_start):
             self.huemul_logging.log_message_info(message = "WELCOME to Enola...")
 
         self._can_execute = False
@@ -23,6 +38,12 @@ class Connect:
         #create error and common object
         self.control_error = HuemulError(org_id=auth_data.org_id, huemul_logging=self.huemul_logging)
         self.huemul_common = HuemulCommon()
+
+        #pooled http transport, shared by all providers using this connection
+        self.huemul_transport = transport if (transport is not None) else HuemulTransport(pool_size=pool_size, max_retries=max_retries, keep_alive=keep_alive, connect_timeout=connect_timeout, read_timeout=read_timeout)
+        self.huemul_retry_policy = retry_policy if (retry_policy is not None) else HuemulRetryPolicy()
+        self.deadline = deadline
+        self.huemul_compression = HuemulCompression(encoding=compression, threshold=compression_threshold)
         
         #valida que jwtToken no sea nulo
         if (auth_data.jwt_token is None):
@@ -41,10 +62,10 @@ class Connect:
         self.huemul_common.set_service_url(self.authData.url_service)
         
 
-        if (self.show_message):
+        if (self._show_start):
             self.huemul_logging.log_message_info(message = "authorized...")
         self.can_execute = True
-        if (self.show_message):
+        if (self._show_start):
             self.huemul_logging.log_message_info(message = "STARTED!!!")
 
         ### END START
@@ -0,0 +1,123 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from enola.base.common.auth.auth_model import AuthModel
+from enola.base.common.huemul_transport import HuemulTransport
+from enola.base.connect import Connect
+from enola.enola_types import TokenInfo
+from enola.base.common.huemul_mapping import HuemulMapping
+
+
+class ConnectRegistry(HuemulMapping):
+    """
+    Process-wide cache of the objects that are expensive to build for each `Tracking`, `TrackingBatch`,
+    `Evaluation` or `GetExecutions`: decoded tokens and HTTP transports (session + keep-alive pool).
+
+    Each instance still gets its own `Connect`, so the error state of one call never blocks another,
+    but all of them share the transport of their service url and settings.
+    """
+
+    def __init__(self, max_tokens: int = 1024):
+        """
+        Initializes a new `ConnectRegistry`.
+
+        Args:
+            max_tokens (int, optional): Max decoded tokens kept, the least recently used are removed first.
+        """
+        self.max_tokens = max_tokens
+        self._lock = threading.Lock()
+        self._token_infos: "OrderedDict[str, TokenInfo]" = OrderedDict()
+        self._transports: Dict[Tuple, HuemulTransport] = {}
+
+    def get_token_info(self, token: str) -> TokenInfo:
+        """
+        Returns the decoded token, decoding it only the first time.
+        """
+        with self._lock:
+            token_info = self._token_infos.get(token)
+            if token_info is not None:
+                self._token_infos.move_to_end(token)
+                return token_info
+
+        token_info = TokenInfo(token=token)
+        with self._lock:
+            self._token_infos[token] = token_info
+            while len(self._token_infos) > self.max_tokens:
+                self._token_infos.popitem(last=False)
+
+        return token_info
+
+    def connect(
+        self,
+        auth_data: AuthModel,
+        show_message: bool = True,
+        pool_size: int = 10,
+        max_retries: int = 0,
+        keep_alive: bool = True,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 60.0,
+        **connect_args,
+    ) -> Connect:
+        """
+        Returns a new `Connect` using the shared transport of the service url and transport settings.
+
+        The first connection of each transport creates it (and logs the start messages), the next ones reuse it.
+
+        Args:
+            auth_data (AuthModel): Credentials and service url.
+            **connect_args: Other arguments of `Connect` (retry_policy, deadline, compression, etc).
+        """
+        key = (auth_data.url_service, pool_size, max_retries, keep_alive, connect_timeout, read_timeout)
+        with self._lock:
+            transport = self._transports.get(key)
+
+        connection = Connect(
+            auth_data,
+            show_message=show_message,
+            pool_size=pool_size,
+            max_retries=max_retries,
+            keep_alive=keep_alive,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            transport=transport,
+            **connect_args,
+        )
+
+        if transport is None:
+            with self._lock:
+                transport = self._transports.setdefault(key, connection.huemul_transport)
+            # another connection stored its transport first, use that one
+            if transport is not connection.huemul_transport:
+                connection.huemul_transport.close()
+                connection.huemul_transport = transport
+
+        return connection
+
+    def clear(self) -> None:
+        """
+        Forgets decoded tokens and closes the shared transports, e.g. after a fork or to rotate tokens.
+        """
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+            self._token_infos.clear()
+
+        for transport in transports:
+            transport.session.close()
+
+
+_connect_registry: Optional[ConnectRegistry] = None
+_connect_registry_lock = threading.Lock()
+
+
+def get_connect_registry() -> ConnectRegistry:
+    """
+    Returns the process-wide registry, creating it on first use.
+    """
+    global _connect_registry
+    if _connect_registry is None:
+        with _connect_registry_lock:
+            if _connect_registry is None:
+                _connect_registry = ConnectRegistry()
+
+    return _connect_registry
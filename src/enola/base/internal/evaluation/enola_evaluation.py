@@ -5,41 +5,62 @@ from enola.enola_types import EvaluationModel, EvaluationResponseModel
 
 def create_evaluation(evaluation_model: EvaluationModel, connection: Connect, raise_error_if_fail = True):
     if (not connection.can_execute):
-        connection.huemul_logging.log_message_error(message = "can't execute: ")
-        return EvaluationResponseModel(
-            enola_id = "",
-            agent_deploy_id = "",
-            enola_eval_id = "",
-            successfull = False,
-            message = "can't execute:"
-        )
+        return _cant_execute(connection)
 
     if (connection.show_message):
         connection.huemul_logging.log_message_info(message = "creating Enola Evaluation")
 
     enola_evaluation_result = EnolaEvaluationBloc().enola_evaluation_create(evaluation_model=evaluation_model,connect_object=connection)
+    return _to_evaluation_response(enola_evaluation_result, connection, raise_error_if_fail)
+
+
+async def create_evaluation_async(evaluation_model: EvaluationModel, connection: Connect, raise_error_if_fail = True):
+    if (not connection.can_execute):
+        return _cant_execute(connection)
+
+    if (connection.show_message):
+        connection.huemul_logging.log_message_info(message = "creating Enola Evaluation")
+
+    enola_evaluation_result = await EnolaEvaluationBloc().enola_evaluation_create_async(evaluation_model=evaluation_model,connect_object=connection)
+    return _to_evaluation_response(enola_evaluation_result, connection, raise_error_if_fail)
+
+
+def _cant_execute(connection: Connect):
+    connection.huemul_logging.log_message_error(message = "can't execute: ")
+    return EvaluationResponseModel(
+        enola_id = "",
+        agent_deploy_id = "",
+        enola_eval_id = "",
+        successfull = False,
+        message = "can't execute:"
+    )
+
+
+def _to_evaluation_response(enola_evaluation_result, connection: Connect, raise_error_if_fail):
     #if error
     if (not enola_evaluation_result.isSuccessful):
         print(enola_evaluation_result)
-        connection._can_execute = False
+        # message kept local, calls running at the same time share the connection
         try:
-            connection._error_message = enola_evaluation_result.message if (len(enola_evaluation_result.errors) == 0) else enola_evaluation_result.errors[0]["errorTxt"]
+            error_message = enola_evaluation_result.message if (len(enola_evaluation_result.errors) == 0) else enola_evaluation_result.errors[0]["errorTxt"]
         except:
-            connection._error_message = enola_evaluation_result.message if (len(enola_evaluation_result.errors) == 0) else enola_evaluation_result.errors[0].errorTxt
+            error_message = enola_evaluation_result.message if (len(enola_evaluation_result.errors) == 0) else enola_evaluation_result.errors[0].errorTxt
+        connection._can_execute = False
+        connection._error_message = error_message
 
-        connection.huemul_logging.log_message_error(message = "error in enolaEvaluation: " + connection._error_message)
+        connection.huemul_logging.log_message_error(message = "error in enolaEvaluation: " + error_message)
 
         if (raise_error_if_fail):
-            connection.huemul_logging.log_message_error(message = "error " + connection._error_message)
-            raise NameError(connection._error_message)
+            connection.huemul_logging.log_message_error(message = "error " + error_message)
+            raise enola_evaluation_result.to_exception(error_message)
         else:
-            connection.huemul_logging.log_message_error(message = "error " + connection._error_message)
+            connection.huemul_logging.log_message_error(message = "error " + error_message)
             return EvaluationResponseModel(
                 enola_id = "",
                 agent_deploy_id = "",
                 enola_eval_id = "",
                 successfull = False,
-                message = "error " + connection._error_message
+                message = "error " + error_message
             )
 
     #if all ok, continue
@@ -51,4 +72,4 @@ def create_evaluation(evaluation_model: EvaluationModel, connection: Connect, ra
         enola_eval_id= enola_evaluation_result.data.enola_eval_id,
         enola_id = enola_evaluation_result.data.enola_id,
         agent_deploy_id = enola_evaluation_result.data.agent_deploy_id
-    )
\ No newline at end of file
+    )
@@ -1,3 +1,4 @@
+import time
 from enola.base.connect import Connect
 from enola.base.internal.evaluation.enola_evaluation_provider import EnolaEvaluationProvider
 from enola.enola_types import EvaluationModel
@@ -11,13 +12,32 @@ class EnolaEvaluationBloc():
     def enola_evaluation_create(self, evaluation_model: EvaluationModel, connect_object: Connect):
         (continue_in_loop) = True
         attempt = 0
+        started = time.monotonic()
         #result = HuemulResponseToBloc(connectObject=connectObject)
 
         while ((continue_in_loop)):
-            result = EnolaEvaluationProvider(connect_object=connect_object).evaluation_create(
+            result = EnolaEvaluationProvider(connect_object=connect_object, started=started).evaluation_create(
                     evaluation_model=evaluation_model
             )
             attempt +=1
-            (continue_in_loop) = result.analyze_errors(attempt)
+            (continue_in_loop) = result.analyze_errors(attempt, started)
+        
+        return result
+
+    #
+    # same as enola_evaluation_create, http calls run outside the event loop and waits use asyncio.sleep
+    #
+    async def enola_evaluation_create_async(self, evaluation_model: EvaluationModel, connect_object: Connect):
+        (continue_in_loop) = True
+        attempt = 0
+        started = time.monotonic()
+
+        while ((continue_in_loop)):
+            result = await connect_object.huemul_transport.run_async(
+                    EnolaEvaluationProvider(connect_object=connect_object, started=started).evaluation_create,
+                    evaluation_model=evaluation_model
+            )
+            attempt +=1
+            (continue_in_loop) = await result.analyze_errors_async(attempt, started)
         
         return result
\ No newline at end of file
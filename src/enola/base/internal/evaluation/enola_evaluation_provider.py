@@ -1,4 +1,4 @@
-import json
+from enola.base.common import huemul_json
 from enola.base.common.huemul_functions import HuemulFunctions
 from enola.base.common.huemul_connection import HuemulConnection
 from enola.base.common.huemul_response_error import HuemulResponseError
@@ -18,10 +18,10 @@ class EnolaEvaluationProvider(HuemulResponseToBloc):
             hf = HuemulFunctions()
             hf.delete_args(evaluation_model)
             #dataIn2 = jsonpickle.encode(agentModel)
-            data_in = json.dumps(evaluation_model.to_json())
+            data_in = huemul_json.dumps(evaluation_model.to_json())
 
             self.message = "starting postRequest"
-            huemul_response = HuemulConnection(connect_object=self.connect_object).post_request(
+            huemul_response = HuemulConnection(connect_object=self.connect_object, started=self.started).post_request(
                 route = "agent/eval/v1/",
                 data = data_in,
             )
@@ -1,41 +1,93 @@
 from enola.base.connect import Connect
 from enola.base.internal.executions.enola_execution_bloc import EnolaExecutionBloc
-from enola.enola_types import ExecutionModel, ExecutionQueryModel
+from enola.enola_types import ExecutionModel, ExecutionQueryModel, ExecutionResponseModel
 
 
-def get_execution(execution_query_model: ExecutionQueryModel, connection: Connect, raise_error_if_fail = True) -> ExecutionModel:
+# cache: EnolaExecutionCache with pages already read, None to always call the server
+def get_execution(execution_query_model: ExecutionQueryModel, connection: Connect, raise_error_if_fail = True, raw_data = False, cache = None) -> ExecutionModel:
     if (not connection.can_execute):
-        connection.huemul_logging.log_message_error(message = "can't execute: ")
-        return ExecutionModel(
-                data=[],
-                successfull=False,
-                message="Not Executed yet, can't execute:"
-            )
+        return _cant_execute(connection)
+
+    if (cache is not None):
+        cached_rows = cache.get_page(execution_query_model, connection)
+        if (cached_rows is not None):
+            return _from_cache(cached_rows, raw_data)
 
     if (connection.show_message):
         connection.huemul_logging.log_message_info(message = "Running Enola Execution")
 
-    enola_execution_result = EnolaExecutionBloc().enola_execution_get(execution_query_model=execution_query_model,connect_object=connection)
+    enola_execution_result = EnolaExecutionBloc().enola_execution_get(execution_query_model=execution_query_model,connect_object=connection,raw_data=raw_data or cache is not None)
+    _to_cache(enola_execution_result, execution_query_model, connection, raw_data, cache)
+    return _to_execution_model(enola_execution_result, connection, raise_error_if_fail)
+
+
+async def get_execution_async(execution_query_model: ExecutionQueryModel, connection: Connect, raise_error_if_fail = True, raw_data = False, cache = None) -> ExecutionModel:
+    if (not connection.can_execute):
+        return _cant_execute(connection)
+
+    if (cache is not None):
+        cached_rows = cache.get_page(execution_query_model, connection)
+        if (cached_rows is not None):
+            return _from_cache(cached_rows, raw_data)
+
+    if (connection.show_message):
+        connection.huemul_logging.log_message_info(message = "Running Enola Execution")
+
+    enola_execution_result = await EnolaExecutionBloc().enola_execution_get_async(execution_query_model=execution_query_model,connect_object=connection,raw_data=raw_data or cache is not None)
+    _to_cache(enola_execution_result, execution_query_model, connection, raw_data, cache)
+    return _to_execution_model(enola_execution_result, connection, raise_error_if_fail)
+
+
+def _from_cache(cached_rows, raw_data) -> ExecutionModel:
+    return ExecutionModel(
+            data=cached_rows if raw_data else list(map(lambda x: ExecutionResponseModel(**x), cached_rows)),
+            successfull=True,
+            message="from cache"
+        )
+
+
+# pages are cached as received from server, then converted to models if raw_data was not requested
+def _to_cache(enola_execution_result, execution_query_model: ExecutionQueryModel, connection: Connect, raw_data, cache):
+    if (cache is None or not enola_execution_result.isSuccessful):
+        return
+
+    cache.put_page(execution_query_model, connection, enola_execution_result.data)
+    if (not raw_data):
+        enola_execution_result.data = list(map(lambda x: ExecutionResponseModel(**x), enola_execution_result.data))
+
+
+def _cant_execute(connection: Connect) -> ExecutionModel:
+    connection.huemul_logging.log_message_error(message = "can't execute: ")
+    return ExecutionModel(
+            data=[],
+            successfull=False,
+            message="Not Executed yet, can't execute:"
+        )
+
+
+def _to_execution_model(enola_execution_result, connection: Connect, raise_error_if_fail) -> ExecutionModel:
     #if error
     if (not enola_execution_result.isSuccessful):
         print(enola_execution_result)
-        connection._can_execute = False
+        # message kept local, calls running at the same time share the connection
         try:
-            connection._error_message = enola_execution_result.message if (len(enola_execution_result.errors) == 0) else enola_execution_result.errors[0]["errorTxt"]
+            error_message = enola_execution_result.message if (len(enola_execution_result.errors) == 0) else enola_execution_result.errors[0]["errorTxt"]
         except:
-            connection._error_message = enola_execution_result.message if (len(enola_execution_result.errors) == 0) else enola_execution_result.errors[0].errorTxt
+            error_message = enola_execution_result.message if (len(enola_execution_result.errors) == 0) else enola_execution_result.errors[0].errorTxt
+        connection._can_execute = False
+        connection._error_message = error_message
 
-        connection.huemul_logging.log_message_error(message = "error in enolaExecution: " + connection._error_message)
+        connection.huemul_logging.log_message_error(message = "error in enolaExecution: " + error_message)
 
         if (raise_error_if_fail):
-            connection.huemul_logging.log_message_error(message = "error " + connection._error_message)
-            raise NameError(connection._error_message)
+            connection.huemul_logging.log_message_error(message = "error " + error_message)
+            raise enola_execution_result.to_exception(error_message)
         else:
-            connection.huemul_logging.log_message_error(message = "error " + connection._error_message)
+            connection.huemul_logging.log_message_error(message = "error " + error_message)
             return ExecutionModel(
                 data=[],
                 successfull=False,
-                message="error " + connection._error_message,
+                message="error " + error_message,
             )
 
     #if all ok, continue
@@ -45,4 +97,4 @@ def get_execution(execution_query_model: ExecutionQueryModel, connection: Connec
         data=enola_execution_result.data,
         successfull=enola_execution_result.isSuccessful,
         message=enola_execution_result.message,
-    )
\ No newline at end of file
+    )
@@ -1,3 +1,4 @@
+import time
 from enola.base.connect import Connect
 from enola.base.internal.executions.enola_execution_provider import EnolaExecutionProvider
 from enola.enola_types import ExecutionQueryModel
@@ -8,16 +9,37 @@ class EnolaExecutionBloc():
     # @param AgentModel AgentModel
     # @return HuemulResponseBloc[EnolaAgentResponseModel]
     #
-    def enola_execution_get(self, execution_query_model: ExecutionQueryModel, connect_object: Connect):
+    def enola_execution_get(self, execution_query_model: ExecutionQueryModel, connect_object: Connect, raw_data = False):
         (continue_in_loop) = True
         attempt = 0
+        started = time.monotonic()
         #result = HuemulResponseToBloc(connectObject=connectObject)
 
         while ((continue_in_loop)):
-            result = EnolaExecutionProvider(connect_object=connect_object).execution_get(
-                    execution_query_model=execution_query_model
+            result = EnolaExecutionProvider(connect_object=connect_object, started=started).execution_get(
+                    execution_query_model=execution_query_model,
+                    raw_data=raw_data
             )
             attempt +=1
-            (continue_in_loop) = result.analyze_errors(attempt)
+            (continue_in_loop) = result.analyze_errors(attempt, started)
+        
+        return result
+
+    #
+    # same as enola_execution_get, http calls run outside the event loop and waits use asyncio.sleep
+    #
+    async def enola_execution_get_async(self, execution_query_model: ExecutionQueryModel, connect_object: Connect, raw_data = False):
+        (continue_in_loop) = True
+        attempt = 0
+        started = time.monotonic()
+
+        while ((continue_in_loop)):
+            result = await connect_object.huemul_transport.run_async(
+                    EnolaExecutionProvider(connect_object=connect_object, started=started).execution_get,
+                    execution_query_model=execution_query_model,
+                    raw_data=raw_data
+            )
+            attempt +=1
+            (continue_in_loop) = await result.analyze_errors_async(attempt, started)
         
         return result
\ No newline at end of file
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from enola.base.common import huemul_json
+from enola.base.common.huemul_functions import HuemulFunctions
+from enola.base.connect import Connect
+from enola.enola_types import ExecutionQueryModel
+from enola.base.common.huemul_mapping import HuemulMapping
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    cache_key TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_last_access ON pages (last_access);
+"""
+
+
+class EnolaExecutionCache(HuemulMapping):
+    """
+    Pages of `GetExecutions` saved in a local SQLite file, so repeated queries don't call the server.
+
+    Pages are stored as received (raw json) and keyed by the normalized query (filters, include flags,
+    page and limit) plus the service url and organization. Pages expire after `ttl_seconds`, except pages of
+    date ranges ended more than `closed_after_seconds` ago, which don't change anymore and never expire.
+    When the file grows over `max_bytes` the least recently used pages are removed.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = 3600.0,
+        max_bytes: int = 512 * 1024 * 1024,
+        closed_after_seconds: float = 86400.0,
+    ):
+        """
+        Opens (or creates) the cache.
+
+        Args:
+            path (str): Path of the SQLite file.
+            ttl_seconds (float, optional): Seconds a page of an open date range is valid. Defaults to 1 hour.
+            max_bytes (int, optional): Max size of the stored pages. Defaults to 512 MB.
+            closed_after_seconds (float, optional): A date range is closed when `date_to` is older than this. Defaults to 1 day.
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.closed_after_seconds = closed_after_seconds
+        # export reads shards from several threads
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(_SCHEMA)
+
+    def get_page(self, execution_query_model: ExecutionQueryModel, connection: Connect) -> Optional[List[Dict[str, Any]]]:
+        """
+        Returns:
+            List[Dict[str, Any]]: Executions of the page as sent by the server, None if not cached or expired.
+        """
+        cache_key = self._cache_key(execution_query_model, connection)
+        now = time.time()
+        with self._lock:
+            row = self.db.execute(
+                "SELECT data, expires_at FROM pages WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            if row[1] is not None and row[1] <= now:
+                self.db.execute("DELETE FROM pages WHERE cache_key = ?", (cache_key,))
+                self.db.commit()
+                return None
+
+            self.db.execute("UPDATE pages SET last_access = ? WHERE cache_key = ?", (now, cache_key))
+            self.db.commit()
+
+        return huemul_json.loads(row[0])
+
+    def put_page(self, execution_query_model: ExecutionQueryModel, connection: Connect, rows: List[Dict[str, Any]]) -> None:
+        """
+        Stores executions of a page as sent by the server, and evicts old pages if the cache is full.
+        """
+        data = huemul_json.dumps(rows, default=str)
+        if len(data) > self.max_bytes:
+            return
+
+        now = time.time()
+        expires_at = None if self._is_closed(execution_query_model.date_to) else now + self.ttl_seconds
+        cache_key = self._cache_key(execution_query_model, connection)
+        with self._lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO pages (cache_key, data, size, expires_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (cache_key, data, len(data), expires_at, now),
+            )
+            self._evict(now)
+            self.db.commit()
+
+    def clear(self) -> None:
+        """
+        Removes all pages.
+        """
+        with self._lock:
+            self.db.execute("DELETE FROM pages")
+            self.db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self.db.close()
+
+    def _evict(self, now: float) -> None:
+        """
+        Removes expired pages, then least recently used pages until the cache fits in `max_bytes`.
+        """
+        self.db.execute("DELETE FROM pages WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        total_bytes = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total_bytes <= self.max_bytes:
+            return
+
+        to_delete = []
+        for cache_key, size in self.db.execute("SELECT cache_key, size FROM pages ORDER BY last_access"):
+            if total_bytes <= self.max_bytes:
+                break
+            to_delete.append((cache_key,))
+            total_bytes -= size
+
+        self.db.executemany("DELETE FROM pages WHERE cache_key = ?", to_delete)
+
+    def _is_closed(self, date_to: str) -> bool:
+        try:
+            end = HuemulFunctions().get_date_from_iso(date_to)
+        except ValueError:
+            return False
+
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=timezone.utc)
+
+        return (datetime.now(timezone.utc) - end).total_seconds() > self.closed_after_seconds
+
+    def _cache_key(self, execution_query_model: ExecutionQueryModel, connection: Connect) -> str:
+        fields = {key: _normalize(value) for key, value in execution_query_model.__dict__.items()}
+        fields["service_url"] = connection.huemul_common.get_service_url()
+        fields["org_id"] = connection.huemul_common.get_org_id()
+        # stdlib json with sorted keys, the key must not change with the json backend
+        return hashlib.sha256(json.dumps(fields, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _normalize(value: Any) -> Any:
+    """
+    Value of a query field that doesn't depend on the order of lists or the class of the filters.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple, set)):
+        items = [_normalize(item) for item in value]
+        return sorted(items, key=lambda item: json.dumps(item, sort_keys=True, default=str))
+    if isinstance(value, dict):
+        return {str(key): _normalize(item) for key, item in value.items()}
+    if hasattr(value, "__dict__"):
+        return _normalize(value.__dict__)
+
+    return value
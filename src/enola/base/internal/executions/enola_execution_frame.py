@@ -0,0 +1,145 @@
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from enola.base.common import huemul_json
+
+OUTPUT_FORMATS = ("models", "pandas", "arrow")
+
+# raw field -> column, same names as ExecutionResponseModel attributes
+_COLUMNS = [
+    ("agentExecId", "enola_id"),
+    ("agentExecIdRelated", "enola_id_related"),
+    ("agentDeployId", "agent_deploy_id"),
+    ("agentDeployName", "agent_deploy_name"),
+    ("agentId", "agent_id"),
+    ("agentName", "agent_name"),
+    ("agentExecName", "name"),
+    ("agentExecStartDT", "start_dt"),
+    ("agentExecEndDT", "end_dt"),
+    ("agentExecDurationMs", "duration_ms"),
+    ("agentExecNumTracking", "num_tracking"),
+    ("agentExecIsTest", "is_test"),
+    ("environmentId", "environment_id"),
+    ("agentExecCliAppId", "app_id"),
+    ("agentExecCliAppName", "app_name"),
+    ("agentExecCliUserId", "user_id"),
+    ("agentExecCliUserName", "user_name"),
+    ("agentExecCliSessionId", "session_id"),
+    ("agentExecCliSessionName", "session_name"),
+    ("agentExecCliChannel", "channel"),
+    ("agentExecCliChannelName", "channel_name"),
+    ("agentExecMessageInput", "message_input"),
+    ("agentExecMessageOutput", "message_output"),
+    ("agentExecTagJson", "tag_json"),
+    ("agentExecFileInfoJson", "file_info_json"),
+    ("agentExecDataJson", "data_json"),
+    ("agentExecErrorOrWarningJson", "error_or_warning_json"),
+    ("agentExecStepApiDataJson", "step_api_data_json"),
+    ("agentExecInfoJson", "info_json"),
+    ("agentExecEvals", "evals"),
+    ("agentExecCliIP", "ip"),
+    ("agentExecCliNumIter", "num_iter"),
+    ("agentExecCliCodeApi", "external_id"),
+    ("agentExecSuccessfull", "successfull"),
+]
+
+# json columns expanded by expand_json, column -> prefix of the new columns
+_EXPANDABLE_COLUMNS = [
+    ("tag_json", "tag_"),
+    ("data_json", "data_"),
+    ("evals", "eval_"),
+]
+
+_JSON_COLUMNS = [
+    "tag_json",
+    "file_info_json",
+    "data_json",
+    "error_or_warning_json",
+    "step_api_data_json",
+    "info_json",
+    "evals",
+]
+
+_DATE_COLUMNS = ["start_dt", "end_dt"]
+
+
+def executions_to_frame(rows: List[Dict[str, Any]], output: str, expand_json: bool = False) -> Any:
+    """
+    Converts raw executions (`data` of the agentExec response) to a table.
+
+    Args:
+        rows (List[Dict[str, Any]]): Executions as returned by the server.
+        output (str): "pandas" for a DataFrame, "arrow" for a pyarrow Table.
+        expand_json (bool, optional): Replace tag_json, data_json and evals with one typed column per key
+            (prefixed with tag_, data_ and eval_). Defaults to False.
+
+    Returns:
+        pandas.DataFrame or pyarrow.Table: One row per execution, columns named as `ExecutionResponseModel` attributes.
+    """
+    if output not in ("pandas", "arrow"):
+        raise ValueError(f"output must be one of {OUTPUT_FORMATS}.")
+
+    # column-wise, no intermediate object per row
+    frame = pd.DataFrame({column: [row.get(key) for row in rows] for key, column in _COLUMNS})
+    for column in _DATE_COLUMNS:
+        frame[column] = pd.to_datetime(frame[column], errors="coerce", utc=True, format="ISO8601")
+
+    if expand_json:
+        frame = _expand_json_columns(frame)
+
+    if output == "pandas":
+        return frame
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise Exception("pyarrow is required for arrow output, install it with: pip install pyarrow")
+
+    # json values have a different shape in each row, arrow needs them as text
+    for column in _JSON_COLUMNS:
+        if column in frame.columns:
+            frame[column] = [_to_json_text(value) for value in frame[column]]
+
+    return pa.Table.from_pandas(frame, preserve_index=False)
+
+
+def _expand_json_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adds one column per key of the json objects in the expandable columns.
+
+    The original column is dropped when all its values were objects (or empty).
+    """
+    expanded_frames = [frame]
+    for column, prefix in _EXPANDABLE_COLUMNS:
+        values = [_from_json_text(value) for value in frame[column]]
+        objects = [value if isinstance(value, dict) else {} for value in values]
+        if not any(objects):
+            continue
+
+        expanded = pd.json_normalize(objects).add_prefix(prefix).infer_objects()
+        expanded.index = frame.index
+        expanded_frames.append(expanded)
+
+        if all(value is None or isinstance(value, dict) for value in values):
+            expanded_frames[0] = expanded_frames[0].drop(columns=[column])
+
+    return pd.concat(expanded_frames, axis=1) if len(expanded_frames) > 1 else frame
+
+
+def _from_json_text(value: Any) -> Any:
+    # some fields arrive as json text instead of objects
+    if isinstance(value, str) and value[:1] in ("{", "["):
+        try:
+            return huemul_json.loads(value)
+        except ValueError:
+            return value
+
+    return value
+
+
+def _to_json_text(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return huemul_json.dumps(value, default=str).decode("utf-8")
+
+    return value
@@ -11,9 +11,10 @@ class EnolaExecutionProvider(HuemulResponseToBloc):
     #
     # execution_get
     # @param ExecutionModel executionModel
+    # @param raw_data True to keep executions as dicts from server (used to build DataFrames column-wise)
     # @return AgentExecuteResponseModel[AgentExecuteResponseModel]
     #
-    def execution_get(self, execution_query_model: ExecutionQueryModel):
+    def execution_get(self, execution_query_model: ExecutionQueryModel, raw_data = False):
         #self = AgentExecuteResponseModel()
         try:
             #hf = HuemulFunctions()
@@ -24,10 +25,10 @@ class EnolaExecutionProvider(HuemulResponseToBloc):
                     {"name": "limit", "value": execution_query_model.limit},
                     {"name": "agentExecStartDT", "value": execution_query_model.date_from},
                     {"name": "agentExecStartDTTo", "value": execution_query_model.date_to},
-                    {"name": "includeTags", "value": execution_query_model.includeTags},
-                    {"name": "includeData", "value": execution_query_model.includeData},
-                    {"name": "includeErrors", "value": execution_query_model.includeErrors},
-                    {"name": "includeEvals", "value": execution_query_model.includeEvals},
+                    {"name": "includeTags", "value": execution_query_model.include_tags},
+                    {"name": "includeData", "value": execution_query_model.include_data},
+                    {"name": "includeErrors", "value": execution_query_model.include_errors},
+                    {"name": "includeEvals", "value": execution_query_model.include_evals},
                     {"name": "agentExecType", "value": "START"}
                 ]
 
@@ -52,8 +53,8 @@ class EnolaExecutionProvider(HuemulResponseToBloc):
             if (execution_query_model.environment_id != None):
                 queryParams.append({"name": "environmentId", "value": execution_query_model.environment_id})
 
-            if (execution_query_model.isTestPlan != None):
-                queryParams.append({"name": "agentExecIsTest", "value": execution_query_model.isTestPlan})
+            if (execution_query_model.is_test_plan != None):
+                queryParams.append({"name": "agentExecIsTest", "value": execution_query_model.is_test_plan})
 
             if (execution_query_model.finished != None):
                 queryParams.append({"name": "agentExecSuccessfull", "value": execution_query_model.finished})
@@ -85,7 +86,7 @@ class EnolaExecutionProvider(HuemulResponseToBloc):
                 queryParams.append({"name": "exclude", "value": ";".join(excludeFilter)})
 
             self.message = "starting postRequest"
-            huemul_response = HuemulConnection(connect_object=self.connect_object).get_request(
+            huemul_response = HuemulConnection(connect_object=self.connect_object, started=self.started).get_request(
                 route = "agentExec/v1/",
                 queryParams=queryParams
             )
@@ -94,7 +95,10 @@ class EnolaExecutionProvider(HuemulResponseToBloc):
             self.message = "starting fromResponseProvider"
             self.from_response_provider(huemul_response_provider = huemul_response)
             if (self.isSuccessful):
-                self.data = [] if len(huemul_response.data_raw) == 0 else list(map(lambda x: ExecutionResponseModel(**x) ,huemul_response.data_raw))
+                if (raw_data):
+                    self.data = huemul_response.data_raw or []
+                else:
+                    self.data = [] if len(huemul_response.data_raw) == 0 else list(map(lambda x: ExecutionResponseModel(**x) ,huemul_response.data_raw))
         except Exception as e:
             if hasattr(e, 'doc') and e.doc is not None:
                 self.errors.append(
@@ -0,0 +1,103 @@
+import sqlite3
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from enola.base.common import huemul_json
+from enola.base.common.huemul_mapping import HuemulMapping
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS executions (
+    enola_id TEXT PRIMARY KEY,
+    start_dt TEXT,
+    agent_deploy_id TEXT,
+    execution TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS executions_start_dt ON executions (start_dt);
+CREATE TABLE IF NOT EXISTS sync_state (
+    sync_name TEXT PRIMARY KEY,
+    last_start_dt TEXT,
+    last_ids TEXT NOT NULL
+);
+"""
+
+
+class EnolaExecutionSyncStore(HuemulMapping):
+    """
+    Local SQLite file with the executions downloaded by `GetExecutions.sync` and the watermark of each sync.
+
+    The watermark is the latest `agentExecStartDT` stored plus the ids of the executions with that start date,
+    so the next run asks the server only from that date and skips the executions already stored.
+    Rows and watermark are committed in the same transaction, an interrupted run leaves the previous state.
+
+    Executions are stored as the json sent by the server (`execution` column), read them with
+    `pandas.read_sql("select * from executions", sqlite3.connect(path))`.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens (or creates) the store.
+
+        Args:
+            path (str): Path of the SQLite file.
+        """
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(_SCHEMA)
+
+    def load_watermark(self, sync_name: str) -> Tuple[Optional[str], Set[str]]:
+        """
+        Returns:
+            Tuple: latest start date stored by the sync (None on the first run) and ids of executions with that date.
+        """
+        row = self.db.execute(
+            "SELECT last_start_dt, last_ids FROM sync_state WHERE sync_name = ?", (sync_name,)
+        ).fetchone()
+        if row is None:
+            return (None, set())
+
+        return (row[0], set(huemul_json.loads(row[1])))
+
+    def save_watermark(self, sync_name: str, last_start_dt: Optional[str], last_ids: Set[str]) -> None:
+        """
+        Writes the watermark, visible after `commit`.
+        """
+        self.db.execute(
+            "INSERT OR REPLACE INTO sync_state (sync_name, last_start_dt, last_ids) VALUES (?, ?, ?)",
+            (sync_name, last_start_dt, huemul_json.dumps(sorted(last_ids)).decode("utf-8")),
+        )
+
+    def append(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Adds executions as returned by the server, executions already stored are ignored.
+
+        Returns:
+            int: Number of executions added.
+        """
+        cursor = self.db.executemany(
+            "INSERT OR IGNORE INTO executions (enola_id, start_dt, agent_deploy_id, execution) VALUES (?, ?, ?, ?)",
+            (
+                (
+                    row.get("agentExecId"),
+                    row.get("agentExecStartDT"),
+                    row.get("agentDeployId"),
+                    huemul_json.dumps(row, default=str).decode("utf-8"),
+                )
+                for row in rows
+            ),
+        )
+        return max(cursor.rowcount, 0)
+
+    def count(self) -> int:
+        """
+        Returns:
+            int: Number of executions stored.
+        """
+        return self.db.execute("SELECT COUNT(*) FROM executions").fetchone()[0]
+
+    def commit(self) -> None:
+        self.db.commit()
+
+    def rollback(self) -> None:
+        self.db.rollback()
+
+    def close(self) -> None:
+        self.db.close()
@@ -5,19 +5,35 @@ from enola.enola_types import TrackingModel, TrackingResponseModel
 
 def create_tracking(tracking_model: TrackingModel, connection: Connect, raise_error_if_fail = True):
     if (not connection.can_execute):
-        connection.huemul_logging.log_message_error(message = "cant execute: ")
-        return TrackingResponseModel(
-            enola_id="",
-            agent_deploy_id="",
-            url_evaluation_def_get="",
-            url_evaluation_post="",
-            successfull = False,
-            message = "can't execute:"
-        )
+        return _cant_execute(connection)
 
     #connection.huemul_logging.log_message_info(message = "creating Enola Tracking")
 
     enola_tracking_result = EnolaTrackingBloc().enola_tracking_create(tracking_model=tracking_model,connect_object=connection)
+    return _to_tracking_response(enola_tracking_result, connection, raise_error_if_fail)
+
+
+async def create_tracking_async(tracking_model: TrackingModel, connection: Connect, raise_error_if_fail = True):
+    if (not connection.can_execute):
+        return _cant_execute(connection)
+
+    enola_tracking_result = await EnolaTrackingBloc().enola_tracking_create_async(tracking_model=tracking_model,connect_object=connection)
+    return _to_tracking_response(enola_tracking_result, connection, raise_error_if_fail)
+
+
+def _cant_execute(connection: Connect):
+    connection.huemul_logging.log_message_error(message = "cant execute: ")
+    return TrackingResponseModel(
+        enola_id="",
+        agent_deploy_id="",
+        url_evaluation_def_get="",
+        url_evaluation_post="",
+        successfull = False,
+        message = "can't execute:"
+    )
+
+
+def _to_tracking_response(enola_tracking_result, connection: Connect, raise_error_if_fail):
     #if error
     if (not enola_tracking_result.isSuccessful):
         print(enola_tracking_result)
@@ -31,7 +47,7 @@ def create_tracking(tracking_model: TrackingModel, connection: Connect, raise_er
 
         if (raise_error_if_fail):
             connection.huemul_logging.log_message_error(message = "error " + connection._error_message)
-            raise NameError(connection._error_message)
+            raise enola_tracking_result.to_exception(connection._error_message)
         else:
             connection.huemul_logging.log_message_error(message = "error " + connection._error_message)
             return TrackingResponseModel(
@@ -1,3 +1,4 @@
+import time
 from enola.base.connect import Connect
 from enola.base.internal.tracking.enola_tracking_provider import EnolaTrackingProvider
 from enola.enola_types import TrackingModel
@@ -12,13 +13,32 @@ class EnolaTrackingBloc():
     def enola_tracking_create(self, tracking_model: TrackingModel, connect_object: Connect):
         (continue_in_loop) = True
         attempt = 0
+        started = time.monotonic()
         #result = HuemulResponseToBloc(connectObject=connectObject)
 
         while ((continue_in_loop)):
-            result = EnolaTrackingProvider(connect_object=connect_object).tracking_create(
+            result = EnolaTrackingProvider(connect_object=connect_object, started=started).tracking_create(
                     tracking_model=tracking_model
             )
             attempt +=1
-            (continue_in_loop) = result.analyze_errors(attempt)
+            (continue_in_loop) = result.analyze_errors(attempt, started)
+        
+        return result
+
+    #
+    # same as enola_tracking_create, http calls run outside the event loop and waits use asyncio.sleep
+    #
+    async def enola_tracking_create_async(self, tracking_model: TrackingModel, connect_object: Connect):
+        (continue_in_loop) = True
+        attempt = 0
+        started = time.monotonic()
+
+        while ((continue_in_loop)):
+            result = await connect_object.huemul_transport.run_async(
+                    EnolaTrackingProvider(connect_object=connect_object, started=started).tracking_create,
+                    tracking_model=tracking_model
+            )
+            attempt +=1
+            (continue_in_loop) = await result.analyze_errors_async(attempt, started)
         
         return result
\ No newline at end of file
@@ -1,4 +1,4 @@
-import json
+from enola.base.common import huemul_json
 from enola.base.common.huemul_functions import HuemulFunctions
 from enola.base.common.huemul_connection import HuemulConnection
 from enola.base.common.huemul_response_error import HuemulResponseError
@@ -18,12 +18,12 @@ class EnolaTrackingProvider(HuemulResponseToBloc):
             hf = HuemulFunctions()
             hf.delete_args(tracking_model)
             #dataIn2 = jsonpickle.encode(agentModel)
-            data_in = json.dumps(tracking_model.to_json(), default=lambda o: o.__dict__)
+            data_in = huemul_json.dumps(tracking_model.to_json(), default=lambda o: o.__dict__)
             #dataIn =  agentModel.to_json()
 
             #dataIn = json.dumps(agentModel, default=lambda obj: obj.__dict__)
             self.message = "starting postRequest"
-            huemul_response = HuemulConnection(connect_object=self.connect_object).post_request(
+            huemul_response = HuemulConnection(connect_object=self.connect_object, started=self.started).post_request(
                 route = "agent/execute/v1/",
                 data = data_in,
             )
@@ -0,0 +1,112 @@
+import atexit
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+from enola.base.connect import Connect
+from enola.base.internal.tracking.enola_tracking import create_tracking
+from enola.enola_types import TrackingModel
+
+
+class EnolaTrackingSender:
+    """
+    Background sender for trackings, used when `Tracking` runs with `background_send=True`.
+
+    Trackings are put in a bounded in-process queue and a worker thread posts them to the
+    Enola server, so the caller does not wait for serialization, network or retries.
+    Pending trackings are flushed when the interpreter exits.
+    """
+
+    def __init__(self, max_queue_size: int = 1000):
+        """
+        Initializes a new `EnolaTrackingSender`.
+
+        Args:
+            max_queue_size (int, optional): Max trackings waiting to be sent, `submit` blocks when the queue is full.
+        """
+        self.max_queue_size = max_queue_size
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        atexit.register(self.flush)
+
+    def submit(
+        self,
+        tracking_model: TrackingModel,
+        connection: Connect,
+        on_result: Optional[Callable[[Any], Any]] = None,
+    ) -> Future:
+        """
+        Enqueues a tracking to be sent in background.
+
+        Args:
+            tracking_model (TrackingModel): Tracking to send.
+            connection (Connect): Connection used to send the tracking.
+            on_result (Callable, optional): Called in the worker with the `TrackingResponseModel`, its return value is the future result.
+
+        Returns:
+            Future: Resolves with the result of `on_result` (or the `TrackingResponseModel`), or with the error raised sending it.
+        """
+        future: Future = Future()
+        self._start_worker()
+        self._queue.put((tracking_model, connection, on_result, future))
+        return future
+
+    def flush(self) -> None:
+        """
+        Waits until every enqueued tracking has been sent.
+        """
+        if self._worker is not None and self._worker.is_alive():
+            self._queue.join()
+
+    def _start_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="enola-tracking-sender", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            tracking_model, connection, on_result, future = self._queue.get()
+            try:
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                try:
+                    enola_result = create_tracking(
+                        tracking_model=tracking_model,
+                        connection=connection,
+                        raise_error_if_fail=True,
+                    )
+                    future.set_result(
+                        enola_result if on_result is None else on_result(enola_result)
+                    )
+                except Exception as e:
+                    connection.huemul_logging.log_message_error(
+                        message="error sending tracking in background: " + str(e)
+                    )
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+
+_tracking_sender: Optional[EnolaTrackingSender] = None
+_tracking_sender_lock = threading.Lock()
+
+
+def get_tracking_sender() -> EnolaTrackingSender:
+    """
+    Returns the process-wide background sender, creating it on first use.
+    """
+    global _tracking_sender
+    if _tracking_sender is None:
+        with _tracking_sender_lock:
+            if _tracking_sender is None:
+                _tracking_sender = EnolaTrackingSender()
+
+    return _tracking_sender
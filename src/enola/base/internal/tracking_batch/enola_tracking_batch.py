@@ -1,45 +1,65 @@
 from enola.base.connect import Connect
 from enola.base.internal.tracking_batch.enola_tracking_batch_bloc import EnolaTrackingBatchBloc
 from enola.enola_types import TrackingBatchDetailResponseModel, TrackingBatchHeadModel, TrackingBatchHeadResponseModel, TrackingModel, TrackingResponseModel
-from typing import List
+from typing import List, Optional
 
 
 def create_tracking_batch_head(tracking_batch_model: TrackingBatchHeadModel, connection: Connect, raise_error_if_fail = True):
     if (not connection.can_execute):
-        connection.huemul_logging.log_message_error(message = "cant execute: ")
-        return TrackingBatchHeadResponseModel(
-            batch_id="",
-            agent_deploy_id="",
-            successfull = False,
-            message = "can't execute:"
-        )
+        return _cant_execute_head(connection)
 
     #connection.huemul_logging.log_message_info(message = "creating Enola Tracking Batch Head")
     enola_tracking_head_result = EnolaTrackingBatchBloc().enola_tracking_batch_head_create(
         tracking_batch_head_model=tracking_batch_model, 
         connect_object=connection
         )
-    
+    return _to_tracking_batch_head_response(enola_tracking_head_result, connection, raise_error_if_fail)
+
+
+async def create_tracking_batch_head_async(tracking_batch_model: TrackingBatchHeadModel, connection: Connect, raise_error_if_fail = True):
+    if (not connection.can_execute):
+        return _cant_execute_head(connection)
+
+    enola_tracking_head_result = await EnolaTrackingBatchBloc().enola_tracking_batch_head_create_async(
+        tracking_batch_head_model=tracking_batch_model, 
+        connect_object=connection
+        )
+    return _to_tracking_batch_head_response(enola_tracking_head_result, connection, raise_error_if_fail)
+
+
+def _cant_execute_head(connection: Connect):
+    connection.huemul_logging.log_message_error(message = "cant execute: ")
+    return TrackingBatchHeadResponseModel(
+        batch_id="",
+        agent_deploy_id="",
+        successfull = False,
+        message = "can't execute:"
+    )
+
+
+def _to_tracking_batch_head_response(enola_tracking_head_result, connection: Connect, raise_error_if_fail):
     if (not enola_tracking_head_result.isSuccessful):
         print(enola_tracking_head_result)
-        connection._can_execute = False
+        # message kept local, calls running at the same time share the connection
         try:
-            connection._error_message = enola_tracking_head_result.message if (len(enola_tracking_head_result.errors) == 0) else enola_tracking_head_result.errors[0]["errorTxt"]
+            error_message = enola_tracking_head_result.message if (len(enola_tracking_head_result.errors) == 0) else enola_tracking_head_result.errors[0]["errorTxt"]
         except:
-            connection._error_message = enola_tracking_head_result.message if (len(enola_tracking_head_result.errors) == 0) else enola_tracking_head_result.errors[0].errorTxt
+            error_message = enola_tracking_head_result.message if (len(enola_tracking_head_result.errors) == 0) else enola_tracking_head_result.errors[0].errorTxt
+        connection._can_execute = False
+        connection._error_message = error_message
 
-        connection.huemul_logging.log_message_error(message = "error in enolaTrackingBatchHead: " + connection._error_message)
+        connection.huemul_logging.log_message_error(message = "error in enolaTrackingBatchHead: " + error_message)
 
         if (raise_error_if_fail):
-            connection.huemul_logging.log_message_error(message = "error " + connection._error_message)
-            raise NameError(connection._error_message)
+            connection.huemul_logging.log_message_error(message = "error " + error_message)
+            raise enola_tracking_head_result.to_exception(error_message)
         else:
-            connection.huemul_logging.log_message_error(message = "error " + connection._error_message)
+            connection.huemul_logging.log_message_error(message = "error " + error_message)
             return TrackingBatchHeadResponseModel(
                 batch_id="",
                 agent_deploy_id="",
                 successfull = False,
-                message = "error " + connection._error_message
+                message = "error " + error_message
             )
 
     #if all ok, continue
@@ -64,40 +84,62 @@ def create_tracking_batch_head(tracking_batch_model: TrackingBatchHeadModel, con
     )
 
 
-def create_tracking(tracking_list_model: List[TrackingModel], connection: Connect, raise_error_if_fail = True) -> TrackingBatchDetailResponseModel:
+def create_tracking(tracking_list_model: List[TrackingModel], connection: Connect, raise_error_if_fail = True, data_in: Optional[bytes] = None) -> TrackingBatchDetailResponseModel:
     if (not connection.can_execute):
-        connection.huemul_logging.log_message_error(message = "cant execute: ")
-        return TrackingBatchDetailResponseModel(
-            tracking_list=tracking_list_model,
-            agent_deploy_id="",
-            successfull = False,
-            message = "can't execute:"
-        )
+        return _cant_execute_tracking(tracking_list_model, connection)
 
     #connection.huemul_logging.log_message_info(message = "creating Enola Tracking")
-    enola_tracking_result = EnolaTrackingBatchBloc().enola_tracking_batch_create(tracking_list_model=tracking_list_model,connect_object=connection)
+    enola_tracking_result = EnolaTrackingBatchBloc().enola_tracking_batch_create(tracking_list_model=tracking_list_model,connect_object=connection,data_in=data_in)
+    return _to_tracking_batch_detail_response(enola_tracking_result, connection, raise_error_if_fail)
+
+
+async def create_tracking_async(tracking_list_model: List[TrackingModel], connection: Connect, raise_error_if_fail = True, data_in: Optional[bytes] = None) -> TrackingBatchDetailResponseModel:
+    if (not connection.can_execute):
+        return _cant_execute_tracking(tracking_list_model, connection)
+
+    enola_tracking_result = await EnolaTrackingBatchBloc().enola_tracking_batch_create_async(tracking_list_model=tracking_list_model,connect_object=connection,data_in=data_in)
+    return _to_tracking_batch_detail_response(enola_tracking_result, connection, raise_error_if_fail)
+
+
+def _cant_execute_tracking(tracking_list_model: List[TrackingModel], connection: Connect) -> TrackingBatchDetailResponseModel:
+    connection.huemul_logging.log_message_error(message = "cant execute: ")
+    return TrackingBatchDetailResponseModel(
+        tracking_list=tracking_list_model,
+        agent_deploy_id="",
+        successfull = False,
+        message = "can't execute:"
+    )
+
+
+def _to_tracking_batch_detail_response(enola_tracking_result, connection: Connect, raise_error_if_fail) -> TrackingBatchDetailResponseModel:
     #if error
     if (not enola_tracking_result.isSuccessful):
         print(enola_tracking_result)
-        connection._can_execute = False
+        # message kept local, chunks uploaded at the same time share the connection
         try:
-            connection._error_message = enola_tracking_result.message if (len(enola_tracking_result.errors) == 0) else enola_tracking_result.errors[0]["errorTxt"]
+            error_message = enola_tracking_result.message if (len(enola_tracking_result.errors) == 0) else enola_tracking_result.errors[0]["errorTxt"]
         except:
-            connection._error_message = enola_tracking_result.message if (len(enola_tracking_result.errors) == 0) else enola_tracking_result.errors[0].errorTxt
+            error_message = enola_tracking_result.message if (len(enola_tracking_result.errors) == 0) else enola_tracking_result.errors[0].errorTxt
+        connection._can_execute = False
+        connection._error_message = error_message
 
-        connection.huemul_logging.log_message_error(message = "error in enolaTracking: " + connection._error_message)
+        connection.huemul_logging.log_message_error(message = "error in enolaTracking: " + error_message)
 
         if (raise_error_if_fail):
-            connection.huemul_logging.log_message_error(message = "error " + connection._error_message)
-            raise NameError(connection._error_message)
+            connection.huemul_logging.log_message_error(message = "error " + error_message)
+            raise enola_tracking_result.to_exception(error_message)
         else:
-            connection.huemul_logging.log_message_error(message = "error " + connection._error_message)
+            connection.huemul_logging.log_message_error(message = "error " + error_message)
             return TrackingBatchDetailResponseModel(
                 tracking_list=[],
                 agent_deploy_id="",
                 successfull = False,
-                message = "error " + connection._error_message
+                message = "error " + error_message
             )
 
     #if all ok, continue
-    return enola_tracking_result.data[0]
\ No newline at end of file
+    tracking_batch_detail = enola_tracking_result.data[0]
+    #server and client side latency of the call
+    tracking_batch_detail.elapsed_time_ms = enola_tracking_result.elapsedTimeMS
+    tracking_batch_detail.round_trip_ms = enola_tracking_result.get("roundTripMS", -1)
+    return tracking_batch_detail
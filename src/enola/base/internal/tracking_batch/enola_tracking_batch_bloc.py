@@ -1,7 +1,8 @@
+import time
 from enola.base.connect import Connect
 from enola.base.internal.tracking_batch.enola_tracking_batch_provider import EnolaTrackingBatchProvider
 from enola.enola_types import TrackingModel, TrackingBatchHeadModel
-from typing import List
+from typing import List, Optional
 
 class EnolaTrackingBatchBloc():
     #
@@ -9,20 +10,41 @@ class EnolaTrackingBatchBloc():
     # @param AgentModel AgentModel
     # @return HuemulResponseBloc[EnolaAgentResponseModel]
     #
-    def enola_tracking_batch_create(self, tracking_list_model: List[TrackingModel], connect_object: Connect):
+    def enola_tracking_batch_create(self, tracking_list_model: List[TrackingModel], connect_object: Connect, data_in: Optional[bytes] = None):
         """
         Start tracking Batch Execution
         """
         (continue_in_loop) = True
         attempt = 0
+        started = time.monotonic()
         #result = HuemulResponseToBloc(connectObject=connectObject)
 
         while ((continue_in_loop)):
-            result = EnolaTrackingBatchProvider(connect_object=connect_object).tracking_batch_create(
-                    tracking_list_model=tracking_list_model
+            result = EnolaTrackingBatchProvider(connect_object=connect_object, started=started).tracking_batch_create(
+                    tracking_list_model=tracking_list_model,
+                    data_in=data_in
             )
             attempt +=1
-            (continue_in_loop) = result.analyze_errors(attempt)
+            (continue_in_loop) = result.analyze_errors(attempt, started)
+        
+        return result
+
+    async def enola_tracking_batch_create_async(self, tracking_list_model: List[TrackingModel], connect_object: Connect, data_in: Optional[bytes] = None):
+        """
+        Start tracking Batch Execution, without blocking the event loop
+        """
+        (continue_in_loop) = True
+        attempt = 0
+        started = time.monotonic()
+
+        while ((continue_in_loop)):
+            result = await connect_object.huemul_transport.run_async(
+                    EnolaTrackingBatchProvider(connect_object=connect_object, started=started).tracking_batch_create,
+                    tracking_list_model=tracking_list_model,
+                    data_in=data_in
+            )
+            attempt +=1
+            (continue_in_loop) = await result.analyze_errors_async(attempt, started)
         
         return result
     
@@ -33,13 +55,32 @@ class EnolaTrackingBatchBloc():
         """
         (continue_in_loop) = True
         attempt = 0
+        started = time.monotonic()
         #result = HuemulResponseToBloc(connectObject=connectObject)
 
         while ((continue_in_loop)):
-            result = EnolaTrackingBatchProvider(connect_object=connect_object).tracking_batch_head_create(
+            result = EnolaTrackingBatchProvider(connect_object=connect_object, started=started).tracking_batch_head_create(
+                    tracking_batch_head_model=tracking_batch_head_model
+            )
+            attempt +=1
+            (continue_in_loop) = result.analyze_errors(attempt, started)
+        
+        return result
+
+    async def enola_tracking_batch_head_create_async(self, tracking_batch_head_model: TrackingBatchHeadModel, connect_object: Connect):
+        """
+        Start tracking Batch Head Execution, without blocking the event loop
+        """
+        (continue_in_loop) = True
+        attempt = 0
+        started = time.monotonic()
+
+        while ((continue_in_loop)):
+            result = await connect_object.huemul_transport.run_async(
+                    EnolaTrackingBatchProvider(connect_object=connect_object, started=started).tracking_batch_head_create,
                     tracking_batch_head_model=tracking_batch_head_model
             )
             attempt +=1
-            (continue_in_loop) = result.analyze_errors(attempt)
+            (continue_in_loop) = await result.analyze_errors_async(attempt, started)
         
         return result
\ No newline at end of file
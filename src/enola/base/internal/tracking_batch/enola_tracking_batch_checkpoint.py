@@ -0,0 +1,121 @@
+import json
+import os
+from typing import List, Tuple
+from enola.base.common.huemul_mapping import HuemulMapping
+
+
+class EnolaTrackingBatchCheckpoint(HuemulMapping):
+    """
+    Progress of a `TrackingBatch` upload saved in a JSON file, used to resume it after a failure.
+
+    It keeps the `batch_id` and the row ranges `[start, end)` already acknowledged by the server.
+    The file is rewritten atomically after each acknowledged chunk, so a crash never leaves it half written.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes a new `EnolaTrackingBatchCheckpoint`.
+
+        Args:
+            path (str): Path of the checkpoint file.
+        """
+        self.path = path
+        self.batch_id = ""
+        self.name = ""
+        self.total_rows = 0
+        self.sent: List[List[int]] = []
+
+    @property
+    def sent_rows(self) -> int:
+        """
+        Number of rows acknowledged by the server.
+        """
+        return sum(end - start for start, end in self.sent)
+
+    def load(self) -> bool:
+        """
+        Reads the checkpoint file.
+
+        Returns:
+            bool: False if the file does not exist.
+        """
+        if not os.path.exists(self.path):
+            return False
+
+        with open(self.path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+
+        self.batch_id = data.get("batch_id", "")
+        self.name = data.get("name", "")
+        self.total_rows = data.get("total_rows", 0)
+        self.sent = [[start, end] for start, end in data.get("sent", [])]
+        return True
+
+    def start(self, batch_id: str, name: str, total_rows: int) -> None:
+        """
+        Records the batch head, keeping the rows already acknowledged for the same batch.
+        """
+        if batch_id != self.batch_id:
+            self.sent = []
+
+        self.batch_id = batch_id
+        self.name = name
+        self.total_rows = total_rows
+        self.save()
+
+    def mark_sent(self, start: int, end: int) -> None:
+        """
+        Records rows `[start, end)` as acknowledged and saves the file.
+        """
+        ranges = sorted(self.sent + [[start, end]])
+        merged: List[List[int]] = []
+        for range_start, range_end in ranges:
+            if merged and range_start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], range_end)
+            else:
+                merged.append([range_start, range_end])
+
+        self.sent = merged
+        self.save()
+
+    def pending_ranges(self, total_rows: int) -> List[Tuple[int, int]]:
+        """
+        Returns the row ranges `[start, end)` not acknowledged yet.
+        """
+        pending: List[Tuple[int, int]] = []
+        position = 0
+        for start, end in self.sent:
+            if start > position:
+                pending.append((position, min(start, total_rows)))
+            position = max(position, end)
+
+        if position < total_rows:
+            pending.append((position, total_rows))
+
+        return pending
+
+    def save(self) -> None:
+        """
+        Writes the checkpoint file, replacing the previous one in a single step.
+        """
+        data = {
+            "batch_id": self.batch_id,
+            "name": self.name,
+            "total_rows": self.total_rows,
+            "sent": self.sent,
+        }
+
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, self.path)
+
+    def remove(self) -> None:
+        """
+        Deletes the checkpoint file, called when every row was sent.
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
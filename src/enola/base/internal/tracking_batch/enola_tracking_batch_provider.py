@@ -1,33 +1,40 @@
-import json
+from enola.base.common import huemul_json
+import time
 from enola.base.common.huemul_functions import HuemulFunctions
 from enola.base.common.huemul_connection import HuemulConnection
 from enola.base.common.huemul_response_error import HuemulResponseError
 from enola.base.common.huemul_response_to_bloc import HuemulResponseToBloc
 from enola.enola_types import TrackingBatchDetailResponseModel, TrackingBatchHeadModel, TrackingBatchHeadResponseModel, TrackingModel, TrackingResponseModel
-from typing import List
+from typing import List, Optional
 
 class EnolaTrackingBatchProvider(HuemulResponseToBloc):
     
     #
     # tracking_create
     # @param TrackingModel trackingModel
+    # @param data_in body already serialized by TrackingBatch, None to serialize tracking_list_model
     # @return AgentExecuteResponseModel[AgentExecuteResponseModel]
     #
-    def tracking_batch_create(self, tracking_list_model: List[TrackingModel]):
+    def tracking_batch_create(self, tracking_list_model: List[TrackingModel], data_in: Optional[bytes] = None):
         #self = AgentExecuteResponseModel()
         try:
             hf = HuemulFunctions()
             hf.delete_args(tracking_list_model)
             
             #data_in = json.dumps(tracking_model.to_json(), default=lambda o: o.__dict__)
-            data_in =  json.dumps([model.to_json() for model in tracking_list_model])
+            #rows may come already converted to json dicts (columnar conversion in TrackingBatch)
+            if (data_in is None):
+                data_in =  huemul_json.dumps([model if isinstance(model, dict) else model.to_json() for model in tracking_list_model])
 
             #dataIn = json.dumps(agentModel, default=lambda obj: obj.__dict__)
             self.message = "starting postRequest"
-            huemul_response = HuemulConnection(connect_object=self.connect_object).post_request(
+            started = time.perf_counter()
+            huemul_response = HuemulConnection(connect_object=self.connect_object, started=self.started).post_request(
                 route = "eventsToProcess/executeBatch/v1/",
                 data = data_in,
             )
+            #client side latency, used by TrackingBatch to adapt the batch size
+            self.roundTripMS = (time.perf_counter() - started) * 1000
 
             #get status from connection
             self.message = "starting fromResponseProvider"
@@ -51,10 +58,10 @@ class EnolaTrackingBatchProvider(HuemulResponseToBloc):
         try:
             hf = HuemulFunctions()
             hf.delete_args(tracking_batch_head_model)
-            data_in = json.dumps(tracking_batch_head_model.to_json(), default=lambda o: o.__dict__)
+            data_in = huemul_json.dumps(tracking_batch_head_model.to_json(), default=lambda o: o.__dict__)
 
             self.message = "starting postRequest"
-            huemul_response = HuemulConnection(connect_object=self.connect_object).post_request(
+            huemul_response = HuemulConnection(connect_object=self.connect_object, started=self.started).post_request(
                 route = "agentExecBatch/execute/v1/",
                 data = data_in,
             )
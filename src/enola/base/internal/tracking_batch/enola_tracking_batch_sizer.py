@@ -0,0 +1,71 @@
+from typing import Optional
+from enola.base.common.huemul_mapping import HuemulMapping
+
+
+class EnolaTrackingBatchSizer(HuemulMapping):
+    """
+    Decides how many rows `TrackingBatch` puts in each request.
+
+    Chunks are limited by a max row count and, optionally, by the size of the serialized body.
+    With a target latency, the row count adapts to the latency observed in each response:
+    it grows while calls are faster than the target and shrinks when they are slower,
+    or when the server itself (`elapsedTimeMS`) takes longer than the target.
+    """
+
+    # max change of the row count after one response
+    _MAX_FACTOR = 2.0
+    _MIN_FACTOR = 0.5
+
+    def __init__(
+        self,
+        max_rows: int,
+        max_bytes: Optional[int] = None,
+        target_latency_ms: Optional[float] = None,
+    ):
+        """
+        Initializes a new `EnolaTrackingBatchSizer`.
+
+        Args:
+            max_rows (int): Max rows per request.
+            max_bytes (int, optional): Max size of the serialized body of a request.
+            target_latency_ms (float, optional): Latency to aim for when adapting the row count. Without it the row count is always `max_rows`.
+        """
+        self.max_rows = max(1, max_rows)
+        self.max_bytes = max_bytes
+        self.target_latency_ms = target_latency_ms
+        # adaptive mode starts small and grows while the server answers fast
+        self.rows = self.max_rows if target_latency_ms is None else max(1, self.max_rows // 4)
+
+    def fits(self, num_rows: int, num_bytes: int, row_bytes: int) -> bool:
+        """
+        Returns True if one more row of `row_bytes` fits in a chunk with `num_rows` rows and `num_bytes` bytes.
+
+        A chunk always accepts its first row, even if it exceeds `max_bytes` by itself.
+        """
+        if num_rows == 0:
+            return True
+        if num_rows >= self.rows:
+            return False
+
+        # +1 for the comma between rows
+        return self.max_bytes is None or num_bytes + row_bytes + 1 <= self.max_bytes
+
+    def observe(self, num_rows: int, round_trip_ms: float, elapsed_time_ms: float = -1) -> None:
+        """
+        Adapts the row count with the latency of a request of `num_rows` rows.
+
+        Args:
+            num_rows (int): Rows sent in the request.
+            round_trip_ms (float): Time from sending the request to receiving the response.
+            elapsed_time_ms (float, optional): Time spent by the server, -1 if unknown.
+        """
+        if self.target_latency_ms is None or num_rows <= 0 or round_trip_ms <= 0:
+            return
+
+        if elapsed_time_ms > self.target_latency_ms:
+            # server is the bottleneck, back off
+            factor = self._MIN_FACTOR
+        else:
+            factor = min(self._MAX_FACTOR, max(self._MIN_FACTOR, self.target_latency_ms / round_trip_ms))
+
+        self.rows = int(min(self.max_rows, max(1, num_rows * factor)))
@@ -0,0 +1,141 @@
+import itertools
+import os
+from typing import Any, Iterator, List, Optional, Tuple
+
+import pandas as pd
+from enola.base.common.huemul_mapping import HuemulMapping
+
+
+class EnolaTrackingBatchSource(HuemulMapping):
+    """
+    Rows of a `TrackingBatch`, read in chunks so big inputs never have to be loaded at once.
+
+    Accepted inputs:
+
+    - pandas DataFrame, already in memory.
+    - Path of a CSV file (read with `pandas.read_csv(chunksize=...)`) or a Parquet file (`.parquet`, `.pq`, needs `pyarrow`).
+    - Iterator of DataFrames, e.g. the result of `pandas.read_csv(..., chunksize=...)`.
+    - Iterator of dicts, one per row.
+
+    `total_rows` is required by the batch head before sending rows. It is taken from the DataFrame,
+    the Parquet metadata or a light pass over the CSV file (first column only); iterators can't be
+    counted without consuming them, so `total_rows` must be given.
+    """
+
+    def __init__(self, data: Any, total_rows: Optional[int] = None, read_chunk_size: int = 10000):
+        """
+        Initializes a new `EnolaTrackingBatchSource`.
+
+        Args:
+            data: DataFrame, file path, iterator of DataFrames or iterator of dicts.
+            total_rows (int, optional): Number of rows, required for iterators.
+            read_chunk_size (int, optional): Rows read from the input at a time. Defaults to 10000.
+        """
+        self.data = data
+        self.read_chunk_size = max(1, read_chunk_size)
+        self._consumed = False
+        # True when the data has rows after `total_rows`, those rows are not read
+        self.has_extra_rows = False
+
+        if isinstance(data, pd.DataFrame):
+            self.kind = "dataframe"
+        elif isinstance(data, (str, os.PathLike)):
+            path = os.fspath(data).lower()
+            self.kind = "parquet" if path.endswith((".parquet", ".pq")) else "csv"
+        elif hasattr(data, "__iter__"):
+            self.kind = "iterator"
+        else:
+            raise Exception(f"data type not supported: {type(data).__name__}")
+
+        if total_rows is None:
+            total_rows = self._count_rows()
+        self.total_rows = total_rows
+
+    def iter_frames(self, ranges: List[Tuple[int, int]]) -> Iterator[Tuple[int, pd.DataFrame]]:
+        """
+        Reads the rows inside `ranges` (`[start, end)` sorted row ranges).
+
+        Yields:
+            Tuple: position of the first row and a DataFrame with the following rows, never crossing a range limit.
+        """
+        if not ranges:
+            return
+
+        if self.kind == "dataframe":
+            self.has_extra_rows = len(self.data) > self.total_rows
+            # in memory, go straight to each range
+            for rangeStart, rangeEnd in ranges:
+                for start in range(rangeStart, rangeEnd, self.read_chunk_size):
+                    end = min(start + self.read_chunk_size, rangeEnd)
+                    yield start, self.data.iloc[start:end]
+            return
+
+        # files and iterators are read sequentially, rows out of the ranges are skipped
+        position = 0
+        frames = self._read_frames()
+        for frame in frames:
+            frameEnd = position + len(frame)
+            for rangeStart, rangeEnd in ranges:
+                start = max(position, rangeStart)
+                end = min(frameEnd, rangeEnd)
+                if start < end:
+                    yield start, frame.iloc[start - position : end - position]
+
+            position = frameEnd
+            if position >= ranges[-1][1]:
+                if ranges[-1][1] >= self.total_rows:
+                    # reads one more chunk to know if the data is bigger than total_rows
+                    self.has_extra_rows = position > self.total_rows or any(len(rest) for rest in frames)
+                return
+
+    def _read_frames(self) -> Iterator[pd.DataFrame]:
+        if self.kind == "csv":
+            yield from pd.read_csv(self.data, chunksize=self.read_chunk_size)
+            return
+
+        if self.kind == "parquet":
+            for batch in self._parquet_file().iter_batches(batch_size=self.read_chunk_size):
+                yield batch.to_pandas()
+            return
+
+        if self._consumed:
+            raise Exception("data iterator was already read, create the TrackingBatch with a new iterator")
+        self._consumed = True
+
+        iterator = iter(self.data)
+        for first in iterator:
+            if isinstance(first, pd.DataFrame):
+                yield first
+                yield from iterator
+            else:
+                # rows as dicts, grouped in DataFrames of read_chunk_size rows
+                rows = itertools.chain([first], iterator)
+                while True:
+                    records = list(itertools.islice(rows, self.read_chunk_size))
+                    if not records:
+                        return
+                    yield pd.DataFrame.from_records(records)
+            return
+
+    def _count_rows(self) -> int:
+        if self.kind == "dataframe":
+            return len(self.data)
+
+        if self.kind == "parquet":
+            return self._parquet_file().metadata.num_rows
+
+        if self.kind == "csv":
+            return sum(
+                len(frame)
+                for frame in pd.read_csv(self.data, chunksize=self.read_chunk_size, usecols=[0])
+            )
+
+        raise Exception("total_rows is required when data is an iterator")
+
+    def _parquet_file(self):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise Exception("pyarrow is required to read parquet files, install it with: pip install pyarrow")
+
+        return pq.ParquetFile(self.data)
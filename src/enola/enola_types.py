@@ -1,9 +1,14 @@
 from enola.base.common.huemul_functions import HuemulFunctions
+from enola.base.common.huemul_mapping import HuemulMapping
 from enum import Enum
 import json
+import time
 import jwt
 from typing import Any, Dict, Optional, List
 
+_hf = HuemulFunctions()
+
+
 class Environtment(Enum):
     DEV = "DEV"
     QA = "QA"
@@ -24,7 +29,7 @@ class CompareType(Enum):
     NOT_EQUAL = "NOT_EQUAL"
     CONTAINS = "CONTAINS"
 
-class TokenInfo:
+class TokenInfo(HuemulMapping):
     def __init__(self, token: str):
 
         if token == "":
@@ -58,16 +63,6 @@ class TokenInfo:
         except jwt.InvalidTokenError:
             print("Invalid Token.")
 
-
-    def __getitem__(self, key):
-        return self.__dict__[key]
-
-    def __getattr__(self, key):
-        return self.__dict__[key]
-
-    def get(self, key, default=None):
-        return self.__dict__.get(key, default)
-
 class KindType(Enum):
     RECEIVER = "RECEIVER"
     SENDER = "SENDER"
@@ -90,7 +85,9 @@ class ErrOrWarnKind(Enum):
     """
     INTERNAL_TOUSER = "INTERNAL_TOUSER"
 
-class ErrorOrWarnModel:
+class ErrorOrWarnModel(HuemulMapping):
+    __slots__ = ("id", "error", "error_type", "kind")
+
     def __init__(self, id: str, message: str, error_type: ErrorType, kind: ErrOrWarnKind):
         self.id = id
         self.error = message
@@ -105,16 +102,7 @@ class ErrorOrWarnModel:
             "kind": self.kind.value
         }
     
-    def __getitem__(self, key):
-        return self.__dict__[key]
-
-    def __getattr__(self, key):
-        return self.__dict__[key]
-
-    def get(self, key, default=None):
-        return self.__dict__.get(key, default)
-    
-class DataListModel:
+class DataListModel(HuemulMapping):
     """
     Represents a data item in the agent's data list.
 
@@ -125,6 +113,8 @@ class DataListModel:
         value (Any): The value of the data item.
     """
 
+    __slots__ = ("kind", "name", "data_type", "value")
+
     def __init__(self, kind: 'KindType', name: str, data_type: 'DataType', value: Any):
         """
         Initializes a new instance of DataListModel.
@@ -154,17 +144,8 @@ class DataListModel:
             "value": self.value
         }
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
-
 
-class Info:
+class Info(HuemulMapping):
     """
     Represents an information item, which can be a tag or extra information.
 
@@ -174,6 +155,8 @@ class Info:
         value (Any): The value of the information item.
     """
 
+    __slots__ = ("type", "key", "value")
+
     def __init__(self, type: str, key: str, value: Any):
         """
         Initializes a new instance of Info.
@@ -244,17 +227,8 @@ class Info:
             "value": self.value
         }
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
-
 
-class ApiDataModel:
+class ApiDataModel(HuemulMapping):
     """
     Represents API data related to a step.
 
@@ -306,17 +280,8 @@ class ApiDataModel:
             "payload": self.payload
         }
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
 
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
-
-
-class FileInfoModel:
+class FileInfoModel(HuemulMapping):
     """
     Represents information about a file related to a step.
 
@@ -360,17 +325,8 @@ class FileInfoModel:
             "description": self.description
         }
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
-
 
-class EnolaSenderModel:
+class EnolaSenderModel(HuemulMapping):
     """
     Represents the sender information for Enola tracking.
 
@@ -438,15 +394,6 @@ class EnolaSenderModel:
         self.batch_id = batch_id
         self.ip = ip
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
-
 
 class EvalType(Enum):
     """
@@ -466,7 +413,7 @@ class EvalType(Enum):
 # *************   S T E P S    T Y P E S     ***********************************
 # ***********************************************************************************
 
-class StepCost:
+class StepCost(HuemulMapping):
     """
     Represents the cost information for a step.
 
@@ -483,6 +430,19 @@ class StepCost:
         total (float): Total cost.
     """
 
+    __slots__ = (
+        "token_input",
+        "token_output",
+        "token_total",
+        "videos",
+        "audio",
+        "images",
+        "docs",
+        "infra",
+        "others",
+        "total",
+    )
+
     def __init__(self):
         """
         Initializes a new instance of StepCost.
@@ -498,17 +458,8 @@ class StepCost:
         self.others = 0.0
         self.total = 0.0
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
 
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
-
-
-class StepVideo:
+class StepVideo(HuemulMapping):
     """
     Represents video-related information for a step.
 
@@ -518,6 +469,8 @@ class StepVideo:
         sec_videos (int): Total duration of videos in seconds.
     """
 
+    __slots__ = ("num_videos", "size_videos", "sec_videos")
+
     def __init__(self):
         """
         Initializes a new instance of StepVideo.
@@ -526,17 +479,8 @@ class StepVideo:
         self.size_videos = 0
         self.sec_videos = 0
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
 
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
-
-
-class StepAudio:
+class StepAudio(HuemulMapping):
     """
     Represents audio-related information for a step.
 
@@ -546,6 +490,8 @@ class StepAudio:
         sec_audio (int): Total duration of audio files in seconds.
     """
 
+    __slots__ = ("num_audio", "size_audio", "sec_audio")
+
     def __init__(self):
         """
         Initializes a new instance of StepAudio.
@@ -554,17 +500,8 @@ class StepAudio:
         self.size_audio = 0
         self.sec_audio = 0
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
-
 
-class StepImage:
+class StepImage(HuemulMapping):
     """
     Represents image-related information for a step.
 
@@ -573,6 +510,8 @@ class StepImage:
         size_images (int): Total size of images in kilobytes.
     """
 
+    __slots__ = ("num_images", "size_images")
+
     def __init__(self):
         """
         Initializes a new instance of StepImage.
@@ -580,17 +519,8 @@ class StepImage:
         self.num_images = 0
         self.size_images = 0
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
 
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
-
-
-class StepDoc:
+class StepDoc(HuemulMapping):
     """
     Represents document-related information for a step.
 
@@ -601,6 +531,8 @@ class StepDoc:
         num_char (int): Total number of characters in documents.
     """
 
+    __slots__ = ("num_docs", "num_pages", "size_docs", "num_char")
+
     def __init__(self):
         """
         Initializes a new instance of StepDoc.
@@ -610,17 +542,8 @@ class StepDoc:
         self.size_docs = 0
         self.num_char = 0
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
 
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
-
-
-class StepToken:
+class StepToken(HuemulMapping):
     """
     Represents token-related information for a step.
 
@@ -631,6 +554,8 @@ class StepToken:
         token_total (int): Total number of tokens.
     """
 
+    __slots__ = ("num_char", "token_input", "token_output", "token_total")
+
     def __init__(self):
         """
         Initializes a new instance of StepToken.
@@ -640,14 +565,39 @@ class StepToken:
         self.token_output = 0
         self.token_total = 0
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
 
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
+class _StepPart:
+    """
+    Sub-object or list of `Step` (video, cost, extra_info_list, etc) created on first access.
+    """
+
+    def __init__(self, model_class: type):
+        self.model_class = model_class
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = owner.__dict__["_" + name]
+
+    def __get__(self, step: Optional['Step'], owner: Optional[type] = None) -> Any:
+        if step is None:
+            return self
+
+        value = self.slot.__get__(step, owner)
+        if value is None:
+            value = self.model_class()
+            self.slot.__set__(step, value)
+
+        return value
+
+    def __set__(self, step: 'Step', value: Any) -> None:
+        self.slot.__set__(step, value)
+
 
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
+_EMPTY_VIDEO = StepVideo()
+_EMPTY_AUDIO = StepAudio()
+_EMPTY_IMAGE = StepImage()
+_EMPTY_DOC = StepDoc()
+_EMPTY_TOKEN = StepToken()
+_EMPTY_COST = StepCost()
 
 
 class StepType(Enum):
@@ -672,7 +622,7 @@ class StepType(Enum):
     SCORE = "SCORE"
 
 
-class Step:
+class Step(HuemulMapping):
     """
     Represents a step in the agent execution.
 
@@ -684,7 +634,7 @@ class Step:
         message_input (str): Input message for the step.
         message_output (str): Output message from the step.
         num_iterations (int): Number of iterations.
-        step_id_prev (str): Previous step ID.
+        step_id_prev (str): Previous step ID, the parent step for steps started inside a `tracking.step` block.
         date_start (str): Start date and time of the step.
         date_end (str): End date and time of the step.
         agent_data_list (List[DataListModel]): List of agent data items.
@@ -709,6 +659,56 @@ class Step:
         duration_in_ms (int): Duration of the step in milliseconds.
     """
 
+    __slots__ = (
+        "name",
+        "enola_id",
+        "enola_id_prev",
+        "agent_deploy_id",
+        "step_id",
+        "message_input",
+        "message_output",
+        "num_iterations",
+        "step_id_prev",
+        "_date_start",
+        "_date_end",
+        "_start_ns",
+        "_start_wall_ns",
+        "_end_ns",
+        "_agent_data_list",
+        "_errOrWarn_list",
+        "_extra_info_list",
+        "_file_info_list",
+        "_step_api_data_list",
+        "step_type",
+        "successfull",
+        "num_errors",
+        "num_warnings",
+        "score_value",
+        "score_group",
+        "score_cluster",
+        "_video",
+        "_audio",
+        "_image",
+        "_doc",
+        "_token",
+        "_cost",
+        "income_total",
+        "duration_in_ms",
+    )
+
+    # created on first access, most steps use only a few of them
+    video = _StepPart(StepVideo)
+    audio = _StepPart(StepAudio)
+    image = _StepPart(StepImage)
+    doc = _StepPart(StepDoc)
+    token = _StepPart(StepToken)
+    cost = _StepPart(StepCost)
+    agent_data_list = _StepPart(list)
+    errOrWarn_list = _StepPart(list)
+    extra_info_list = _StepPart(list)
+    file_info_list = _StepPart(list)
+    step_api_data_list = _StepPart(list)
+
     def __init__(self, name: str, message_input: str = ""):
         """
         Initializes a new instance of Step.
@@ -717,22 +717,26 @@ class Step:
             name (str): Name of the step.
             message_input (str, optional): Input message for the step.
         """
-        self.hf = HuemulFunctions()
         self.name = name
         self.enola_id = ""
+        self.enola_id_prev = ""
         self.agent_deploy_id = ""
         self.step_id = ""
         self.message_input = message_input
         self.message_output = ""
         self.num_iterations = 0
         self.step_id_prev = ""
-        self.date_start = self.hf.get_date_for_api()
-        self.date_end = self.date_start
-        self.agent_data_list: List[DataListModel] = []  # only for first step
-        self.errOrWarn_list: List['ErrorOrWarnModel'] = []
-        self.extra_info_list: List[Info] = []
-        self.file_info_list: List[FileInfoModel] = []
-        self.step_api_data_list: List[ApiDataModel] = []
+        # monotonic clock for the duration, wall clock only to render the dates when sending
+        self._start_ns = time.perf_counter_ns()
+        self._start_wall_ns = time.time_ns()
+        self._end_ns: Optional[int] = None
+        self._date_start: Optional[str] = None
+        self._date_end: Optional[str] = None
+        self._agent_data_list: Optional[List[DataListModel]] = None  # only for first step
+        self._errOrWarn_list: Optional[List['ErrorOrWarnModel']] = None
+        self._extra_info_list: Optional[List[Info]] = None
+        self._file_info_list: Optional[List[FileInfoModel]] = None
+        self._step_api_data_list: Optional[List[ApiDataModel]] = None
         self.step_type: StepType = StepType.OTHER
 
         self.successfull = False
@@ -743,15 +747,55 @@ class Step:
         self.score_group = ""
         self.score_cluster = ""
 
-        self.video = StepVideo()
-        self.audio = StepAudio()
-        self.image = StepImage()
-        self.doc = StepDoc()
-        self.token = StepToken()
-        self.cost = StepCost()
+        self._video: Optional[StepVideo] = None
+        self._audio: Optional[StepAudio] = None
+        self._image: Optional[StepImage] = None
+        self._doc: Optional[StepDoc] = None
+        self._token: Optional[StepToken] = None
+        self._cost: Optional[StepCost] = None
         self.income_total = 0.0
         self.duration_in_ms = 0
 
+    @property
+    def hf(self) -> HuemulFunctions:
+        return _hf
+
+    @property
+    def date_start(self) -> str:
+        if self._date_start is not None:
+            return self._date_start
+
+        return _hf.get_date_for_api_from_ns(self._start_wall_ns)
+
+    @date_start.setter
+    def date_start(self, value: str) -> None:
+        self._date_start = value
+
+    @property
+    def date_end(self) -> str:
+        if self._date_end is not None:
+            return self._date_end
+        if self._end_ns is None:
+            return self.date_start
+
+        return _hf.get_date_for_api_from_ns(self._start_wall_ns + self._end_ns - self._start_ns)
+
+    @date_end.setter
+    def date_end(self, value: str) -> None:
+        self._date_end = value
+
+    def close(self) -> None:
+        """
+        Sets the end date and the duration of the step (`duration_in_ms`), measured with a monotonic clock.
+        """
+        self._end_ns = time.perf_counter_ns()
+        self._date_end = None
+        if self._date_start is None:
+            self.duration_in_ms = (self._end_ns - self._start_ns) / 1_000_000
+        else:
+            # start date set by hand, only comparable with the wall clock
+            self.duration_in_ms = _hf.get_dif_ms(self._date_start, self.date_end)
+
     def set_score(self, value: float, group: str, cluster: str, date: str = "") -> None:
         """
         Sets the score for the step.
@@ -896,6 +940,13 @@ class Step:
         Returns:
             Dict[str, Any]: A dictionary representation of the Step.
         """
+        # steps without media or cost send zeros, without creating the sub-objects
+        video = self._video if self._video is not None else _EMPTY_VIDEO
+        audio = self._audio if self._audio is not None else _EMPTY_AUDIO
+        image = self._image if self._image is not None else _EMPTY_IMAGE
+        doc = self._doc if self._doc is not None else _EMPTY_DOC
+        token = self._token if self._token is not None else _EMPTY_TOKEN
+        cost = self._cost if self._cost is not None else _EMPTY_COST
         return {
             "stepId": self.step_id,
             "stepIdPrev": self.step_id_prev,
@@ -907,31 +958,31 @@ class Step:
             "agentExecSuccessfull": self.successfull,
             "agentExecNumErrors": self.num_errors,
             "agentExecNumWarnings": self.num_warnings,
-            "agentExecNumVideos": self.video.num_videos,
-            "agentExecSecVideos": self.video.sec_videos,
-            "agentExecSizeVideos": self.video.size_videos,
-            "agentExecNumAudio": self.audio.num_audio,
-            "agentExecSecAudio": self.audio.sec_audio,
-            "agentExecSizeAudio": self.audio.size_audio,
-            "agentExecNumImages": self.image.num_images,
-            "agentExecSizeImages": self.image.size_images,
-            "agentExecNumDocs": self.doc.num_docs,
-            "agentExecNumPages": self.doc.num_pages,
-            "agentExecSizeDocs": self.doc.size_docs,
-            "agentExecNumChar": self.doc.num_char + self.token.num_char,
-            "agentExecTokenInput": self.token.token_input,
-            "agentExecTokenOutput": self.token.token_output,
-            "agentExecTokenTotal": self.token.token_total,
-            "agentExecCostTokenInput": self.cost.token_input,
-            "agentExecCostTokenOutput": self.cost.token_output,
-            "agentExecCostTokenTotal": self.cost.token_total,
-            "agentExecCostVideos": self.cost.videos,
-            "agentExecCostAudio": self.cost.audio,
-            "agentExecCostImages": self.cost.images,
-            "agentExecCostDocs": self.cost.docs,
-            "agentExecCostInfra": self.cost.infra,
-            "agentExecCostOthers": self.cost.others,
-            "agentExecCostTotal": self.cost.total,
+            "agentExecNumVideos": video.num_videos,
+            "agentExecSecVideos": video.sec_videos,
+            "agentExecSizeVideos": video.size_videos,
+            "agentExecNumAudio": audio.num_audio,
+            "agentExecSecAudio": audio.sec_audio,
+            "agentExecSizeAudio": audio.size_audio,
+            "agentExecNumImages": image.num_images,
+            "agentExecSizeImages": image.size_images,
+            "agentExecNumDocs": doc.num_docs,
+            "agentExecNumPages": doc.num_pages,
+            "agentExecSizeDocs": doc.size_docs,
+            "agentExecNumChar": doc.num_char + token.num_char,
+            "agentExecTokenInput": token.token_input,
+            "agentExecTokenOutput": token.token_output,
+            "agentExecTokenTotal": token.token_total,
+            "agentExecCostTokenInput": cost.token_input,
+            "agentExecCostTokenOutput": cost.token_output,
+            "agentExecCostTokenTotal": cost.token_total,
+            "agentExecCostVideos": cost.videos,
+            "agentExecCostAudio": cost.audio,
+            "agentExecCostImages": cost.images,
+            "agentExecCostDocs": cost.docs,
+            "agentExecCostInfra": cost.infra,
+            "agentExecCostOthers": cost.others,
+            "agentExecCostTotal": cost.total,
             "agentExecIncomeTotal": self.income_total,
             "agentExecScoreValue": self.score_value,
             "agentExecScoreGroup": self.score_group,
@@ -940,32 +991,23 @@ class Step:
             "agentExecMessageInput": self.message_input,
             "agentExecMessageOutput": self.message_output,
             "agentExecCliNumIter": self.num_iterations,
-            "agentData": [item.to_json() for item in self.agent_data_list],
-            "errorOrWarning": [item.to_json() for item in self.errOrWarn_list],
-            "extraInfo": [item.to_json() for item in self.extra_info_list],
-            "fileInfo": [item.to_json() for item in self.file_info_list],
-            "stepApiData": [item.to_json() for item in self.step_api_data_list],
+            "agentData": [item.to_json() for item in self._agent_data_list or ()],
+            "errorOrWarning": [item.to_json() for item in self._errOrWarn_list or ()],
+            "extraInfo": [item.to_json() for item in self._extra_info_list or ()],
+            "fileInfo": [item.to_json() for item in self._file_info_list or ()],
+            "stepApiData": [item.to_json() for item in self._step_api_data_list or ()],
         }
 
     def __str__(self) -> str:
         duration_seconds = self.duration_in_ms / 1000
         return f'Step: {self.name}, Duration: {duration_seconds} seconds'
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
-
 
 # ***********************************************************************************
 # *************   T R A C K I N G   T Y P E S     ***********************************
 # ***********************************************************************************
 
-class TrackingModel:
+class TrackingModel(HuemulMapping):
     """
     Represents a tracking model for agent execution.
 
@@ -977,6 +1019,8 @@ class TrackingModel:
         enola_id_prev (str): Previous Enola ID.
     """
 
+    __slots__ = ("enola_sender", "is_test", "step_list", "steps", "enola_id_prev")
+
     def __init__(
         self,
         is_test: bool,
@@ -1027,17 +1071,8 @@ class TrackingModel:
             "enola_id_prev": self.enola_id_prev,
         }
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
 
-    def get(self, key: str, default: Any = None) -> Any:
-        return self.__dict__.get(key, default)
-
-
-class TrackingResponseModel:
+class TrackingResponseModel(HuemulMapping):
     """
     Represents the response model for tracking.
 
@@ -1096,21 +1131,12 @@ class TrackingResponseModel:
             "args": self.args,
         }
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Any = None) -> Any:
-        return self.__dict__.get(key, default)
-
 
 # ***********************************************************************************
 # *************   T R A C K I N G   B A T C H   T Y P E S     ***********************
 # ***********************************************************************************
 
-class TrackingBatchHeadModel:
+class TrackingBatchHeadModel(HuemulMapping):
     """
     Represents the header model for batch tracking.
 
@@ -1169,17 +1195,8 @@ class TrackingBatchHeadModel:
             "agentExecBatchNumRowsTotal": self.total_rows,
         }
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Any = None) -> Any:
-        return self.__dict__.get(key, default)
 
-
-class TrackingBatchHeadResponseModel:
+class TrackingBatchHeadResponseModel(HuemulMapping):
     """
     Represents the response model for batch tracking head.
 
@@ -1230,17 +1247,8 @@ class TrackingBatchHeadResponseModel:
             "args": self.args,
         }
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Any = None) -> Any:
-        return self.__dict__.get(key, default)
-
 
-class TrackingBatchDetailResponseModel:
+class TrackingBatchDetailResponseModel(HuemulMapping):
     """
     Represents the detailed response model for batch tracking.
 
@@ -1277,23 +1285,16 @@ class TrackingBatchDetailResponseModel:
         self.agent_deploy_id = agent_deploy_id or args.get("agentDeployId", "")
         self.successfull = successfull if successfull is not None else args.get("isSuccessful", False)
         self.message = message or args.get("message", "")
+        self.elapsed_time_ms = -1
+        self.round_trip_ms = -1
         self.args = args
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Any = None) -> Any:
-        return self.__dict__.get(key, default)
-
 
 # ***********************************************************************************
 # *************   E X E C U T I O N   T Y P E S     ***********************************
 # ***********************************************************************************
 
-class ExecutionModel:
+class ExecutionModel(HuemulMapping):
     """
     Represents an execution model containing data and status.
 
@@ -1319,17 +1320,8 @@ class ExecutionModel:
         self.message = message
         self.args = args
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-    
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-    
-    def get(self, key: str, default: Any = None) -> Any:
-        return self.__dict__.get(key, default)
-
 
-class ExecutionEvalFilter:
+class ExecutionEvalFilter(HuemulMapping):
     """
     Represents a filter for execution evaluations.
 
@@ -1349,17 +1341,8 @@ class ExecutionEvalFilter:
         self.eval_id = eval_id
         self.include = include
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-    
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-    
-    def get(self, key: str, default: Any = None) -> Any:
-        return self.__dict__.get(key, default)
-
 
-class ExecutionDataFilter:
+class ExecutionDataFilter(HuemulMapping):
     """
     Represents a data filter for execution queries.
 
@@ -1405,17 +1388,8 @@ class ExecutionDataFilter:
             "compare": self.compare.value,
         }
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-    
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-    
-    def get(self, key: str, default: Any = None) -> Any:
-        return self.__dict__.get(key, default)
-
 
-class ExecutionQueryModel:
+class ExecutionQueryModel(HuemulMapping):
     """
     Represents a query model for fetching executions.
 
@@ -1524,17 +1498,27 @@ class ExecutionQueryModel:
         if page_number < 0:
             raise ValueError("page_number must be 0 or greater.")
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-    
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-    
-    def get(self, key: str, default: Any = None) -> Any:
-        return self.__dict__.get(key, default)
+    def with_page(self, page_number: int) -> "ExecutionQueryModel":
+        """
+        Returns a copy of this query for another page, used to request pages in parallel.
 
+        Args:
+            page_number (int): Page number of the copy.
+        """
+        return ExecutionQueryModel(**{**self.__dict__, "page_number": page_number})
+
+    def with_dates(self, date_from: str, date_to: str) -> "ExecutionQueryModel":
+        """
+        Returns a copy of this query for another date range, starting before the first page.
 
-class ExecutionResponseModel:
+        Args:
+            date_from (str): Start date of the copy.
+            date_to (str): End date of the copy.
+        """
+        return ExecutionQueryModel(**{**self.__dict__, "date_from": date_from, "date_to": date_to, "page_number": 0})
+
+
+class ExecutionResponseModel(HuemulMapping):
     """
     Represents the response model for an execution.
 
@@ -1655,21 +1639,12 @@ class ExecutionResponseModel:
         self.external_id = agentExecCliCodeApi
         self.successfull = agentExecSuccessfull
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-    
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-    
-    def get(self, key: str, default: Any = None) -> Any:
-        return self.__dict__.get(key, default)
-
 
 # ***********************************************************************************
 # *************   E V A L U A T I O N   T Y P E S     ***********************************
 # ***********************************************************************************
 
-class EvaluationResultModel:
+class EvaluationResultModel(HuemulMapping):
     """
     Represents the result of an evaluation process.
 
@@ -1678,9 +1653,10 @@ class EvaluationResultModel:
         total_errors (int): Total number of errors encountered.
         total_success (int): Total number of successful evaluations.
         errors (List[Any]): List of errors.
+        results (List[EvaluationResponseModel]): Response of each evaluation, in the order they were added.
     """
 
-    def __init__(self, total_evals: int, total_errors: int, total_success: int, errors: List[Any]):
+    def __init__(self, total_evals: int, total_errors: int, total_success: int, errors: List[Any], results: Optional[List[Any]] = None):
         """
         Initializes a new instance of EvaluationResultModel.
 
@@ -1689,23 +1665,16 @@ class EvaluationResultModel:
             total_errors (int): Total number of errors encountered.
             total_success (int): Total number of successful evaluations.
             errors (List[Any]): List of errors.
+            results (List[EvaluationResponseModel], optional): Response of each evaluation.
         """
         self.total_evals = total_evals
         self.total_errors = total_errors
         self.total_success = total_success
         self.errors = errors
-
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-    
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-    
-    def get(self, key: str, default: Any = None) -> Any:
-        return self.__dict__.get(key, default)
+        self.results = results if results is not None else []
 
 
-class EvaluationDetailModel:
+class EvaluationDetailModel(HuemulMapping):
     """
     Represents the details of an individual evaluation.
 
@@ -1731,17 +1700,8 @@ class EvaluationDetailModel:
         self.level = level
         self.comment = comment
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-    
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-    
-    def get(self, key: str, default: Any = None) -> Any:
-        return self.__dict__.get(key, default)
-
 
-class ResultScore:
+class ResultScore(HuemulMapping):
     """
     Represents the result of a score evaluation.
 
@@ -1826,17 +1786,8 @@ class ResultScore:
             "messageOutputBest": "",
         }
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Any = None) -> Any:
-        return self.__dict__.get(key, default)
 
-
-class ResultLLM:
+class ResultLLM(HuemulMapping):
     """
     Represents the result of a language model evaluation.
 
@@ -1869,18 +1820,9 @@ class ResultLLM:
             "scoreClusterDif": "",
             "messageOutputBest": self.message_output_best,
         }
-
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
-
-    def get(self, key: str, default: Any = None) -> Any:
-        return self.__dict__.get(key, default)
     
 
-class EvaluationModel:
+class EvaluationModel(HuemulMapping):
     """
     Represents an evaluation model containing evaluation details and results.
 
@@ -1966,17 +1908,14 @@ class EvaluationModel:
         }
         return result
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
     def __getattr__(self, key: str) -> Any:
-        return self.__dict__.get(key)
-
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
+        # missing attributes are None, except special names (pickle and copy look them up)
+        if key.startswith("__"):
+            raise AttributeError(key)
+        return None
 
 
-class EvaluationResponseModel:
+class EvaluationResponseModel(HuemulMapping):
     """
     Represents the response model for an evaluation submission.
 
@@ -2032,11 +1971,8 @@ class EvaluationResponseModel:
             "args": self.args,
         }
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
-
     def __getattr__(self, key: str) -> Any:
-        return self.__dict__.get(key)
-
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
\ No newline at end of file
+        # missing attributes are None, except special names (pickle and copy look them up)
+        if key.startswith("__"):
+            raise AttributeError(key)
+        return None
\ No newline at end of file
@@ -1,7 +1,12 @@
-from typing import Any, List, Optional
+import asyncio
+from collections import deque
+from collections.abc import MutableSequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Union
 import jwt
+import pandas as pd
 from enola.base.common.huemul_functions import HuemulFunctions
-from enola.base.internal.evaluation.enola_evaluation import create_evaluation
+from enola.base.internal.evaluation.enola_evaluation import create_evaluation, create_evaluation_async
 from enola.base.common.auth.auth_model import AuthModel
 from enola.enola_types import (
     EnolaSenderModel,
@@ -11,20 +16,21 @@ from enola.enola_types import (
     EvaluationResultModel,
     ResultLLM,
     ResultScore,
-    TokenInfo,
 )
-from enola.base.connect import Connect
+from enola.base.connect_registry import get_connect_registry
+from enola.base.common.huemul_retry_policy import HuemulRetryPolicy
+from enola.base.common.huemul_mapping import HuemulMapping
 
 
-class Evaluation:
+class Evaluation(HuemulMapping):
     """
     The `Evaluation` class provides methods to evaluate executions in the Enola system.
 
     This class allows you to:
 
     - Initialize an evaluation session.
-    - Add evaluations by value or level.
-    - Execute the evaluations and send the data to the Enola server.
+    - Add evaluations by value or level, one by one or in bulk with `add_evaluations`.
+    - Execute the evaluations and send the data to the Enola server, optionally several at the same time.
     """
 
     def __init__(
@@ -42,6 +48,10 @@ class Evaluation:
         user_name: str = "",
         session_name: str = "",
         channel_name: str = "",
+        retry_policy: Optional[HuemulRetryPolicy] = None,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 60.0,
+        deadline: Optional[float] = None,
     ):
         """
         Initializes a new `Evaluation` instance.
@@ -60,6 +70,10 @@ class Evaluation:
             user_name (str, optional): Name of the user.
             session_name (str, optional): Name of the session.
             channel_name (str, optional): Name of the channel.
+            retry_policy (HuemulRetryPolicy, optional): Retries of failed calls to the server. Defaults to exponential backoff with jitter, 5 attempts.
+            connect_timeout (float, optional): Max seconds to open a connection to the server. Defaults to 10.
+            read_timeout (float, optional): Max seconds waiting for data from the server. Defaults to 60.
+            deadline (float, optional): Max seconds for each call to the server, including retries. When exceeded the call fails with `HuemulTimeoutError`. Defaults to no limit.
         """
         self.hf = HuemulFunctions()
         self.eval_type = eval_type
@@ -67,7 +81,7 @@ class Evaluation:
         self.result_llm = result_llm
 
         # Decode JWT token
-        self.token_info = TokenInfo(token=token)
+        self.token_info = get_connect_registry().get_token_info(token)
 
         if not self.token_info.is_service_account:
             raise Exception(
@@ -80,12 +94,16 @@ class Evaluation:
         ):
             raise Exception("Service Account can't evaluate")
 
-        self.connection = Connect(
+        self.connection = get_connect_registry().connect(
             AuthModel(
                 jwt_token=token,
                 url_service=self.token_info.service_account_url,
                 org_id=self.token_info.org_id,
-            )
+            ),
+            retry_policy=retry_policy,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            deadline=deadline,
         )
 
         # User information
@@ -107,7 +125,21 @@ class Evaluation:
 
         # Current date
         self.date_start = self.hf.get_date_for_api()
-        self.executions: List[EvaluationModel] = []
+        # executions in the order they were added, indexed by enola_id
+        self._executions = _ExecutionList()
+
+    @property
+    def executions(self) -> "_ExecutionList":
+        """
+        Executions to evaluate, in the order they were added.
+
+        Works as a list (indexing, `append`, `remove`, `clear`), `in` and `execution_exists` use an index by enola_id.
+        """
+        return self._executions
+
+    @executions.setter
+    def executions(self, executions: List[EvaluationModel]) -> None:
+        self._executions = _ExecutionList(executions)
 
     ########################################################################################
     ###############    E V A L U A T I O N     M E T H O D S     ###########################
@@ -123,10 +155,7 @@ class Evaluation:
         Returns:
             Optional[EvaluationModel]: The evaluation model if it exists, None otherwise.
         """
-        for item in self.executions:
-            if item.enola_id == enola_id:
-                return item
-        return None
+        return self._executions.get(enola_id)
 
     def add_evaluation(
         self, enola_id: str, eval_id: str, value: float, comment: str
@@ -143,19 +172,7 @@ class Evaluation:
         eval_detail = EvaluationDetailModel(
             eval_id=eval_id, value=value, comment=comment
         )
-        execution = self.execution_exists(enola_id)
-
-        if execution is None:
-            execution = EvaluationModel(
-                enola_id,
-                eval_type=self.eval_type,
-                enola_sender=self.enola_sender,
-                result_score=self.result_score,
-                result_llm=self.result_llm,
-            )
-            self.executions.append(execution)
-
-        execution.add_eval(eval_detail)
+        self._get_or_add_execution(enola_id, with_results=True).add_eval(eval_detail)
 
     def add_evaluation_by_level(
         self, enola_id: str, eval_id: str, level: int, comment: str
@@ -172,48 +189,289 @@ class Evaluation:
         eval_detail = EvaluationDetailModel(
             eval_id=eval_id, level=level, comment=comment
         )
-        execution = self.execution_exists(enola_id)
+        self._get_or_add_execution(enola_id, with_results=False).add_eval(eval_detail)
+
+    def add_evaluations(
+        self, evaluations: Union[pd.DataFrame, Iterable[Dict[str, Any]]]
+    ) -> int:
+        """
+        Adds many evaluations in one pass.
 
+        Each evaluation has `enola_id`, `eval_id`, `comment` (optional) and either `value` (as `add_evaluation`)
+        or `level` (as `add_evaluation_by_level`).
+
+        Args:
+            evaluations (Union[pd.DataFrame, Iterable[Dict[str, Any]]]): DataFrame with those columns, or dicts with those keys.
+
+        Returns:
+            int: Number of evaluations added.
+        """
+        if isinstance(evaluations, pd.DataFrame):
+            missing = [column for column in ("enola_id", "eval_id") if column not in evaluations.columns]
+            if missing:
+                raise Exception(f"columns {missing} not found in evaluations.")
+
+            num_rows = len(evaluations)
+            columns = [
+                evaluations[column].tolist() if column in evaluations.columns else [None] * num_rows
+                for column in ("enola_id", "eval_id", "value", "level", "comment")
+            ]
+            rows = zip(*columns)
+        else:
+            rows = (
+                (item["enola_id"], item["eval_id"], item.get("value"), item.get("level"), item.get("comment"))
+                for item in evaluations
+            )
+
+        num_added = 0
+        for enola_id, eval_id, value, level, comment in rows:
+            comment = "" if _is_missing(comment) else comment
+            if not _is_missing(value):
+                eval_detail = EvaluationDetailModel(eval_id=eval_id, value=value, comment=comment)
+                with_results = True
+            elif not _is_missing(level):
+                eval_detail = EvaluationDetailModel(eval_id=eval_id, level=int(level), comment=comment)
+                with_results = False
+            else:
+                raise Exception(f"evaluation {eval_id} of {enola_id} has no value or level.")
+
+            self._get_or_add_execution(enola_id, with_results=with_results).add_eval(eval_detail)
+            num_added += 1
+
+        return num_added
+
+    def _get_or_add_execution(self, enola_id: str, with_results: bool) -> EvaluationModel:
+        """
+        Returns the execution with `enola_id`, adding it if it doesn't exist.
+
+        Args:
+            with_results (bool): Attach `result_score` and `result_llm` to a new execution (evaluations by value).
+        """
+        execution = self._executions.get(enola_id)
         if execution is None:
             execution = EvaluationModel(
                 enola_id,
                 eval_type=self.eval_type,
                 enola_sender=self.enola_sender,
+                result_score=self.result_score if with_results else None,
+                result_llm=self.result_llm if with_results else None,
             )
-            self.executions.append(execution)
+            self._executions.append(execution)
 
-        execution.add_eval(eval_detail)
+        return execution
 
-    def execute(self) -> EvaluationResultModel:
+    def execute(
+        self,
+        max_workers: int = 1,
+        max_in_flight: Optional[int] = None,
+        raise_error_if_fail: bool = True,
+    ) -> EvaluationResultModel:
         """
         Executes the evaluations.
 
+        Args:
+            max_workers (int, optional): Number of evaluations sent at the same time. Defaults to 1 (one after another).
+            max_in_flight (int, optional): Max evaluations submitted and not confirmed yet. Defaults to `max_workers`.
+            raise_error_if_fail (bool, optional): Raise the error of the first failed evaluation and stop sending.
+                When False, failures are counted in the result. Defaults to True.
+
         Returns:
-            EvaluationResultModel: The result of the evaluations.
+            EvaluationResultModel: The result of the evaluations, with the response of each one in `results`.
         """
-        final_result = EvaluationResultModel(
-            total_evals=len(self.executions),
+        final_result = self._new_result()
+        max_workers = max(1, max_workers)
+        max_in_flight = max(max_workers, max_in_flight or max_workers)
+        self.connection.huemul_transport.ensure_pool_size(max_workers)
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="enola-eval"
+        ) as executor:
+            # futures are confirmed in submit order, so results keep the order of executions
+            pending: Deque[Future] = deque()
+            try:
+                for item in self._executions:
+                    pending.append(
+                        executor.submit(
+                            create_evaluation,
+                            evaluation_model=item,
+                            connection=self.connection,
+                            raise_error_if_fail=raise_error_if_fail,
+                        )
+                    )
+
+                    if len(pending) >= max_in_flight:
+                        self._add_result(final_result, pending.popleft().result())
+
+                while pending:
+                    self._add_result(final_result, pending.popleft().result())
+            except Exception:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        return final_result
+
+    def _new_result(self) -> EvaluationResultModel:
+        return EvaluationResultModel(
+            total_evals=len(self._executions),
             total_errors=0,
             total_success=0,
             errors=[],
         )
 
-        for item in self.executions:
-            result = create_evaluation(
-                evaluation_model=item, connection=self.connection
-            )
-            if not result.successfull:
-                print(result.errors)
-                print(result.message)
-                final_result.errors.append(result.message)
+    def _add_result(self, final_result: EvaluationResultModel, result) -> None:
+        """
+        Counts the response of one evaluation.
+        """
+        final_result.results.append(result)
+        if result.successfull:
+            final_result.total_success += 1
+        else:
+            final_result.total_errors += 1
+            final_result.errors.append(result.message)
 
-        return final_result
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
+def _is_missing(value: Any) -> bool:
+    # None, or NaN / NA of an empty DataFrame cell
+    return value is None or value is pd.NA or (isinstance(value, float) and value != value)
+
+
+class _ExecutionList(MutableSequence):
+    """
+    List of the executions of an `Evaluation`, with an index by enola_id.
+
+    Positional access works as a plain list, `in` and `get` use the index.
+    Adding an execution with an enola_id already added replaces it in its position.
+    """
+
+    __slots__ = ("_items", "_index")
+
+    def __init__(self, items: Iterable[EvaluationModel] = ()):
+        self._items: List[EvaluationModel] = []
+        self._index: Dict[str, EvaluationModel] = {}
+        for item in items:
+            self.append(item)
+
+    def get(self, enola_id: str) -> Optional[EvaluationModel]:
+        return self._index.get(enola_id)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[EvaluationModel]:
+        return iter(self._items)
+
+    def __contains__(self, item: Any) -> bool:
+        return self._index.get(getattr(item, "enola_id", None)) is item
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __setitem__(self, index, item) -> None:
+        if isinstance(index, slice) or (
+            item.enola_id != self._items[index].enola_id and item.enola_id in self._index
+        ):
+            # enola_id of another position, rebuild so it stays once
+            items = self._items[:]
+            items[index] = item
+            self._reset(items)
+        else:
+            del self._index[self._items[index].enola_id]
+            self._items[index] = item
+            self._index[item.enola_id] = item
+
+    def __delitem__(self, index) -> None:
+        removed = self._items[index] if isinstance(index, slice) else [self._items[index]]
+        del self._items[index]
+        for item in removed:
+            del self._index[item.enola_id]
+
+    def insert(self, index: int, item: EvaluationModel) -> None:
+        if item.enola_id in self._index:
+            items = self._items[:]
+            items.insert(index, item)
+            self._reset(items)
+        else:
+            self._items.insert(index, item)
+            self._index[item.enola_id] = item
+
+    def append(self, item: EvaluationModel) -> None:
+        existing = self._index.get(item.enola_id)
+        if existing is None:
+            self._items.append(item)
+        else:
+            self._items[self._position(existing)] = item
+        self._index[item.enola_id] = item
+
+    def remove(self, item: EvaluationModel) -> None:
+        if item not in self:
+            raise ValueError("execution not in evaluation")
+        del self._items[self._position(item)]
+        del self._index[item.enola_id]
 
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
+    def clear(self) -> None:
+        self._items.clear()
+        self._index.clear()
 
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
+    def __repr__(self) -> str:
+        return repr(self._items)
+
+    def _position(self, item: EvaluationModel) -> int:
+        return next(position for position, value in enumerate(self._items) if value is item)
+
+    def _reset(self, items: List[EvaluationModel]) -> None:
+        self._items = []
+        self._index = {}
+        for item in items:
+            self.append(item)
+
+
+class AsyncEvaluation(Evaluation):
+    """
+    Asyncio version of `Evaluation`, `execute` is a coroutine.
+
+    HTTP calls run outside the event loop and retries wait with `asyncio.sleep`.
+    """
+
+    async def execute(
+        self, max_in_flight: int = 1, raise_error_if_fail: bool = True
+    ) -> EvaluationResultModel:
+        """
+        Executes the evaluations.
+
+        Args:
+            max_in_flight (int, optional): Number of evaluations sent at the same time. Defaults to 1 (one after another).
+            raise_error_if_fail (bool, optional): Raise the error of the first failed evaluation and stop sending.
+                When False, failures are counted in the result. Defaults to True.
+
+        Returns:
+            EvaluationResultModel: The result of the evaluations, with the response of each one in `results`.
+        """
+        final_result = self._new_result()
+        max_in_flight = max(1, max_in_flight)
+        self.connection.huemul_transport.ensure_pool_size(max_in_flight)
+
+        pending: Deque[asyncio.Future] = deque()
+        try:
+            for item in self._executions:
+                pending.append(
+                    asyncio.ensure_future(
+                        create_evaluation_async(
+                            evaluation_model=item,
+                            connection=self.connection,
+                            raise_error_if_fail=raise_error_if_fail,
+                        )
+                    )
+                )
+
+                if len(pending) >= max_in_flight:
+                    self._add_result(final_result, await pending.popleft())
+
+            while pending:
+                self._add_result(final_result, await pending.popleft())
+        except Exception:
+            for future in pending:
+                future.cancel()
+            raise
+
+        return final_result
@@ -1,18 +1,26 @@
-from typing import Any, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import asyncio
+from typing import Any, AsyncIterator, Iterator, List, Optional, Tuple
 from enola.base.common.auth.auth_model import AuthModel
 from enola.base.common.huemul_functions import HuemulFunctions
-from enola.base.connect import Connect
-from enola.base.internal.executions.enola_execution import get_execution
+from enola.base.connect_registry import get_connect_registry
+from enola.base.common.huemul_retry_policy import HuemulRetryPolicy
+from enola.base.internal.executions.enola_execution import get_execution, get_execution_async
+from enola.base.internal.executions.enola_execution_cache import EnolaExecutionCache
+from enola.base.internal.executions.enola_execution_frame import OUTPUT_FORMATS, executions_to_frame
+from enola.base.internal.executions.enola_execution_sync_store import EnolaExecutionSyncStore
 from enola.enola_types import (
     Environtment,
     ExecutionEvalFilter,
     ExecutionModel,
     ExecutionQueryModel,
-    TokenInfo,
+    ExecutionResponseModel,
 )
+from enola.base.common.huemul_mapping import HuemulMapping
 
 
-class GetExecutions:
+class GetExecutions(HuemulMapping):
     """
     The `GetExecutions` class provides methods to retrieve executions from the Enola system.
 
@@ -21,25 +29,54 @@ class GetExecutions:
     - Initialize a retrieval session.
     - Query executions based on various filters.
     - Fetch subsequent pages of results.
+    - Iterate executions of all pages with `iter_executions`.
+    - Export large date ranges in parallel with `export`.
+    - Get results as pandas DataFrames or Arrow tables (`output` parameter).
+    - Keep a local SQLite copy up to date downloading only new executions with `sync`.
+    - Cache pages on disk for repeated queries (`cache_path`).
     """
 
-    def __init__(self, token: str, raise_error_if_fail: bool = True):
+    def __init__(
+        self,
+        token: str,
+        raise_error_if_fail: bool = True,
+        retry_policy: Optional[HuemulRetryPolicy] = None,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 60.0,
+        deadline: Optional[float] = None,
+        cache_path: Optional[str] = None,
+        cache_ttl_seconds: float = 3600.0,
+        cache_max_bytes: int = 512 * 1024 * 1024,
+    ):
         """
         Initializes a new `GetExecutions` instance.
 
         Args:
             token (str): JWT token used to identify the agent.
             raise_error_if_fail (bool, optional): Whether to raise an error if the retrieval fails.
+            retry_policy (HuemulRetryPolicy, optional): Retries of failed calls to the server. Defaults to exponential backoff with jitter, 5 attempts.
+            connect_timeout (float, optional): Max seconds to open a connection to the server. Defaults to 10.
+            read_timeout (float, optional): Max seconds waiting for data from the server. Defaults to 60.
+            deadline (float, optional): Max seconds for each call to the server, including retries. When exceeded the call fails with `HuemulTimeoutError`. Defaults to no limit.
+            cache_path (str, optional): SQLite file to cache pages read, so repeated queries don't call the server. Pages of date ranges
+                ended more than one day ago never expire. Defaults to no cache.
+            cache_ttl_seconds (float, optional): Seconds a cached page of a recent date range is valid. Defaults to 1 hour.
+            cache_max_bytes (int, optional): Max size of the cache, least recently used pages are removed first. Defaults to 512 MB.
         """
         self.raise_error_if_fail = raise_error_if_fail
         self.num_rows_acum = 0
         self.num_rows = 0
         self.continue_execution = False
         self.hf = HuemulFunctions()
+        self.cache = (
+            EnolaExecutionCache(cache_path, ttl_seconds=cache_ttl_seconds, max_bytes=cache_max_bytes)
+            if cache_path
+            else None
+        )
         # Connection data
 
         # Get token info
-        self.token_info = TokenInfo(token=token)
+        self.token_info = get_connect_registry().get_token_info(token)
 
         if (
             self.token_info.is_service_account
@@ -47,30 +84,233 @@ class GetExecutions:
         ):
             raise Exception("Service Account Token is not allowed to get executions")
 
-        self.connection = Connect(
+        self.connection = get_connect_registry().connect(
             AuthModel(
                 jwt_token=token,
                 url_service=self.token_info.service_account_url_backend,
                 org_id=self.token_info.org_id,
-            )
+            ),
+            retry_policy=retry_policy,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            deadline=deadline,
         )
 
-    def get_next_page(self) -> ExecutionModel:
+    def get_next_page(self, output: str = "models", expand_json: bool = False) -> ExecutionModel:
         """
         Retrieves the next page of results.
 
+        Args:
+            output (str, optional): Type of `data` in the result: "models" for a list of `ExecutionResponseModel`,
+                "pandas" for a DataFrame or "arrow" for a pyarrow Table (needs pyarrow). Defaults to "models".
+            expand_json (bool, optional): With "pandas" or "arrow", replace tag_json, data_json and evals with
+                one typed column per key. Defaults to False.
+
         Returns:
             ExecutionModel: The execution model containing the results.
         """
+        _validate_output(output)
         if not self.continue_execution:
             raise Exception("No more data to show.")
 
         self.execution_query_model.page_number += 1
-        enola_result = self.__run_query()
+        enola_result = self.__run_query(output=output, expand_json=expand_json)
 
         # Show results
         return enola_result
 
+    def iter_executions(
+        self, max_rows: Optional[int] = None, prefetch: bool = False, **query_args
+    ) -> Iterator[ExecutionResponseModel]:
+        """
+        Yields executions of all pages, requesting the next page only when the current one was consumed.
+
+        Args:
+            max_rows (int, optional): Max executions to yield. Defaults to all.
+            prefetch (bool, optional): Request page N+1 on a background thread while the caller processes page N. Defaults to False.
+            **query_args: Filters of `query`. When empty, continues the last query after the pages already read.
+
+        Yields:
+            ExecutionResponseModel: Executions in server order.
+        """
+        self._start_iteration(query_args)
+
+        remaining = max_rows
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        next_page: Optional[Future] = None
+        try:
+            while self.continue_execution and (remaining is None or remaining > 0):
+                if next_page is not None:
+                    self.execution_query_model.page_number += 1
+                    page = self._apply_page(next_page.result())
+                    next_page = None
+                else:
+                    page = self.get_next_page()
+
+                if executor is not None and self._needs_next_page(page, remaining):
+                    next_page = executor.submit(self._get_page, self.execution_query_model.page_number + 1)
+
+                for execution in page.data[:remaining]:
+                    yield execution
+
+                if remaining is not None:
+                    remaining -= min(remaining, len(page.data))
+        finally:
+            # caller stopped early, the prefetched page is discarded
+            if next_page is not None:
+                next_page.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def export(
+        self,
+        date_from: str,
+        date_to: str,
+        shards: int = 8,
+        workers: int = 4,
+        output: str = "models",
+        expand_json: bool = False,
+        **query_args,
+    ) -> Any:
+        """
+        Retrieves all executions between two dates, splitting the range in date shards fetched in parallel.
+
+        Consecutive shards share their boundary, so executions returned by two shards are kept once (by `enola_id`).
+
+        Args:
+            date_from (str): Start date, ISO format.
+            date_to (str): End date, ISO format.
+            shards (int, optional): Number of date ranges to split the query in. Dates without time are split in whole days. Defaults to 8.
+            workers (int, optional): Max shards fetched at the same time. Defaults to 4.
+            output (str, optional): "models", "pandas" or "arrow", see `get_next_page`. Defaults to "models".
+            expand_json (bool, optional): Expand json columns of "pandas" and "arrow" outputs, see `get_next_page`. Defaults to False.
+            **query_args: Other filters of `query` (agent_deploy_id_list, limit, include_data, etc).
+
+        Returns:
+            List[ExecutionResponseModel], pandas.DataFrame or pyarrow.Table: Executions ordered by shard, in server order inside each shard.
+
+        Raises:
+            Exception: If a page of a shard fails, also when `raise_error_if_fail` is False.
+        """
+        if shards < 1 or workers < 1:
+            raise ValueError("shards and workers must be greater than 0.")
+        _validate_output(output)
+        raw_data = output != "models"
+
+        # validates filters and permissions of the token
+        self.query(date_from=date_from, date_to=date_to, **query_args)
+        base_query = self.execution_query_model
+
+        shard_queries = [
+            base_query.with_dates(shard_from, shard_to)
+            for shard_from, shard_to in _split_date_range(date_from, date_to, shards)
+        ]
+        self.connection.huemul_transport.ensure_pool_size(workers)
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = [executor.submit(self._export_shard, shard_query, raw_data) for shard_query in shard_queries]
+        try:
+            shard_results = [future.result() for future in futures]
+        finally:
+            # first failed shard stops the export, shards not started are discarded
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+        executions: List[Any] = []
+        seen_ids = set()
+        for shard_executions in shard_results:
+            for execution in shard_executions:
+                enola_id = execution["agentExecId"] if raw_data else execution.enola_id
+                if enola_id in seen_ids:
+                    continue
+                seen_ids.add(enola_id)
+                executions.append(execution)
+
+        self.num_rows = len(executions)
+        self.num_rows_acum = len(executions)
+        self.continue_execution = False
+
+        if raw_data:
+            return executions_to_frame(executions, output=output, expand_json=expand_json)
+
+        return executions
+
+    def sync(
+        self,
+        store_path: str,
+        date_from: str,
+        date_to: Optional[str] = None,
+        sync_name: str = "default",
+        **query_args,
+    ) -> int:
+        """
+        Downloads executions newer than the last sync and appends them to a local SQLite store.
+
+        The store keeps a watermark per `sync_name`: the latest start date stored and the ids of the executions
+        with that date. Runs after the first one query the server from the watermark instead of `date_from`,
+        so each run reads only new executions.
+
+        Args:
+            store_path (str): Path of the SQLite file, created on the first run. See `EnolaExecutionSyncStore`.
+            date_from (str): Start date of the first run, ignored once the sync has a watermark.
+            date_to (str, optional): End date. Defaults to now (UTC).
+            sync_name (str, optional): Name of the watermark, to keep several syncs with different filters in one store. Defaults to "default".
+            **query_args: Other filters of `query` (agent_deploy_id_list, limit, include_data, etc).
+
+        Returns:
+            int: Number of new executions stored.
+        """
+        store = EnolaExecutionSyncStore(store_path)
+        try:
+            since_start_dt, since_ids = store.load_watermark(sync_name)
+            last_start_dt, last_ids = since_start_dt, set(since_ids)
+            if date_to is None:
+                date_to = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+            self.query(date_from=since_start_dt or date_from, date_to=date_to, **query_args)
+
+            new_rows = 0
+            while self.continue_execution:
+                self.execution_query_model.page_number += 1
+                page = self._apply_page(
+                    get_execution(
+                        execution_query_model=self.execution_query_model,
+                        connection=self.connection,
+                        raise_error_if_fail=self.raise_error_if_fail,
+                        raw_data=True,
+                    )
+                )
+                if not page.successfull:
+                    # raise_error_if_fail is False, keep the previous watermark
+                    store.rollback()
+                    return 0
+
+                # pages may not be sorted by date, compare with the watermark of the previous run
+                rows = [row for row in page.data if _is_after_watermark(row, since_start_dt, since_ids)]
+                new_rows += store.append(rows)
+
+                for row in rows:
+                    # rows without start date or id can't be part of the watermark
+                    start_dt = row.get("agentExecStartDT")
+                    enola_id = row.get("agentExecId")
+                    if start_dt is None or enola_id is None:
+                        continue
+                    if last_start_dt is None or start_dt > last_start_dt:
+                        last_start_dt, last_ids = start_dt, set()
+                    if start_dt == last_start_dt:
+                        last_ids.add(enola_id)
+
+            store.save_watermark(sync_name, last_start_dt, last_ids)
+            store.commit()
+        except Exception:
+            store.rollback()
+            raise
+        finally:
+            store.close()
+
+        return new_rows
+
     def get_page_number(self) -> int:
         """
         Gets the current page number.
@@ -186,7 +426,7 @@ class GetExecutions:
             include_evals=include_evals,
         )
 
-    def __run_query(self) -> ExecutionModel:
+    def __run_query(self, output: str = "models", expand_json: bool = False) -> ExecutionModel:
         """
         Runs the query using the current execution query model.
 
@@ -197,8 +437,89 @@ class GetExecutions:
             execution_query_model=self.execution_query_model,
             connection=self.connection,
             raise_error_if_fail=self.raise_error_if_fail,
+            cache=self.cache,
+            raw_data=output != "models",
+        )
+
+        return self._to_output(self._apply_page(enola_result), output, expand_json)
+
+    def _get_page(self, page_number: int) -> ExecutionModel:
+        """
+        Runs the query for a page without changing paging counters, used to prefetch pages.
+
+        Returns:
+            ExecutionModel: The execution model containing the results.
+        """
+        return get_execution(
+            execution_query_model=self.execution_query_model.with_page(page_number),
+            connection=self.connection,
+            raise_error_if_fail=self.raise_error_if_fail,
+            cache=self.cache,
         )
 
+    def _export_shard(self, shard_query: ExecutionQueryModel, raw_data: bool = False) -> List[Any]:
+        """
+        Reads all pages of a shard of `export`.
+
+        Returns:
+            List[Any]: Executions of the shard, `ExecutionResponseModel` or dicts from server when `raw_data`.
+        """
+        executions: List[Any] = []
+        page_number = 1
+        while True:
+            page = get_execution(
+                execution_query_model=shard_query.with_page(page_number),
+                connection=self.connection,
+                raise_error_if_fail=self.raise_error_if_fail,
+                cache=self.cache,
+                raw_data=raw_data,
+            )
+            if not page.successfull:
+                # raise_error_if_fail is False, a shard with missing pages would return an incomplete export
+                raise Exception(
+                    f"export of {shard_query.date_from} - {shard_query.date_to} failed on page {page_number}: {page.message}"
+                )
+            executions.extend(page.data)
+
+            if len(page.data) < shard_query.limit:
+                return executions
+
+            page_number += 1
+
+    def _start_iteration(self, query_args: dict) -> None:
+        """
+        Starts a new query when filters are given, otherwise validates that a query exists.
+        """
+        if query_args:
+            self.query(**query_args)
+        elif self.get("execution_query_model") is None:
+            raise Exception("Call query before iter_executions, or pass the query filters.")
+
+    def _needs_next_page(self, page: ExecutionModel, remaining: Optional[int]) -> bool:
+        """
+        True if there is a page after `page` and the caller still wants more executions.
+        """
+        return self.continue_execution and (remaining is None or remaining > len(page.data))
+
+    def _to_output(self, enola_result: ExecutionModel, output: str, expand_json: bool) -> ExecutionModel:
+        """
+        Converts `data` of a page read with raw data to the requested output.
+
+        Returns:
+            ExecutionModel: The same execution model.
+        """
+        if output != "models":
+            enola_result.data = executions_to_frame(enola_result.data, output=output, expand_json=expand_json)
+
+        return enola_result
+
+    def _apply_page(self, enola_result: ExecutionModel) -> ExecutionModel:
+        """
+        Updates paging counters with the page received.
+
+        Returns:
+            ExecutionModel: The same execution model.
+        """
         self.num_rows = len(enola_result.data)
 
         self.continue_execution = False
@@ -212,11 +533,130 @@ class GetExecutions:
 
         return enola_result
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
 
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
+def _is_after_watermark(row: dict, last_start_dt: Optional[str], last_ids: set) -> bool:
+    # ISO dates from the server compare as text
+    start_dt = row.get("agentExecStartDT")
+    if last_start_dt is None or start_dt is None or start_dt > last_start_dt:
+        return True
+
+    return start_dt == last_start_dt and row.get("agentExecId") not in last_ids
+
+
+def _validate_output(output: str) -> None:
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"output must be one of {OUTPUT_FORMATS}.")
+
+
+def _split_date_range(date_from: str, date_to: str, shards: int) -> List[Tuple[str, str]]:
+    """
+    Splits a date range in up to `shards` consecutive ranges, each one starting where the previous one ends.
+
+    Returns:
+        List[Tuple[str, str]]: (date_from, date_to) of each range, the first and last ones keep the original text.
+    """
+    hf = HuemulFunctions()
+    start = hf.get_date_from_iso(date_from)
+    end = hf.get_date_from_iso(date_to)
+    if (start.tzinfo is None) != (end.tzinfo is None):
+        # naive and aware dates can't be compared, the naive one is taken as UTC
+        start = start if start.tzinfo else start.replace(tzinfo=timezone.utc)
+        end = end if end.tzinfo else end.replace(tzinfo=timezone.utc)
+    if shards <= 1 or end <= start:
+        return [(date_from, date_to)]
+
+    if len(date_from) == 10 and len(date_to) == 10:
+        # only dates, split in whole days
+        days = (end - start).days
+        shards = max(1, min(shards, days))
+        boundaries = [(start + timedelta(days=days * i // shards)).date().isoformat() for i in range(1, shards)]
+    else:
+        step = (end - start) / shards
+        boundaries = [(start + step * i).isoformat(timespec="seconds") for i in range(1, shards)]
+
+    # drop repeated boundaries of very small ranges
+    boundaries = sorted(set(boundaries), key=boundaries.index)
+    limits = [date_from] + boundaries + [date_to]
+    return list(zip(limits[:-1], limits[1:]))
+
+
+class AsyncGetExecutions(GetExecutions):
+    """
+    Asyncio version of `GetExecutions`, `get_next_page` is a coroutine.
+
+    HTTP calls run outside the event loop and retries wait with `asyncio.sleep`.
+    """
+
+    async def get_next_page(self, output: str = "models", expand_json: bool = False) -> ExecutionModel:
+        """
+        Retrieves the next page of results.
+
+        Args:
+            output (str, optional): "models", "pandas" or "arrow", see `GetExecutions.get_next_page`. Defaults to "models".
+            expand_json (bool, optional): Expand json columns of "pandas" and "arrow" outputs. Defaults to False.
+
+        Returns:
+            ExecutionModel: The execution model containing the results.
+        """
+        _validate_output(output)
+        if not self.continue_execution:
+            raise Exception("No more data to show.")
+
+        self.execution_query_model.page_number += 1
+        enola_result = await get_execution_async(
+            execution_query_model=self.execution_query_model,
+            connection=self.connection,
+            raise_error_if_fail=self.raise_error_if_fail,
+            cache=self.cache,
+            raw_data=output != "models",
+        )
+
+        return self._to_output(self._apply_page(enola_result), output, expand_json)
+
+    async def iter_executions(
+        self, max_rows: Optional[int] = None, prefetch: bool = False, **query_args
+    ) -> AsyncIterator[ExecutionResponseModel]:
+        """
+        Asynchronous generator version of `GetExecutions.iter_executions`, use it with `async for`.
+
+        Args:
+            max_rows (int, optional): Max executions to yield. Defaults to all.
+            prefetch (bool, optional): Request page N+1 in a task while the caller processes page N. Defaults to False.
+            **query_args: Filters of `query`. When empty, continues the last query after the pages already read.
+
+        Yields:
+            ExecutionResponseModel: Executions in server order.
+        """
+        self._start_iteration(query_args)
+
+        remaining = max_rows
+        next_page: Optional[asyncio.Task] = None
+        try:
+            while self.continue_execution and (remaining is None or remaining > 0):
+                if next_page is not None:
+                    self.execution_query_model.page_number += 1
+                    page = self._apply_page(await next_page)
+                    next_page = None
+                else:
+                    page = await self.get_next_page()
+
+                if prefetch and self._needs_next_page(page, remaining):
+                    next_page = asyncio.ensure_future(
+                        get_execution_async(
+                            execution_query_model=self.execution_query_model.with_page(
+                                self.execution_query_model.page_number + 1
+                            ),
+                            connection=self.connection,
+                            raise_error_if_fail=self.raise_error_if_fail,
+                            cache=self.cache,
+                        )
+                    )
+
+                for execution in page.data[:remaining]:
+                    yield execution
 
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
+                if remaining is not None:
+                    remaining -= min(remaining, len(page.data))
+        finally:
+            if next_page is not None:
+                next_page.cancel()
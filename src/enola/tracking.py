@@ -1,6 +1,13 @@
-from typing import Any, Optional, List
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import Future
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional, List, Union
 from enola.base.common.huemul_functions import HuemulFunctions
-from enola.base.internal.tracking.enola_tracking import create_tracking
+from enola.base.internal.tracking.enola_tracking import create_tracking, create_tracking_async
+from enola.base.internal.tracking.enola_tracking_sender import get_tracking_sender
 from enola.base.common.auth.auth_model import AuthModel
 from enola.enola_types import (
     EnolaSenderModel,
@@ -11,13 +18,14 @@ from enola.enola_types import (
     Info,
     Step,
     StepType,
-    TokenInfo,
     TrackingModel,
 )
-from enola.base.connect import Connect
+from enola.base.connect_registry import get_connect_registry
+from enola.base.common.huemul_retry_policy import HuemulRetryPolicy
+from enola.base.common.huemul_mapping import HuemulMapping
 
 
-class Tracking:
+class Tracking(HuemulMapping):
     """
     The `Tracking` class provides methods to start and manage execution tracking in the Enola system.
 
@@ -39,6 +47,13 @@ class Tracking:
         user_id='User456',
         is_test=False
     )
+
+    with tracking.step("retrieve", kind=StepType.TOKEN) as step:
+        step.token.token_input = 120
+
+    @tracking.traced
+    def answer(question):
+        ...
     ```
     """
 
@@ -61,6 +76,13 @@ class Tracking:
         channel_name: str = "",
         client_id: str = "",
         product_id: str = "",
+        background_send: bool = False,
+        retry_policy: Optional[HuemulRetryPolicy] = None,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 60.0,
+        deadline: Optional[float] = None,
+        compression: Optional[str] = None,
+        compression_threshold: int = 1024,
     ):
         """
         Initializes a new `Tracking` instance to start tracking an execution.
@@ -83,6 +105,13 @@ class Tracking:
             channel_name (str, optional): Name of the channel.
             client_id (str, optional): Client ID.
             product_id (str, optional): Product ID.
+            background_send (bool, optional): True to send the tracking from a background worker, `execute` returns a `Future` without waiting for the server.
+            retry_policy (HuemulRetryPolicy, optional): Retries of failed calls to the server. Defaults to exponential backoff with jitter, 5 attempts.
+            connect_timeout (float, optional): Max seconds to open a connection to the server. Defaults to 10.
+            read_timeout (float, optional): Max seconds waiting for data from the server. Defaults to 60.
+            deadline (float, optional): Max seconds for each call to the server, including retries. When exceeded the call fails with `HuemulTimeoutError`. Defaults to no limit.
+            compression (str, optional): "gzip" or "zstd" (needs `zstandard`) to compress the data sent to the server. Defaults to no compression.
+            compression_threshold (int, optional): Min size in bytes of the data to compress it. Defaults to 1024.
         """
         self.name = name
         self.enola_id_prev = enola_id_prev
@@ -94,13 +123,14 @@ class Tracking:
         self.hf = HuemulFunctions()
         self.url_evaluation_post = None
         self.url_evaluation_def_get = None
+        self.background_send = background_send
 
         # This execution information
         self.tracking_status = ""
         # Connection data
 
         # Decode JWT token
-        self.token_info = TokenInfo(token=token)
+        self.token_info = get_connect_registry().get_token_info(token)
 
         if not self.token_info.is_service_account:
             raise Exception(
@@ -114,12 +144,18 @@ class Tracking:
             raise Exception("This service account can't execute tracking")
 
         self.agent_deploy_id = self.token_info.agent_deploy_id
-        self.connection = Connect(
+        self.connection = get_connect_registry().connect(
             AuthModel(
                 jwt_token=token,
                 url_service=self.token_info.service_account_url,
                 org_id=self.token_info.org_id,
-            )
+            ),
+            retry_policy=retry_policy,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            deadline=deadline,
+            compression=compression,
+            compression_threshold=compression_threshold,
         )
 
         # User information
@@ -145,6 +181,8 @@ class Tracking:
         # Save steps and information
         self.step_list: List[Step] = []
         self.steps = 0
+        # steps can be started from several threads, protects the counter and parent ids
+        self._lock = threading.Lock()
         self.first_step = self.new_step(self.name, message_input=self.message_input)
 
     ########################################################################################
@@ -257,7 +295,7 @@ class Tracking:
         score_cluster: str = "",
         score_date: str = "",
         external_id: str = "",
-    ) -> bool:
+    ) -> Union[bool, Future]:
         """
         Registers tracking in the Enola server.
 
@@ -273,6 +311,48 @@ class Tracking:
 
         Returns:
             bool: True if execution was successful, False otherwise.
+                With `background_send=True` returns a `Future` that resolves to that value once the tracking is sent.
+        """
+        tracking_model = self._close_tracking(
+            successfull=successfull,
+            message_output=message_output,
+            num_iteratons=num_iteratons,
+            score_value=score_value,
+            score_group=score_group,
+            score_cluster=score_cluster,
+            score_date=score_date,
+            external_id=external_id,
+        )
+
+        # Register in server
+        if self.background_send:
+            return get_tracking_sender().submit(
+                tracking_model=tracking_model,
+                connection=self.connection,
+                on_result=self._apply_result,
+            )
+
+        print(f"{self.name}: sending to server... ")
+        enola_result = create_tracking(
+            tracking_model=tracking_model,
+            connection=self.connection,
+            raise_error_if_fail=True,
+        )
+        return self._apply_result(enola_result)
+
+    def _close_tracking(
+        self,
+        successfull: bool,
+        message_output: str,
+        num_iteratons: int,
+        score_value: float,
+        score_group: str,
+        score_cluster: str,
+        score_date: str,
+        external_id: str,
+    ) -> TrackingModel:
+        """
+        Closes the first step and builds the tracking model to send.
         """
         self.first_step.num_iterations = num_iteratons
         if external_id != "":
@@ -289,21 +369,21 @@ class Tracking:
             value=score_value, group=score_group, cluster=score_cluster, date=score_date
         )
 
-        # Register in server
-        print(f"{self.name}: sending to server... ")
-        tracking_model = TrackingModel(
+        return TrackingModel(
             enola_id_prev=self.enola_id_prev,
             enola_sender=self.enola_sender,
-            isTest=self.is_test,
+            is_test=self.is_test,
             step_list=self.step_list,
             steps=self.steps,
         )
 
-        enola_result = create_tracking(
-            tracking_model=tracking_model,
-            connection=self.connection,
-            raise_error_if_fail=True,
-        )
+    def _apply_result(self, enola_result) -> bool:
+        """
+        Stores the server response in this tracking.
+
+        Returns:
+            bool: True if execution was successful, False otherwise.
+        """
         # Show results
         if enola_result.successfull:
             # Obtain Enola ID and evaluation URLs
@@ -336,8 +416,90 @@ class Tracking:
         Returns:
             Step: The newly created step object.
         """
-        self.steps += 1
-        return Step(name=name, message_input=message_input)
+        return self._start_step(name, message_input)
+
+    def step(self, name: str, kind: StepType = StepType.OTHER, message_input: str = "") -> "_StepContext":
+        """
+        Starts a step to use in a `with` block, the step is closed and added to the tracking when the block ends.
+
+        The duration is measured with a monotonic clock. If the block raises, the exception is added as an error
+        of the step (and raised again). The step is successfull if the block didn't raise and no error was added.
+
+        Inside the block this is the current step (see `get_current_step`): steps started in the block, also from
+        asyncio tasks created in it, are linked to it with `step_id_prev`. Threads don't inherit the current step,
+        submit with `contextvars.copy_context().run` to keep it.
+
+        Args:
+            name (str): Name of this step.
+            kind (StepType, optional): Type of the step. Defaults to StepType.OTHER.
+            message_input (str, optional): Message received from user or to explain the execution.
+
+        Returns:
+            _StepContext: Context manager, `with` returns the `Step` to fill tokens, costs, tags, etc.
+        """
+        return _StepContext(self, self._start_step(name, message_input), kind)
+
+    def traced(
+        self,
+        func: Optional[Callable] = None,
+        *,
+        name: Optional[str] = None,
+        kind: StepType = StepType.OTHER,
+    ) -> Callable:
+        """
+        Decorator that runs each call of the function inside `tracking.step(...)`.
+
+        Use it as `@tracking.traced` or `@tracking.traced(name="retrieve", kind=StepType.TOKEN)`.
+        Coroutine functions are supported.
+
+        Args:
+            func (Callable, optional): Function to decorate.
+            name (str, optional): Name of the steps. Defaults to the qualified name of the function.
+            kind (StepType, optional): Type of the steps. Defaults to StepType.OTHER.
+        """
+        def decorator(func: Callable) -> Callable:
+            step_name = name or func.__qualname__
+
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.step(step_name, kind=kind):
+                        return await func(*args, **kwargs)
+
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.step(step_name, kind=kind):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        if func is not None:
+            return decorator(func)
+
+        return decorator
+
+    def _start_step(self, name: str, message_input: str) -> Step:
+        """
+        Creates a step and links it to the current step of this tracking, if any.
+        """
+        step = Step(name=name, message_input=message_input)
+        context = _current_step_context.get()
+        with self._lock:
+            self.steps += 1
+            if context is not None and context.tracking is self:
+                parent = context.step
+                # the parent gets an id only when it has children, payloads of flat trackings don't change
+                if parent.step_id == "":
+                    parent.step_id = os.urandom(16).hex()
+                step.step_id_prev = parent.step_id
+
+        return step
+
+    def _add_step(self, step: Step) -> None:
+        # list.append is atomic, no lock needed
+        self.step_list.append(step)
 
     def close_step_token(
         self,
@@ -383,13 +545,10 @@ class Tracking:
         step.cost.token_output = token_output_cost
         step.cost.token_total = token_total_cost
 
-        step.date_end = self.hf.get_date_for_api()
-        step.duration_in_ms = self.hf.get_dif_ms(
-            step.date_start, step.date_end
-        )
+        step.close()
         step.successfull = successfull
 
-        self.step_list.append(step)
+        self._add_step(step)
 
     def close_step_video(
         self,
@@ -428,11 +587,10 @@ class Tracking:
         step.video.sec_videos = video_sec
         step.video.size_videos = video_size
         step.cost.videos = video_cost
-        step.date_end = self.hf.get_date_for_api()
-        step.duration_in_ms = self.hf.get_dif_ms(step.date_start, step.date_end)
+        step.close()
         step.successfull = successfull
 
-        self.step_list.append(step)
+        self._add_step(step)
 
     def close_step_audio(
         self,
@@ -471,11 +629,10 @@ class Tracking:
         step.audio.sec_audio = audio_sec
         step.audio.size_audio = audio_size
         step.cost.audio = audio_cost
-        step.date_end = self.hf.get_date_for_api()
-        step.duration_in_ms = self.hf.get_dif_ms(step.date_start, step.date_end)
+        step.close()
         step.successfull = successfull
 
-        self.step_list.append(step)
+        self._add_step(step)
 
     def close_step_image(
         self,
@@ -511,11 +668,10 @@ class Tracking:
         step.image.num_images = image_num
         step.image.size_images = image_size
         step.cost.images = image_cost
-        step.date_end = self.hf.get_date_for_api()
-        step.duration_in_ms = self.hf.get_dif_ms(step.date_start, step.date_end)
+        step.close()
         step.successfull = successfull
 
-        self.step_list.append(step)
+        self._add_step(step)
 
     def close_step_doc(
         self,
@@ -557,11 +713,10 @@ class Tracking:
         step.doc.size_docs = doc_size
         step.doc.num_char = doc_char
         step.cost.docs = doc_cost
-        step.date_end = self.hf.get_date_for_api()
-        step.duration_in_ms = self.hf.get_dif_ms(step.date_start, step.date_end)
+        step.close()
         step.successfull = successfull
 
-        self.step_list.append(step)
+        self._add_step(step)
 
     def close_step_others(
         self,
@@ -591,11 +746,10 @@ class Tracking:
         step.message_output = message_output
         step.step_type = StepType.OTHER
         step.cost.others = others_cost
-        step.date_end = self.hf.get_date_for_api()
-        step.duration_in_ms = self.hf.get_dif_ms(step.date_start, step.date_end)
+        step.close()
         step.successfull = successfull
 
-        self.step_list.append(step)
+        self._add_step(step)
 
     def close_step_score(
         self,
@@ -627,16 +781,128 @@ class Tracking:
         step.cost.others = others_cost
         step.successfull = successfull
 
-        self.step_list.append(step)
+        self._add_step(step)
 
     def __str__(self) -> str:
         return f"Agent/Model: {self.name}, Steps: {self.steps}"
 
-    def __getitem__(self, key: str) -> Any:
-        return self.__dict__[key]
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class _StepContext:
+    """
+    Returned by `Tracking.step`, closes the step when the `with` block ends.
+    """
+
+    __slots__ = ("tracking", "step", "kind", "context_token")
+
+    def __init__(self, tracking: Tracking, step: Step, kind: StepType):
+        self.tracking = tracking
+        self.step = step
+        self.kind = kind
+        self.context_token = None
+
+    def __enter__(self) -> Step:
+        self.context_token = _current_step_context.set(self)
+        return self.step
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        _current_step_context.reset(self.context_token)
+        step = self.step
+        if exc is not None:
+            step.add_error(id=exc_type.__name__, message=str(exc), kind=ErrOrWarnKind.INTERNAL_CONTROLLED)
+
+        step.step_type = self.kind
+        step.successfull = step.num_errors == 0
+        step.close()
+        self.tracking._add_step(step)
 
-    def __getattr__(self, key: str) -> Any:
-        return self.__dict__[key]
+        return False
 
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.__dict__.get(key, default)
\ No newline at end of file
+
+# step of the innermost `with tracking.step(...)` block, each thread and asyncio task sees its own
+_current_step_context: ContextVar[Optional[_StepContext]] = ContextVar("enola_current_step", default=None)
+
+
+def get_current_tracking() -> Optional[Tracking]:
+    """
+    Returns the tracking of the innermost `with tracking.step(...)` block (or traced function), None outside them.
+    """
+    context = _current_step_context.get()
+    return context.tracking if context is not None else None
+
+
+def get_current_step() -> Optional[Step]:
+    """
+    Returns the step of the innermost `with tracking.step(...)` block (or traced function), None outside them.
+    """
+    context = _current_step_context.get()
+    return context.step if context is not None else None
+
+
+class AsyncTracking(Tracking):
+    """
+    Asyncio version of `Tracking`, `execute` is a coroutine.
+
+    HTTP calls run outside the event loop and retries wait with `asyncio.sleep`,
+    so it can be used from async agent servers without freezing them.
+
+    **Example usage:**
+
+    ```python
+    tracking = AsyncTracking(token='your_jwt_token', name='ExecutionName')
+    await tracking.execute(successfull=True)
+    ```
+    """
+
+    async def execute(
+        self,
+        successfull: bool,
+        message_output: str = "",
+        num_iteratons: int = 0,
+        score_value: float = 0,
+        score_group: str = "",
+        score_cluster: str = "",
+        score_date: str = "",
+        external_id: str = "",
+    ) -> bool:
+        """
+        Registers tracking in the Enola server.
+
+        Args:
+            successfull (bool): True for your Agent execution OK, false for error in your Agent execution.
+            message_output (str, optional): Message to user or to explain the execution results.
+            num_iteratons (int, optional): Number of iterations.
+            score_value (float, optional): Score value.
+            score_group (str, optional): Score group.
+            score_cluster (str, optional): Score cluster.
+            score_date (str, optional): Date of score in ISO & UTC format (e.g., 'yyyy-MM-ddTHH:mm:ss:SSSz'). Empty for current date.
+            external_id (str, optional): External unique identifier.
+
+        Returns:
+            bool: True if execution was successful, False otherwise.
+        """
+        tracking_model = self._close_tracking(
+            successfull=successfull,
+            message_output=message_output,
+            num_iteratons=num_iteratons,
+            score_value=score_value,
+            score_group=score_group,
+            score_cluster=score_cluster,
+            score_date=score_date,
+            external_id=external_id,
+        )
+
+        enola_result = await create_tracking_async(
+            tracking_model=tracking_model,
+            connection=self.connection,
+            raise_error_if_fail=True,
+        )
+        return self._apply_result(enola_result)
@@ -1,7 +1,22 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from enola.base.common import huemul_json
 from enola.base.common.huemul_functions import HuemulFunctions
+from enola.base.internal.tracking_batch.enola_tracking_batch_checkpoint import (
+    EnolaTrackingBatchCheckpoint,
+)
+from enola.base.internal.tracking_batch.enola_tracking_batch_sizer import (
+    EnolaTrackingBatchSizer,
+)
+from enola.base.internal.tracking_batch.enola_tracking_batch_source import (
+    EnolaTrackingBatchSource,
+)
 from enola.base.internal.tracking_batch.enola_tracking_batch import (
     create_tracking,
+    create_tracking_async,
     create_tracking_batch_head,
+    create_tracking_batch_head_async,
 )
 from enola.base.common.auth.auth_model import AuthModel
 from enola.enola_types import (
@@ -11,18 +26,39 @@ from enola.enola_types import (
     DataType,
     ErrOrWarnKind,
     Info,
-    TokenInfo,
     TrackingBatchHeadModel,
     TrackingModel,
     TrackingResponseModel,
     Step,
     StepType,
 )
-from enola.base.connect import Connect
-from typing import List, Optional
-
-
-class TrackingBatch:
+from enola.base.connect_registry import get_connect_registry
+from enola.base.common.huemul_retry_policy import HuemulRetryPolicy
+from enola.base.common.huemul_mapping import HuemulMapping
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+
+# (TrackingBatch attribute with the column name, key in tracking JSON, True if the key belongs to the step)
+_COLUMN_MAPPING = [
+    ("score_cluster_column_name", "agentExecScoreCluster", True),
+    ("score_group_column_name", "agentExecScoreGroup", True),
+    ("score_value_column_name", "agentExecScoreValue", True),
+    ("client_id_column_name", "client_id", False),
+    ("product_id_column_name", "product_id", False),
+    ("channel_id_column_name", "channel_id", False),
+    ("channel_name_column_name", "channel_name", False),
+    ("session_id_column_name", "session_id", False),
+    ("session_name_column_name", "session_name", False),
+    ("user_id_column_name", "user_id", False),
+    ("user_name_column_name", "user_name", False),
+    ("app_id_column_name", "app_id", False),
+    ("app_name_column_name", "app_name", False),
+    ("ip_column_name", "ip", False),
+    ("external_id_column_name", "code_api", False),
+]
+
+
+class TrackingBatch(HuemulMapping):
     """
     The `TrackingBatch` class is used to perform batch tracking execution in Enola.
 
@@ -30,6 +66,10 @@ class TrackingBatch:
     dataframes by sending them in batches. It manages authentication, data preparation,
     and communication with the Enola API.
 
+    Besides a DataFrame, `dataframe` accepts the path of a CSV/Parquet file, an iterator of
+    DataFrames or an iterator of dicts; rows are read in chunks while they are uploaded,
+    so files bigger than memory can be sent.
+
     Example usage:
 
     ```python
@@ -82,6 +122,14 @@ class TrackingBatch:
         channel_name: str = "",
         ip: Optional[str] = None,
         is_test: bool = False,
+        total_rows: Optional[int] = None,
+        read_chunk_size: int = 10000,
+        retry_policy: Optional[HuemulRetryPolicy] = None,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 60.0,
+        deadline: Optional[float] = None,
+        compression: Optional[str] = None,
+        compression_threshold: int = 1024,
     ):
         """
         Initializes a new instance of the TrackingBatch class.
@@ -89,7 +137,7 @@ class TrackingBatch:
         Args:
             token (str): JWT token used to identify the agent. Request this from the Admin App.
             name (str): Name of this execution.
-            dataframe: Pandas DataFrame containing the data to track.
+            dataframe: Pandas DataFrame containing the data to track, path of a CSV or Parquet file, iterator of DataFrames or iterator of dicts (one per row).
             period (str): Period of this execution in ISO format (e.g., '2021-01-01T00:00:00Z').
             client_id_column_name (str): Name of the column with client ID.
             product_id_column_name (str): Name of the column with product ID.
@@ -116,6 +164,14 @@ class TrackingBatch:
             channel_name (str, optional): Name of the communication channel.
             ip (str, optional): IP address of the user or application.
             is_test (bool, optional): True if this call is for testing purposes.
+            total_rows (int, optional): Number of rows in `dataframe`. Required for iterators, taken from the data otherwise.
+            read_chunk_size (int, optional): Rows read at a time from files and iterators. Defaults to 10000.
+            retry_policy (HuemulRetryPolicy, optional): Retries of failed calls to the server. Defaults to exponential backoff with jitter, 5 attempts.
+            connect_timeout (float, optional): Max seconds to open a connection to the server. Defaults to 10.
+            read_timeout (float, optional): Max seconds waiting for data from the server. Defaults to 60.
+            deadline (float, optional): Max seconds for each call to the server, including retries. When exceeded the call fails with `HuemulTimeoutError`. Defaults to no limit.
+            compression (str, optional): "gzip" or "zstd" (needs `zstandard`) to compress the data sent to the server. Defaults to no compression.
+            compression_threshold (int, optional): Min size in bytes of the data to compress it. Defaults to 1024.
         """
         self.name = name
         self.hf = HuemulFunctions()
@@ -139,7 +195,11 @@ class TrackingBatch:
 
         if dataframe is None:
             raise Exception("DataFrame is empty")
-        if len(dataframe) == 0:
+        self.source = EnolaTrackingBatchSource(
+            data=dataframe, total_rows=total_rows, read_chunk_size=read_chunk_size
+        )
+        self.total_rows = self.source.total_rows
+        if self.total_rows == 0:
             raise Exception("DataFrame is empty (length is 0)")
         if score_value_column_name is None and score_group_column_name is None and score_cluster_column_name is None:
             raise Exception(
@@ -149,7 +209,7 @@ class TrackingBatch:
             raise Exception("Period is empty")
 
         # Decode JWT token
-        self.token_info = TokenInfo(token=token)
+        self.token_info = get_connect_registry().get_token_info(token)
 
         if not self.token_info.is_service_account:
             raise Exception(
@@ -163,12 +223,18 @@ class TrackingBatch:
             raise Exception("This service account can't execute tracking")
 
         self.agent_deploy_id = self.token_info.agent_deploy_id
-        self.connection = Connect(
+        self.connection = get_connect_registry().connect(
             AuthModel(
                 jwt_token=token,
                 url_service=self.token_info.service_account_url_backend,
                 org_id=self.token_info.org_id,
-            )
+            ),
+            retry_policy=retry_policy,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            deadline=deadline,
+            compression=compression,
+            compression_threshold=compression_threshold,
         )
 
         # User information
@@ -276,319 +342,582 @@ class TrackingBatch:
         """
         self.first_step.add_warning(id=id, message=message, kind=kind)
 
-    def execute(self, batch_size: int = 200) -> List[TrackingResponseModel]:
+    def execute(
+        self,
+        batch_size: int = 200,
+        max_workers: int = 1,
+        max_in_flight: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False,
+        max_batch_bytes: Optional[int] = None,
+        target_latency_ms: Optional[float] = None,
+    ) -> List[TrackingResponseModel]:
         """
         Registers the tracking batch in the Enola server.
 
         Args:
-            batch_size (int, optional): Number of records to send per batch. Defaults to 200.
+            batch_size (int, optional): Max number of records to send per batch. Defaults to 200.
+            max_workers (int, optional): Number of batches uploaded at the same time. Defaults to 1 (one after another).
+            max_in_flight (int, optional): Max batches converted and waiting to be confirmed, bounds the memory used. Defaults to `max_workers`.
+            checkpoint_path (str, optional): File where the batch id and the rows acknowledged by the server are saved after each batch. It is deleted when every row was sent.
+            resume (bool, optional): Continue the upload saved in `checkpoint_path`, reusing its batch id and skipping the rows already sent. Defaults to False.
+            max_batch_bytes (int, optional): Max size in bytes of the JSON sent per batch, rows are packed until the next one does not fit.
+            target_latency_ms (float, optional): Adapts the records per batch (up to `batch_size`) to keep each call near this latency, reducing it when the server is slower than the target.
 
         Returns:
-            List[TrackingResponseModel]: List of tracking response models returned by the server.
+            List[TrackingResponseModel]: List of tracking response models returned by the server, in the same order as the dataframe. When resuming, only the rows sent in this call.
         """
+        checkpoint = self._open_checkpoint(checkpoint_path, resume)
+        sizer = EnolaTrackingBatchSizer(
+            max_rows=batch_size,
+            max_bytes=max_batch_bytes,
+            target_latency_ms=target_latency_ms,
+        )
 
         # Create batch
         if self.batch_id == "":
             print(f"{self.name}: sending to server, create Batch... ")
-            tracking_batch_model = TrackingBatchHeadModel(
-                enola_sender=self.enola_sender,
-                period=self.period,
-                total_rows=len(self.dataframe),
-                name=self.name,
-                is_test=self.is_test,
-            )
-
             tracking_batch = create_tracking_batch_head(
-                tracking_batch_model=tracking_batch_model,
+                tracking_batch_model=self._batch_head_model(),
                 connection=self.connection,
                 raise_error_if_fail=False,
             )
-            self.batch_id = tracking_batch.batch_id
-            self.enola_sender.batch_id = self.batch_id
+            self._set_batch_id(tracking_batch.batch_id)
 
         # Start cycle to send all data
         print(f"{self.name}: sending to server, upload... ")
         # Show results
         if self.batch_id == "":
-            print(f"{self.name}: finish with error, batch_id is empty")
+            self.connection.huemul_logging.log_message_error(
+                message=f"{self.name}: batch head not created, batch_id is empty: {tracking_batch.message}"
+            )
             return []
 
-        totalRows = len(self.dataframe)
-        listToSend: List[TrackingModel] = []
-        resultsList: List[TrackingResponseModel] = []
-        # Iterate over the dataframe
-        count_rows = 0
-        for index, row in self.dataframe.iterrows():
-
-            # Create step
-            step = Step(
-                name=self.name if (self.name != "") else "Prediction",
-                message_input="",
+        if checkpoint is not None:
+            checkpoint.start(
+                batch_id=self.batch_id, name=self.name, total_rows=self.total_rows
             )
 
-            # Add data to step in extra info
-            for column in self.dataframe.columns:
-                step.add_extra_info(column, row[column])
-
-            if (
-                self.score_cluster_column_name
-                and self.score_cluster_column_name in self.dataframe.columns
+        resultsList: List[TrackingResponseModel] = []
+        max_workers = max(1, max_workers)
+        max_in_flight = max(max_workers, max_in_flight or max_workers)
+        self.connection.huemul_transport.ensure_pool_size(max_workers)
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="enola-batch"
+        ) as executor:
+            # futures are confirmed in submit order, so results keep the dataframe order
+            pending: Deque[Tuple[int, int, int, Future]] = deque()
+            for chunk_index, (start, end, listToSend, data_in) in enumerate(
+                self._iter_tracking_chunks(sizer, self._pending_ranges(checkpoint))
             ):
-                step.score_cluster = row[self.score_cluster_column_name]
-                step.date_start = self.period
-                step.date_end = self.period
-            elif self.score_cluster_column_name:
-                self.connection.huemul_logging.log_message_error(
-                    message=f"{self.name}: column score_cluster_column_name '{self.score_cluster_column_name}' not found in dataframe"
-                )
-                raise Exception(
-                    f"{self.name}: column score_cluster_column_name '{self.score_cluster_column_name}' not found in dataframe"
-                )
+                # Send to Enola
+                pending.append(
+                    (
+                        chunk_index,
+                        start,
+                        end,
+                        executor.submit(
+                            create_tracking,
+                            tracking_list_model=listToSend,
+                            connection=self.connection,
+                            raise_error_if_fail=False,
+                            data_in=data_in,
+                        ),
+                    )
+                )
+
+                # wait for the oldest batch before converting more rows
+                if len(pending) >= max_in_flight:
+                    chunk_index, start, end, future = pending.popleft()
+                    if not self._add_chunk_results(
+                        future.result(), resultsList, checkpoint, sizer, chunk_index, start, end
+                    ):
+                        self._cancel_pending(pending, checkpoint)
+                        return []
+
+            while pending:
+                chunk_index, start, end, future = pending.popleft()
+                if not self._add_chunk_results(
+                    future.result(), resultsList, checkpoint, sizer, chunk_index, start, end
+                ):
+                    self._cancel_pending(pending, checkpoint)
+                    return []
 
-            if (
-                self.score_group_column_name
-                and self.score_group_column_name in self.dataframe.columns
-            ):
-                step.score_group = row[self.score_group_column_name]
-                step.date_start = self.period
-                step.date_end = self.period
-            elif self.score_group_column_name:
-                self.connection.huemul_logging.log_message_error(
-                    message=f"{self.name}: column score_group_column_name '{self.score_group_column_name}' not found in dataframe"
-                )
-                raise Exception(
-                    f"{self.name}: column score_group_column_name '{self.score_group_column_name}' not found in dataframe"
-                )
+        if checkpoint is not None:
+            checkpoint.remove()
 
-            if (
-                self.score_value_column_name
-                and self.score_value_column_name in self.dataframe.columns
-            ):
-                step.score_value = row[self.score_value_column_name]
-                step.date_start = self.period
-                step.date_end = self.period
-            elif self.score_value_column_name:
-                self.connection.huemul_logging.log_message_error(
-                    message=f"{self.name}: column score_value_column_name '{self.score_value_column_name}' not found in dataframe"
-                )
-                raise Exception(
-                    f"{self.name}: column score_value_column_name '{self.score_value_column_name}' not found in dataframe"
-                )
+        self.connection.huemul_logging.log_message_info(
+            message=f"{self.name} finish OK with batch_id: {self.batch_id}"
+        )
 
-            if (
-                self.client_id_column_name
-                and self.client_id_column_name in self.dataframe.columns
-            ):
-                self.enola_sender.client_id = row[self.client_id_column_name]
-            elif self.client_id_column_name:
-                self.connection.huemul_logging.log_message_error(
-                    message=f"{self.name}: column client_id_column_name '{self.client_id_column_name}' not found in dataframe"
-                )
-                raise Exception(
-                    f"{self.name}: column client_id_column_name '{self.client_id_column_name}' not found in dataframe"
-                )
+        return resultsList
 
-            if (
-                self.product_id_column_name
-                and self.product_id_column_name in self.dataframe.columns
-            ):
-                step.product_id = row[self.product_id_column_name]
-            elif self.product_id_column_name:
-                self.connection.huemul_logging.log_message_error(
-                    message=f"{self.name}: column product_id_column_name '{self.product_id_column_name}' not found in dataframe"
-                )
-                raise Exception(
-                    f"{self.name}: column product_id_column_name '{self.product_id_column_name}' not found in dataframe"
-                )
+    def _batch_head_model(self) -> TrackingBatchHeadModel:
+        """
+        Builds the batch head sent before the rows.
+        """
+        return TrackingBatchHeadModel(
+            enola_sender=self.enola_sender,
+            period=self.period,
+            total_rows=self.total_rows,
+            name=self.name,
+            is_test=self.is_test,
+        )
 
-            if (
-                self.channel_id_column_name
-                and self.channel_id_column_name in self.dataframe.columns
-            ):
-                self.enola_sender.channel_id = row[self.channel_id_column_name]
-            elif self.channel_id_column_name:
-                self.connection.huemul_logging.log_message_error(
-                    message=f"{self.name}: column channel_id_column_name '{self.channel_id_column_name}' not found in dataframe"
-                )
-                raise Exception(
-                    f"{self.name}: column channel_id_column_name '{self.channel_id_column_name}' not found in dataframe"
-                )
+    def _set_batch_id(self, batch_id: str) -> None:
+        self.batch_id = batch_id
+        self.enola_sender.batch_id = self.batch_id
 
-            if (
-                self.channel_name_column_name
-                and self.channel_name_column_name in self.dataframe.columns
-            ):
-                self.enola_sender.channel_name = row[self.channel_name_column_name]
-            elif self.channel_name_column_name:
-                self.connection.huemul_logging.log_message_error(
-                    message=f"{self.name}: column channel_name_column_name '{self.channel_name_column_name}' not found in dataframe"
-                )
-                raise Exception(
-                    f"{self.name}: column channel_name_column_name '{self.channel_name_column_name}' not found in dataframe"
-                )
+    def _open_checkpoint(
+        self, checkpoint_path: Optional[str], resume: bool
+    ) -> Optional[EnolaTrackingBatchCheckpoint]:
+        """
+        Opens the checkpoint file, when resuming reuses its batch id.
+        """
+        # each run creates a new batch, only a resumed checkpoint reuses the batch id of a previous run
+        self._set_batch_id("")
+        if checkpoint_path is None:
+            if resume:
+                raise Exception(f"{self.name}: resume needs a checkpoint_path")
+            return None
+
+        checkpoint = EnolaTrackingBatchCheckpoint(checkpoint_path)
+        if not resume or not checkpoint.load():
+            return checkpoint
+
+        if checkpoint.total_rows != self.total_rows:
+            self.connection.huemul_logging.log_message_error(
+                message=f"{self.name}: checkpoint {checkpoint_path} has {checkpoint.total_rows} rows, dataframe has {self.total_rows}"
+            )
+            raise Exception(
+                f"{self.name}: checkpoint {checkpoint_path} has {checkpoint.total_rows} rows, dataframe has {self.total_rows}"
+            )
 
-            if (
-                self.session_id_column_name
-                and self.session_id_column_name in self.dataframe.columns
-            ):
-                self.enola_sender.session_id = row[self.session_id_column_name]
-            elif self.session_id_column_name:
-                self.connection.huemul_logging.log_message_error(
-                    message=f"{self.name}: column session_id_column_name '{self.session_id_column_name}' not found in dataframe"
-                )
-                raise Exception(
-                    f"{self.name}: column session_id_column_name '{self.session_id_column_name}' not found in dataframe"
-                )
+        self._set_batch_id(checkpoint.batch_id)
+        self.connection.huemul_logging.log_message_info(
+            message=f"{self.name} resuming batch_id: {self.batch_id}, {checkpoint.sent_rows} of {checkpoint.total_rows} already sent"
+        )
+        return checkpoint
 
-            if (
-                self.session_name_column_name
-                and self.session_name_column_name in self.dataframe.columns
-            ):
-                self.enola_sender.session_name = row[self.session_name_column_name]
-            elif self.session_name_column_name:
-                self.connection.huemul_logging.log_message_error(
-                    message=f"{self.name}: column session_name_column_name '{self.session_name_column_name}' not found in dataframe"
-                )
-                raise Exception(
-                    f"{self.name}: column session_name_column_name '{self.session_name_column_name}' not found in dataframe"
-                )
+    def _pending_ranges(
+        self, checkpoint: Optional[EnolaTrackingBatchCheckpoint]
+    ) -> List[Tuple[int, int]]:
+        """
+        Row ranges `[start, end)` to send, all the dataframe without checkpoint.
+        """
+        if checkpoint is None:
+            return [(0, self.total_rows)]
 
-            if (
-                self.user_id_column_name
-                and self.user_id_column_name in self.dataframe.columns
-            ):
-                self.enola_sender.user_id = row[self.user_id_column_name]
-            elif self.user_id_column_name:
-                self.connection.huemul_logging.log_message_error(
-                    message=f"{self.name}: column user_id_column_name '{self.user_id_column_name}' not found in dataframe"
-                )
-                raise Exception(
-                    f"{self.name}: column user_id_column_name '{self.user_id_column_name}' not found in dataframe"
-                )
+        return checkpoint.pending_ranges(self.total_rows)
 
-            if (
-                self.user_name_column_name
-                and self.user_name_column_name in self.dataframe.columns
-            ):
-                self.enola_sender.user_name = row[self.user_name_column_name]
-            elif self.user_name_column_name:
-                self.connection.huemul_logging.log_message_error(
-                    message=f"{self.name}: column user_name_column_name '{self.user_name_column_name}' not found in dataframe"
-                )
-                raise Exception(
-                    f"{self.name}: column user_name_column_name '{self.user_name_column_name}' not found in dataframe"
-                )
+    def _cancel_pending(
+        self,
+        pending: Deque,
+        checkpoint: Optional[EnolaTrackingBatchCheckpoint] = None,
+    ) -> None:
+        """
+        Cancels the batches not yet sent after a batch failed.
 
-            if (
-                self.app_id_column_name
-                and self.app_id_column_name in self.dataframe.columns
-            ):
-                self.enola_sender.app_id = row[self.app_id_column_name]
-            elif self.app_id_column_name:
-                self.connection.huemul_logging.log_message_error(
-                    message=f"{self.name}: column app_id_column_name '{self.app_id_column_name}' not found in dataframe"
-                )
-                raise Exception(
-                    f"{self.name}: column app_id_column_name '{self.app_id_column_name}' not found in dataframe"
-                )
+        With checkpoint, batches already running are awaited and saved if the server acknowledged them,
+        so resuming does not send them again.
+        """
+        for _, start, end, future in pending:
+            if future.cancel() or checkpoint is None:
+                continue
 
-            if (
-                self.app_name_column_name
-                and self.app_name_column_name in self.dataframe.columns
-            ):
-                self.enola_sender.app_name = row[self.app_name_column_name]
-            elif self.app_name_column_name:
-                self.connection.huemul_logging.log_message_error(
-                    message=f"{self.name}: column app_name_column_name '{self.app_name_column_name}' not found in dataframe"
-                )
-                raise Exception(
-                    f"{self.name}: column app_name_column_name '{self.app_name_column_name}' not found in dataframe"
-                )
+            tracking_batch = future.result()
+            if tracking_batch.successfull:
+                checkpoint.mark_sent(start, end)
+        pending.clear()
 
-            if (
-                self.ip_column_name
-                and self.ip_column_name in self.dataframe.columns
-            ):
-                self.enola_sender.ip = row[self.ip_column_name]
-            elif self.ip_column_name:
-                self.connection.huemul_logging.log_message_error(
-                    message=f"{self.name}: column ip_column_name '{self.ip_column_name}' not found in dataframe"
-                )
-                raise Exception(
-                    f"{self.name}: column ip_column_name '{self.ip_column_name}' not found in dataframe"
-                )
+    async def _cancel_pending_async(
+        self,
+        pending: Deque,
+        checkpoint: Optional[EnolaTrackingBatchCheckpoint] = None,
+    ) -> None:
+        """
+        Async version of `_cancel_pending`.
 
-            if (
-                self.external_id_column_name
-                and self.external_id_column_name in self.dataframe.columns
-            ):
-                self.enola_sender.external_id = row[self.external_id_column_name]
-            elif self.external_id_column_name:
-                self.connection.huemul_logging.log_message_error(
-                    message=f"{self.name}: column external_id_column_name '{self.external_id_column_name}' not found in dataframe"
-                )
-                raise Exception(
-                    f"{self.name}: column external_id_column_name '{self.external_id_column_name}' not found in dataframe"
-                )
+        All the batches in `pending` were already sent, with checkpoint they are awaited and saved
+        if the server acknowledged them, so resuming does not send them again.
+        """
+        if checkpoint is None:
+            self._save_done_and_cancel(pending, checkpoint)
+            return
 
-            step.step_type = StepType.SCORE
-            step.successfull = True
-            step.set_score(
-                value=step.score_value,
-                group=step.score_group,
-                cluster=step.score_cluster,
-                date=step.date_start,
+        results = await asyncio.gather(
+            *(future for _, _, _, future in pending), return_exceptions=True
+        )
+        for (_, start, end, _), tracking_batch in zip(pending, results):
+            if not isinstance(tracking_batch, BaseException) and tracking_batch.successfull:
+                checkpoint.mark_sent(start, end)
+        pending.clear()
+
+    def _save_done_and_cancel(
+        self,
+        pending: Deque,
+        checkpoint: Optional[EnolaTrackingBatchCheckpoint],
+    ) -> None:
+        """
+        Saves in the checkpoint the finished batches acknowledged by the server and cancels the others.
+        """
+        for _, start, end, future in pending:
+            if not future.done():
+                future.cancel()
+            elif checkpoint is not None and not future.cancelled() and future.exception() is None:
+                if future.result().successfull:
+                    checkpoint.mark_sent(start, end)
+        pending.clear()
+
+    def _add_chunk_results(
+        self,
+        tracking_batch,
+        resultsList: List[TrackingResponseModel],
+        checkpoint: Optional[EnolaTrackingBatchCheckpoint],
+        sizer: EnolaTrackingBatchSizer,
+        chunk_index: int,
+        start: int,
+        end: int,
+    ) -> bool:
+        """
+        Adds the response of chunk `chunk_index` (rows `[start, end)`) to the results, saves them in the checkpoint
+        and adapts the batch size to the latency of the call.
+
+        Returns:
+            bool: False if the chunk failed.
+        """
+        if not tracking_batch.successfull:
+            self.connection.huemul_logging.log_message_error(
+                message=f"{self.name}: chunk {chunk_index} (rows {start} to {end - 1}) failed: {tracking_batch.message}"
             )
+            if checkpoint is not None:
+                print(f"{self.name}: sent rows saved in {checkpoint.path}, run again with resume=True to continue")
+            return False
+
+        resultsList.extend(tracking_batch.tracking_list)
+        sizer.observe(
+            num_rows=end - start,
+            round_trip_ms=tracking_batch.get("round_trip_ms", -1),
+            elapsed_time_ms=tracking_batch.get("elapsed_time_ms", -1),
+        )
+        sent_rows = len(resultsList)
+        if checkpoint is not None:
+            checkpoint.mark_sent(start, end)
+            sent_rows = checkpoint.sent_rows
 
-            # Create tracking model
-            tracking_model = TrackingModel(
-                isTest=self.is_test,
-                enola_sender=self.enola_sender,
-                enola_id_prev="",
-                steps=1,
-                step_list=[step],
+        self.connection.huemul_logging.log_message_info(
+            message=f"{self.name} sent {sent_rows} of {self.total_rows}..."
+        )
+        return True
+
+    def _iter_tracking_chunks(
+        self, sizer: EnolaTrackingBatchSizer, ranges: List[Tuple[int, int]]
+    ) -> Iterator[Tuple[int, int, List[Dict[str, Any]], bytes]]:
+        """
+        Converts the rows to tracking payloads, in chunks sized by `sizer`.
+
+        Rows are read from the source in chunks and only the ones waiting to be sent are kept.
+        The column mapping is validated once and rows are converted column-wise to
+        Python values, building the JSON dicts directly instead of `Step`/`Info` objects per cell.
+        Each row is serialized once, its size decides the chunk it goes in and the chunk body
+        is joined from the serialized rows.
+
+        Yields:
+            Tuple: start row, end row (excluded), the payload of the chunk and its JSON body.
+        """
+        columns: Optional[List[str]] = None
+        step_template, tracking_template = self._payload_templates()
+
+        # rows converted but not sent yet: (payload, json), first one is row `start`
+        buffer: Deque[Tuple[Dict[str, Any], bytes]] = deque()
+        start = 0
+        for position, frame in self.source.iter_frames(ranges):
+            if columns is None:
+                columns = list(frame.columns)
+                known_columns = set(columns)
+                step_mapping, sender_mapping = self._column_mapping(columns)
+            else:
+                # iterators of dicts can bring new keys in later chunks, they are sent as extra info too
+                new_columns = [column for column in frame.columns if column not in known_columns]
+                columns.extend(new_columns)
+                known_columns.update(new_columns)
+
+            # a chunk can't cross rows already sent
+            if position != start + len(buffer):
+                yield from self._take_chunks(buffer, sizer, start, final=True)
+                start = position
+
+            payload = self._frame_to_payload(
+                frame=frame,
+                columns=columns,
+                step_mapping=step_mapping,
+                sender_mapping=sender_mapping,
+                step_template=step_template,
+                tracking_template=tracking_template,
             )
+            buffer.extend((row, huemul_json.dumps(row)) for row in payload)
 
-            # Add to list
-            listToSend.append(tracking_model)
+            for chunk in self._take_chunks(buffer, sizer, start, final=False):
+                yield chunk
+                start = chunk[1]
 
-            # Send in batches
-            if len(listToSend) == batch_size or count_rows == totalRows - 1:
-                # Send to Enola
-                tracking_batch = create_tracking(
-                    tracking_list_model=listToSend,
-                    connection=self.connection,
-                    raise_error_if_fail=False,
-                )
+        yield from self._take_chunks(buffer, sizer, start, final=True)
 
-                if not tracking_batch.successfull:
-                    print(f"{self.name}: finish with error, batch_id is empty")
-                    return []
+        if self.source.has_extra_rows:
+            self.connection.huemul_logging.logMessageWarn(
+                message=f"{self.name}: data has more rows than total_rows ({self.total_rows}), rows after it were not sent"
+            )
+
+    def _take_chunks(
+        self,
+        buffer: Deque[Tuple[Dict[str, Any], bytes]],
+        sizer: EnolaTrackingBatchSizer,
+        start: int,
+        final: bool,
+    ) -> Iterator[Tuple[int, int, List[Dict[str, Any]], bytes]]:
+        """
+        Takes full chunks from the rows in `buffer`, the first one being row `start`.
 
-                resultsList.extend(tracking_batch.tracking_list)
+        Args:
+            final (bool): True to also send the rows left when they don't fill a chunk.
+        """
+        while buffer:
+            # count rows that fit before taking them, a partial chunk waits for more rows
+            numRows = 0
+            numBytes = 1
+            for _, rowJson in buffer:
+                if not sizer.fits(numRows, numBytes, len(rowJson)):
+                    break
+                numRows += 1
+                numBytes += len(rowJson) + 1
+            else:
+                if not final:
+                    return
+
+            if sizer.max_bytes is not None and numBytes > sizer.max_bytes:
                 self.connection.huemul_logging.log_message_info(
-                    message=f"{self.name} sent {len(resultsList)} of {totalRows}..."
+                    message=f"{self.name}: row {start} needs {numBytes} bytes, more than max_batch_bytes {sizer.max_bytes}"
                 )
 
-                # Clean and continue
-                listToSend = []
+            listToSend: List[Dict[str, Any]] = []
+            rowsJson: List[bytes] = []
+            for _ in range(numRows):
+                row, rowJson = buffer.popleft()
+                listToSend.append(row)
+                rowsJson.append(rowJson)
 
-            count_rows += 1
+            yield start, start + numRows, listToSend, b"[" + b",".join(rowsJson) + b"]"
+            start += numRows
 
-        self.connection.huemul_logging.log_message_info(
-            message=f"{self.name} finish OK with batch_id: {self.batch_id}"
+    def _column_mapping(self, columns: List[str]) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """
+        Validates that every mapped column exists in the data.
+
+        Returns:
+            Tuple: (step key, column) and (tracking key, column) pairs to copy from each row.
+        """
+        step_mapping: List[Tuple[str, str]] = []
+        sender_mapping: List[Tuple[str, str]] = []
+        for attribute_name, payload_key, is_step in _COLUMN_MAPPING:
+            column_name = getattr(self, attribute_name)
+            if not column_name:
+                continue
+
+            if column_name not in columns:
+                self.connection.huemul_logging.log_message_error(
+                    message=f"{self.name}: column {attribute_name} '{column_name}' not found in dataframe"
+                )
+                raise Exception(
+                    f"{self.name}: column {attribute_name} '{column_name}' not found in dataframe"
+                )
+
+            if is_step:
+                step_mapping.append((payload_key, column_name))
+            else:
+                sender_mapping.append((payload_key, column_name))
+
+        return step_mapping, sender_mapping
+
+    def _payload_templates(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Builds the step and tracking JSON shared by every row, rows only override mapped values.
+        """
+        step = Step(
+            name=self.name if (self.name != "") else "Prediction",
+            message_input="",
+        )
+        step.step_type = StepType.SCORE
+        step.successfull = True
+        step.date_start = self.period
+        step.date_end = self.period
+
+        tracking_model = TrackingModel(
+            is_test=self.is_test,
+            enola_sender=self.enola_sender,
+            enola_id_prev="",
+            steps=1,
+            step_list=[],
         )
 
-        return resultsList
+        return step.to_json(), tracking_model.to_json()
+
+    def _frame_to_payload(
+        self,
+        frame,
+        columns: List[str],
+        step_mapping: List[Tuple[str, str]],
+        sender_mapping: List[Tuple[str, str]],
+        step_template: Dict[str, Any],
+        tracking_template: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """
+        Converts a chunk of rows to tracking JSON dicts.
+        """
+        # python native values, one list per column, columns missing in this chunk are None
+        values = {
+            column: frame[column].tolist() if column in frame.columns else [None] * len(frame)
+            for column in columns
+        }
+        extra_info_columns = [(column, values[column]) for column in columns]
+
+        payload: List[Dict[str, Any]] = []
+        for i in range(len(frame)):
+            step = dict(step_template)
+            step["extraInfo"] = [
+                {"type": "info", "key": column, "value": column_values[i]}
+                for column, column_values in extra_info_columns
+            ]
+            for payload_key, column_name in step_mapping:
+                step[payload_key] = values[column_name][i]
+
+            tracking = dict(tracking_template)
+            for payload_key, column_name in sender_mapping:
+                tracking[payload_key] = values[column_name][i]
+            tracking["step_list"] = [step]
+
+            payload.append(tracking)
+
+        return payload
 
     def __str__(self) -> str:
         return f"Agent/Model: {self.name}"
 
-    def __getitem__(self, key):
-        return self.__dict__[key]
 
-    def __getattr__(self, key):
-        return self.__dict__[key]
+class AsyncTrackingBatch(TrackingBatch):
+    """
+    Asyncio version of `TrackingBatch`, `execute` is a coroutine.
+
+    HTTP calls run outside the event loop and retries wait with `asyncio.sleep`,
+    so it can be used from async servers without freezing them.
+
+    Example usage:
+
+    ```python
+    tracking_batch = AsyncTrackingBatch(token="your_jwt_token", name="BatchExecutionName", ...)
+    results = await tracking_batch.execute()
+    ```
+    """
+
+    async def execute(
+        self,
+        batch_size: int = 200,
+        max_in_flight: int = 1,
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False,
+        max_batch_bytes: Optional[int] = None,
+        target_latency_ms: Optional[float] = None,
+    ) -> List[TrackingResponseModel]:
+        """
+        Registers the tracking batch in the Enola server.
+
+        Args:
+            batch_size (int, optional): Max number of records to send per batch. Defaults to 200.
+            max_in_flight (int, optional): Batches uploaded at the same time, bounds the memory used. Defaults to 1 (one after another).
+            checkpoint_path (str, optional): File where the batch id and the rows acknowledged by the server are saved after each batch. It is deleted when every row was sent.
+            resume (bool, optional): Continue the upload saved in `checkpoint_path`, reusing its batch id and skipping the rows already sent. Defaults to False.
+            max_batch_bytes (int, optional): Max size in bytes of the JSON sent per batch, rows are packed until the next one does not fit.
+            target_latency_ms (float, optional): Adapts the records per batch (up to `batch_size`) to keep each call near this latency, reducing it when the server is slower than the target.
+
+        Returns:
+            List[TrackingResponseModel]: List of tracking response models returned by the server, in the same order as the dataframe. When resuming, only the rows sent in this call.
+        """
+        checkpoint = self._open_checkpoint(checkpoint_path, resume)
+        sizer = EnolaTrackingBatchSizer(
+            max_rows=batch_size,
+            max_bytes=max_batch_bytes,
+            target_latency_ms=target_latency_ms,
+        )
+
+        if self.batch_id == "":
+            tracking_batch = await create_tracking_batch_head_async(
+                tracking_batch_model=self._batch_head_model(),
+                connection=self.connection,
+                raise_error_if_fail=False,
+            )
+            self._set_batch_id(tracking_batch.batch_id)
+
+        if self.batch_id == "":
+            self.connection.huemul_logging.log_message_error(
+                message=f"{self.name}: batch head not created, batch_id is empty: {tracking_batch.message}"
+            )
+            return []
 
-    def get(self, key, default=None):
-        return self.__dict__.get(key, default)
+        if checkpoint is not None:
+            checkpoint.start(
+                batch_id=self.batch_id, name=self.name, total_rows=self.total_rows
+            )
+
+        resultsList: List[TrackingResponseModel] = []
+        max_in_flight = max(1, max_in_flight)
+        self.connection.huemul_transport.ensure_pool_size(max_in_flight)
+
+        pending: Deque[Tuple[int, int, int, asyncio.Future]] = deque()
+        try:
+            for chunk_index, (start, end, listToSend, data_in) in enumerate(
+                self._iter_tracking_chunks(sizer, self._pending_ranges(checkpoint))
+            ):
+                pending.append(
+                    (
+                        chunk_index,
+                        start,
+                        end,
+                        asyncio.ensure_future(
+                            create_tracking_async(
+                                tracking_list_model=listToSend,
+                                connection=self.connection,
+                                raise_error_if_fail=False,
+                                data_in=data_in,
+                            )
+                        ),
+                    )
+                )
+
+                if len(pending) >= max_in_flight:
+                    chunk_index, start, end, future = pending.popleft()
+                    if not self._add_chunk_results(
+                        await future, resultsList, checkpoint, sizer, chunk_index, start, end
+                    ):
+                        await self._cancel_pending_async(pending, checkpoint)
+                        return []
+
+            while pending:
+                chunk_index, start, end, future = pending.popleft()
+                if not self._add_chunk_results(
+                    await future, resultsList, checkpoint, sizer, chunk_index, start, end
+                ):
+                    await self._cancel_pending_async(pending, checkpoint)
+                    return []
+        except asyncio.CancelledError:
+            # execute was cancelled, saves the batches already acknowledged before giving up on the rest
+            self._save_done_and_cancel(pending, checkpoint)
+            raise
+
+        if checkpoint is not None:
+            checkpoint.remove()
+
+        self.connection.huemul_logging.log_message_info(
+            message=f"{self.name} finish OK with batch_id: {self.batch_id}"
+        )
+
+        return resultsList
@@ -0,0 +1,119 @@
+"""
+Overhead of `tracking.step()`, `@tracking.traced` and `Step()`, nothing is sent to the server.
+
+    python test/bench_steps.py [--steps 100000] [--repeat 5]
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import jwt
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from enola.enola_types import Step  # noqa: E402
+from enola.tracking import Tracking  # noqa: E402
+
+
+def _token():
+    # never used to call the server
+    return jwt.encode(
+        {
+            "agentDeployId": "A1",
+            "orgId": "O1",
+            "url": "http://127.0.0.1:1/",
+            "urlBackend": "http://127.0.0.1:1/",
+            "canTracking": True,
+            "isServiceAccount": True,
+        },
+        "secret-key-of-the-enola-benchmark",
+        algorithm="HS256",
+    )
+
+
+def _best_us(func, steps, repeat):
+    # best of `repeat` runs, microseconds per step
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func(steps)
+        best = min(best, time.perf_counter() - start)
+    return best / steps * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tracking = Tracking(token=_token(), name="bench")
+
+    @tracking.traced
+    def traced(x):
+        return x + 1
+
+    def plain(x):
+        return x + 1
+
+    def with_step(steps, clear_every):
+        tracking.step_list.clear()
+        for i in range(steps):
+            with tracking.step("step"):
+                pass
+            if i % clear_every == clear_every - 1:
+                tracking.step_list.clear()
+
+    def with_traced(steps, clear_every):
+        tracking.step_list.clear()
+        for i in range(steps):
+            traced(i)
+            if i % clear_every == clear_every - 1:
+                tracking.step_list.clear()
+
+    def with_plain(steps, clear_every):
+        for i in range(steps):
+            plain(i)
+
+    def with_new_step(steps, clear_every):
+        tracking.step_list.clear()
+        for i in range(steps):
+            step = tracking.new_step("step")
+            tracking.close_step_others(step=step, successfull=True)
+            if i % clear_every == clear_every - 1:
+                tracking.step_list.clear()
+
+    def create_steps(steps):
+        for _ in range(steps):
+            Step("step")
+
+    print(f"{args.steps} steps, best of {args.repeat}, us per step")
+    print(f"{'':34}{'list cleared every 100':>24}{'one tracking':>16}")
+    for label, func in (
+        ("with tracking.step(...)", with_step),
+        ("@tracking.traced (minus call)", with_traced),
+        ("new_step + close_step_others", with_new_step),
+    ):
+        row = []
+        for clear_every in (100, args.steps):
+            elapsed = _best_us(lambda steps: func(steps, clear_every), args.steps, args.repeat)
+            if func is with_traced:
+                elapsed -= _best_us(lambda steps: with_plain(steps, clear_every), args.steps, args.repeat)
+            row.append(elapsed)
+        print(f"{label:34}{row[0]:>24.2f}{row[1]:>16.2f}")
+    tracking.step_list.clear()
+
+    tracemalloc.start()
+    steps = [Step("step") for _ in range(10_000)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del steps
+    print(f"Step(): {size / 10_000:.0f} bytes and {_best_us(create_steps, args.steps, args.repeat):.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import jwt
+import pytest
+
+
+def _response(data, successful=True, status=200, message="ok"):
+    return {
+        "isSuccessful": successful,
+        "httpStatusCode": status,
+        "message": message,
+        "startDate": "",
+        "elapsedTimeMS": 1,
+        "transactionId": "t",
+        "apiVersion": "1",
+        "errors": [],
+        "data": data,
+        "extraInfo": "",
+    }
+
+
+EXECUTION_FIELDS = [
+    "agentExecId", "agentExecIdRelated", "agentDeployId", "agentDeployName", "agentId", "agentName", "agentExecName",
+    "agentExecStartDT", "agentExecEndDT", "agentExecDurationMs", "agentExecNumTracking", "agentExecIsTest",
+    "environmentId", "agentExecCliAppId", "agentExecCliAppName", "agentExecCliUserId", "agentExecCliUserName",
+    "agentExecCliSessionId", "agentExecCliSessionName", "agentExecCliChannel", "agentExecCliChannelName",
+    "agentExecMessageInput", "agentExecMessageOutput", "agentExecTagJson", "agentExecFileInfoJson",
+    "agentExecDataJson", "agentExecErrorOrWarningJson", "agentExecStepApiDataJson", "agentExecInfoJson",
+    "agentExecEvals", "agentExecCliIP", "agentExecCliNumIter", "agentExecCliCodeApi", "agentExecSuccessfull",
+]
+
+
+def execution_row(i, start_dt="2024-01-01T00:00:00.000+00:00"):
+    row = dict.fromkeys(EXECUTION_FIELDS)
+    row.update(agentExecId=f"id{i}", agentExecStartDT=start_dt, agentExecTagJson={"tag": i})
+    return row
+
+
+def _parse_date(value):
+    # raises ValueError like a server that can't read the date, e.g. "+00:00" received as " 00:00"
+    date = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    return date if date.tzinfo else date.replace(tzinfo=timezone.utc)
+
+
+def _decompress(raw, encoding):
+    if encoding == "gzip":
+        return gzip.decompress(raw)
+    if encoding == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(raw)
+    return raw
+
+
+class EnolaStub:
+    """
+    Enola API served on localhost, records each request and can fail the next ones.
+    """
+
+    def __init__(self):
+        self.requests = []
+        # (status, Retry-After) of the next failed responses
+        self.failures = deque()
+        # route -> {call number: status} of calls that fail
+        self.failing_calls = {}
+        # route -> seconds the server waits before answering
+        self.delays = {}
+        # answer 415 to compressed bodies
+        self.reject_compression = False
+        # client_id of the first row of a batch upload -> error message of that upload
+        self.batch_errors = {}
+        # failed batch uploads wait here, so they are in flight at the same time
+        self.batch_error_barrier = None
+        # enolaId of an evaluation -> error message of that evaluation
+        self.eval_errors = {}
+        # evaluations wait here, so they are in flight at the same time
+        self.eval_barrier = None
+        self.executions = [execution_row(i) for i in range(250)]
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self.server.stub = self
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+        self.token = jwt.encode(
+            {
+                "agentDeployId": "A1",
+                "orgId": "O1",
+                "url": self.url,
+                "urlBackend": self.url,
+                "canTracking": True,
+                "canEvaluate": True,
+                "isServiceAccount": True,
+                "canGetExecutions": True,
+            },
+            "secret-key-of-the-enola-test-stub",
+            algorithm="HS256",
+        )
+
+    def fail_next(self, status, times=1, retry_after=None):
+        with self.lock:
+            self.failures.extend([(status, retry_after)] * times)
+
+    def fail_call(self, route, number, status=400):
+        self.failing_calls.setdefault(route, {})[number] = status
+
+    def wait(self, path):
+        for route, seconds in self.delays.items():
+            if path.endswith(route):
+                time.sleep(seconds)
+
+    def executions_between(self, date_from, date_to):
+        # both limits included, a date without time includes the whole day
+        start = _parse_date(date_from) if date_from else None
+        end = _parse_date(date_to) if date_to else None
+        if date_to and len(date_to) == 10:
+            end += timedelta(days=1) - timedelta(microseconds=1)
+
+        return [
+            execution
+            for execution in self.executions
+            if (start is None or start <= _parse_date(execution["agentExecStartDT"]))
+            and (end is None or _parse_date(execution["agentExecStartDT"]) <= end)
+        ]
+
+    def requests_to(self, route):
+        return [request for request in self.requests if request["path"].endswith(route)]
+
+    def _next_failure(self, path):
+        with self.lock:
+            if self.failures:
+                return self.failures.popleft()
+
+            for route, calls in self.failing_calls.items():
+                if path.endswith(route):
+                    status = calls.get(len(self.requests_to(route)))
+                    return None if status is None else (status, None)
+
+            return None
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        stub = self.server.stub
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        with stub.lock:
+            stub.requests.append({"method": "GET", "path": url.path, "query": query})
+        stub.wait(url.path)
+        if self._send_failure():
+            return
+
+        try:
+            executions = stub.executions_between(query.get("agentExecStartDT"), query.get("agentExecStartDTTo"))
+        except ValueError as error:
+            self._send(_response([], successful=False, status=400, message=str(error)), status=400)
+            return
+
+        page, limit = int(query["page"]), int(query["limit"])
+        self._send(_response(executions[(page - 1) * limit : page * limit]))
+
+    def do_POST(self):
+        stub = self.server.stub
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        encoding = self.headers.get("Content-Encoding")
+        if encoding is not None and stub.reject_compression:
+            with stub.lock:
+                stub.requests.append({"method": "POST", "path": self.path, "body": None, "size": len(raw), "encoding": encoding})
+            self._send(_response([], successful=False, status=415, message="unsupported"), status=415)
+            return
+
+        body = json.loads(_decompress(raw, encoding)) if raw else None
+        with stub.lock:
+            stub.requests.append({"method": "POST", "path": self.path, "body": body, "size": len(raw), "encoding": encoding})
+        stub.wait(self.path)
+        if self._send_failure():
+            return
+
+        if self.path.endswith("agent/execute/v1/"):
+            data = {"enolaId": "E1", "agentDeployId": "A1", "urlEvaluationDefGet": "", "urlEvaluationPost": ""}
+        elif self.path.endswith("agentExecBatch/execute/v1/"):
+            data = [{"agentExecBatchId": "B1", "agentDeployId": "A1", "agentExecBatchSuccessfull": True}]
+        elif self.path.endswith("eventsToProcess/executeBatch/v1/"):
+            message = stub.batch_errors.get(body[0]["client_id"]) if body else None
+            if message is not None:
+                if stub.batch_error_barrier is not None:
+                    stub.batch_error_barrier.wait()
+                self._send(_response([], successful=False, status=400, message=message), status=400)
+                return
+            data = [{"trackingList": [{"agentExecuteId": row["client_id"]} for row in body], "isSuccessful": True}]
+        elif self.path.endswith("agent/eval/v1/"):
+            if stub.eval_barrier is not None:
+                stub.eval_barrier.wait()
+            message = stub.eval_errors.get(body["enolaId"])
+            if message is not None:
+                self._send(_response([], successful=False, status=400, message=message), status=400)
+                return
+            data = {"enolaId": body["enolaId"], "agentDeployId": "A1", "enolaEvalId": "EV1"}
+        else:
+            self._send(_response([], successful=False, status=404, message="not found"), status=404)
+            return
+
+        self._send(_response(data))
+
+    def _send_failure(self):
+        failure = self.server.stub._next_failure(urlparse(self.path).path)
+        if failure is None:
+            return False
+
+        status, retry_after = failure
+        headers = {} if retry_after is None else {"Retry-After": retry_after}
+        self._send(_response([], successful=False, status=status, message="busy"), status=status, headers=headers)
+        return True
+
+    def _send(self, obj, status=200, headers=None):
+        body = json.dumps(obj).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def enola_stub():
+    stub = EnolaStub()
+    thread = threading.Thread(target=stub.server.serve_forever, daemon=True)
+    thread.start()
+    yield stub
+    stub.server.shutdown()
+    stub.server.server_close()
@@ -0,0 +1,73 @@
+import asyncio
+
+import pandas as pd
+
+from enola.base.common.huemul_retry_policy import HuemulRetryPolicy
+from enola.evaluation import AsyncEvaluation
+from enola.get_executions import AsyncGetExecutions
+from enola.tracking import AsyncTracking
+from enola.tracking_batch import AsyncTrackingBatch
+
+
+def test_async_round_trip(enola_stub):
+    dataframe = pd.DataFrame({"client": [f"c{i}" for i in range(5)], "product": ["p"] * 5, "score": [0.5] * 5})
+
+    async def round_trip():
+        tracking = AsyncTracking(token=enola_stub.token, name="async")
+        await tracking.execute(successfull=True)
+
+        tracking_batch = AsyncTrackingBatch(
+            token=enola_stub.token,
+            name="async batch",
+            dataframe=dataframe,
+            period="2024-01-01T00:00:00Z",
+            client_id_column_name="client",
+            product_id_column_name="product",
+            score_value_column_name="score",
+        )
+        batch_results = await tracking_batch.execute(batch_size=2)
+
+        get_executions = AsyncGetExecutions(token=enola_stub.token)
+        ids = [
+            execution.enola_id
+            async for execution in get_executions.iter_executions(
+                date_from="2024-01-01", date_to="2024-02-01", agent_deploy_id_list=["A1"], limit=100
+            )
+        ]
+
+        evaluation = AsyncEvaluation(token=enola_stub.token)
+        evaluation.add_evaluation(enola_id=tracking.enola_id, eval_id="quality", value=1, comment="")
+        evaluation_result = await evaluation.execute()
+
+        return tracking, batch_results, ids, evaluation_result
+
+    tracking, batch_results, ids, evaluation_result = asyncio.run(round_trip())
+
+    assert tracking.enola_id == "E1"
+    assert [result.enola_id for result in batch_results] == [f"c{i}" for i in range(5)]
+    assert len(enola_stub.requests_to("eventsToProcess/executeBatch/v1/")) == 3
+    assert ids == [f"id{i}" for i in range(250)]
+    assert evaluation_result.errors == []
+    assert enola_stub.requests_to("agent/eval/v1/")[0]["body"]["enolaId"] == "E1"
+
+
+def test_async_retry_does_not_block_the_event_loop(enola_stub):
+    enola_stub.fail_next(503, times=2, retry_after="0.2")
+
+    async def execute_with_ticker():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.02)
+                ticks += 1
+
+        task = asyncio.ensure_future(ticker())
+        tracking = AsyncTracking(token=enola_stub.token, name="retry", retry_policy=HuemulRetryPolicy(base_delay=0))
+        await tracking.execute(successfull=True)
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(execute_with_ticker()) >= 10
+    assert len(enola_stub.requests_to("agent/execute/v1/")) == 3
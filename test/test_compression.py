@@ -0,0 +1,67 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from enola.base.common.huemul_compression import HuemulCompression
+from enola.tracking import Tracking
+
+TRACKING_ROUTE = "agent/execute/v1/"
+BODY = "x" * 4096
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+def test_tracking_body_is_sent_compressed(enola_stub, encoding):
+    if encoding == "zstd":
+        pytest.importorskip("zstandard")
+    tracking = Tracking(token=enola_stub.token, name="compressed", compression=encoding, compression_threshold=10)
+
+    tracking.execute(successfull=True)
+
+    request = enola_stub.requests_to(TRACKING_ROUTE)[0]
+    assert request["encoding"] == encoding
+    assert request["size"] < len(str(request["body"]))
+    assert request["body"]["step_list"][0]["agentExecName"] == "compressed"
+
+
+def test_small_bodies_are_sent_plain():
+    compression = HuemulCompression(encoding="gzip", threshold=1024)
+
+    assert compression.compress("small") == ("small", None)
+    body, encoding = compression.compress(BODY)
+    assert encoding == "gzip" and len(body) < len(BODY)
+
+
+def test_server_rejecting_compression_disables_it(enola_stub):
+    enola_stub.reject_compression = True
+    tracking = Tracking(token=enola_stub.token, name="plain", compression="gzip", compression_threshold=10)
+
+    tracking.execute(successfull=True)
+
+    requests = enola_stub.requests_to(TRACKING_ROUTE)
+    assert [request["encoding"] for request in requests] == ["gzip", None]
+    assert not tracking.connection.huemul_compression.is_enabled()
+
+
+def test_unknown_encoding_fails():
+    with pytest.raises(NameError):
+        HuemulCompression(encoding="brotli")
+
+
+def test_zstd_compressor_is_safe_across_threads():
+    zstandard = pytest.importorskip("zstandard")
+    compression = HuemulCompression(encoding="zstd", threshold=0)
+    bodies = [f"{i}-".encode() * 2000 for i in range(64)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        compressed = list(executor.map(lambda body: compression.compress(body)[0], bodies))
+
+    assert [zstandard.ZstdDecompressor().decompress(body) for body in compressed] == bodies
+
+
+def test_compression_can_be_pickled():
+    compression = pickle.loads(pickle.dumps(HuemulCompression(encoding="gzip", threshold=0)))
+
+    assert compression.compress(BODY)[1] == "gzip"
+    compression.disable()
+    assert not compression.is_enabled()
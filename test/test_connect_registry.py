@@ -0,0 +1,75 @@
+import threading
+
+import enola.base.connect
+from enola.base.common.auth.auth_model import AuthModel
+from enola.base.common.huemul_transport import HuemulTransport
+from enola.base.connect_registry import ConnectRegistry, get_connect_registry
+from enola.tracking import Tracking
+
+
+def _auth(url="http://127.0.0.1:1/"):
+    return AuthModel(jwt_token="token", url_service=url, org_id="O1")
+
+
+def test_instances_share_the_transport_of_their_url(enola_stub):
+    first = Tracking(token=enola_stub.token, name="first")
+    second = Tracking(token=enola_stub.token, name="second")
+
+    assert first.connection is not second.connection
+    assert first.connection.huemul_transport is second.connection.huemul_transport
+    assert get_connect_registry().get_token_info(enola_stub.token) is get_connect_registry().get_token_info(
+        enola_stub.token
+    )
+
+
+def test_other_settings_get_their_own_transport():
+    registry = ConnectRegistry()
+
+    default = registry.connect(_auth(), show_message=False)
+    slow = registry.connect(_auth(), show_message=False, read_timeout=300.0)
+    other_url = registry.connect(_auth("http://127.0.0.1:2/"), show_message=False)
+
+    assert len({id(default.huemul_transport), id(slow.huemul_transport), id(other_url.huemul_transport)}) == 3
+
+
+def test_connections_created_at_the_same_time_share_one_transport(monkeypatch):
+    registry = ConnectRegistry()
+    created = []
+    # both connections find no transport and build their own before storing it
+    built = threading.Barrier(2, timeout=5)
+
+    class WaitingTransport(HuemulTransport):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self)
+            built.wait()
+
+    monkeypatch.setattr(enola.base.connect, "HuemulTransport", WaitingTransport)
+    connections = []
+
+    def connect():
+        connections.append(registry.connect(_auth(), show_message=False))
+
+    threads = [threading.Thread(target=connect) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 2
+    assert connections[0].huemul_transport is connections[1].huemul_transport
+    assert registry.connect(_auth(), show_message=False).huemul_transport is connections[0].huemul_transport
+
+
+def test_pool_grows_in_place():
+    registry = ConnectRegistry()
+    first = registry.connect(_auth(), show_message=False, pool_size=2)
+    second = registry.connect(_auth(), show_message=False, pool_size=2)
+    adapter = first.huemul_transport.session.get_adapter("http://127.0.0.1:1/")
+
+    first.huemul_transport.ensure_pool_size(8)
+    second.huemul_transport.ensure_pool_size(4)
+
+    assert second.huemul_transport.pool_size == 8
+    assert second.huemul_transport.session.get_adapter("http://127.0.0.1:1/") is adapter
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 8
@@ -0,0 +1,152 @@
+import asyncio
+import threading
+
+import pandas as pd
+import pytest
+
+from enola.enola_types import EvalType, EvaluationModel
+from enola.evaluation import AsyncEvaluation, Evaluation
+
+
+def _execution(evaluation, enola_id):
+    return EvaluationModel(enola_id, eval_type=EvalType.AUTO, enola_sender=evaluation.enola_sender)
+
+
+def test_evaluations_of_the_same_execution_are_grouped(enola_stub):
+    evaluation = Evaluation(token=enola_stub.token)
+
+    evaluation.add_evaluation(enola_id="E1", eval_id="quality", value=1, comment="")
+    evaluation.add_evaluation_by_level(enola_id="E2", eval_id="quality", level=3, comment="")
+    evaluation.add_evaluation(enola_id="E1", eval_id="speed", value=0.5, comment="slow")
+
+    assert [item.enola_id for item in evaluation.executions] == ["E1", "E2"]
+    assert [detail.eval_id for detail in evaluation.execution_exists("E1").evals] == ["quality", "speed"]
+    assert evaluation.execution_exists("E3") is None
+
+
+def test_add_evaluations_from_a_dataframe(enola_stub):
+    evaluation = Evaluation(token=enola_stub.token)
+    evaluations = pd.DataFrame(
+        {"enola_id": ["E1", "E2", "E1"], "eval_id": ["a", "a", "b"], "value": [1.0, None, 0.5], "level": [None, 4, None]}
+    )
+
+    assert evaluation.add_evaluations(evaluations) == 3
+    assert len(evaluation.executions) == 2
+    assert evaluation.execution_exists("E2").evals[0].level == 4
+
+    with pytest.raises(Exception):
+        evaluation.add_evaluations([{"enola_id": "E3", "eval_id": "a"}])
+
+
+def test_executions_work_as_a_list(enola_stub):
+    evaluation = Evaluation(token=enola_stub.token)
+    first, second, third = (_execution(evaluation, enola_id) for enola_id in ("E1", "E2", "E3"))
+
+    evaluation.executions.append(first)
+    evaluation.executions.append(second)
+    evaluation.executions.insert(0, third)
+    assert evaluation.executions[0] is third
+    assert evaluation.executions[-1] is second
+    assert evaluation.executions[1:] == [first, second]
+
+    evaluation.executions.remove(first)
+    assert first not in evaluation.executions
+    assert evaluation.execution_exists("E1") is None
+    with pytest.raises(ValueError):
+        evaluation.executions.remove(first)
+
+    del evaluation.executions[0]
+    assert list(evaluation.executions) == [second]
+    with pytest.raises(IndexError):
+        evaluation.executions[1]
+
+    evaluation.executions.clear()
+    assert len(evaluation.executions) == 0
+    assert evaluation.execution_exists("E2") is None
+
+
+def test_replacing_an_execution_keeps_the_index(enola_stub):
+    evaluation = Evaluation(token=enola_stub.token)
+    evaluation.executions = [_execution(evaluation, enola_id) for enola_id in ("E1", "E2", "E3")]
+    replacement = _execution(evaluation, "E4")
+    duplicate = _execution(evaluation, "E1")
+
+    evaluation.executions[1] = replacement
+    assert evaluation.execution_exists("E2") is None
+    assert evaluation.execution_exists("E4") is replacement
+
+    # same enola_id as the first execution, it is replaced in its position
+    evaluation.executions.append(duplicate)
+    assert [item.enola_id for item in evaluation.executions] == ["E1", "E4", "E3"]
+    assert evaluation.executions[0] is duplicate
+
+    evaluation.executions[2] = _execution(evaluation, "E4")
+    assert [item.enola_id for item in evaluation.executions] == ["E1", "E4"]
+
+
+def test_execute_sends_each_execution_once(enola_stub):
+    evaluation = Evaluation(token=enola_stub.token)
+    for i in range(5):
+        evaluation.add_evaluation(enola_id=f"E{i}", eval_id="quality", value=1, comment="")
+    evaluation.add_evaluation(enola_id="E0", eval_id="speed", value=1, comment="")
+
+    result = evaluation.execute(max_workers=3)
+
+    sent = [request["body"]["enolaId"] for request in enola_stub.requests_to("agent/eval/v1/")]
+    assert sorted(sent) == [f"E{i}" for i in range(5)]
+    assert [item.enola_id for item in result.results] == [f"E{i}" for i in range(5)]
+    assert result.total_evals == 5
+
+
+def _evaluation_with_failures(enola_stub, evaluation_class=Evaluation):
+    evaluation = evaluation_class(token=enola_stub.token)
+    for i in range(6):
+        evaluation.add_evaluation(enola_id=f"E{i}", eval_id="quality", value=1, comment="")
+    enola_stub.eval_errors = {"E1": "bad E1", "E4": "bad E4"}
+    enola_stub.eval_barrier = threading.Barrier(6, timeout=10)
+    return evaluation
+
+
+def _check_failures(result):
+    assert result.total_evals == 6
+    assert result.total_success == 4
+    assert result.total_errors == 2
+    assert result.errors == ["error bad E1", "error bad E4"]
+    assert [item.successfull for item in result.results] == [True, False, True, True, False, True]
+    assert [item.message for item in result.results if not item.successfull] == result.errors
+
+
+def test_concurrent_failures_keep_their_own_message(enola_stub, monkeypatch):
+    evaluation = _evaluation_with_failures(enola_stub)
+
+    # both failures log their error before any of them builds its response
+    logged = threading.Barrier(2, timeout=5)
+    log_message_error = evaluation.connection.huemul_logging.log_message_error
+
+    def log_and_wait(message):
+        log_message_error(message)
+        if message.startswith("error in enolaEvaluation"):
+            logged.wait()
+
+    monkeypatch.setattr(evaluation.connection.huemul_logging, "log_message_error", log_and_wait)
+
+    result = evaluation.execute(max_workers=6, raise_error_if_fail=False)
+
+    _check_failures(result)
+
+
+def test_async_concurrent_failures_keep_their_own_message(enola_stub):
+    evaluation = _evaluation_with_failures(enola_stub, AsyncEvaluation)
+
+    result = asyncio.run(evaluation.execute(max_in_flight=6, raise_error_if_fail=False))
+
+    _check_failures(result)
+
+
+def test_failed_evaluation_raises_by_default(enola_stub):
+    evaluation = Evaluation(token=enola_stub.token)
+    evaluation.add_evaluation(enola_id="E1", eval_id="quality", value=1, comment="")
+    enola_stub.eval_errors = {"E1": "bad E1"}
+
+    with pytest.raises(Exception, match="bad E1"):
+        evaluation.execute()
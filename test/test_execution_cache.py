@@ -0,0 +1,77 @@
+import time
+
+from enola.base.internal.executions.enola_execution_cache import EnolaExecutionCache
+from enola.get_executions import GetExecutions
+
+OPEN_RANGE = dict(date_from="2024-01-01", date_to="2099-01-01", agent_deploy_id_list=["A1"], limit=50)
+CLOSED_RANGE = dict(date_from="2024-01-01", date_to="2024-02-01", agent_deploy_id_list=["A1"], limit=50)
+
+
+def _read_all(get_executions, query):
+    return [execution.enola_id for execution in get_executions.iter_executions(**query)]
+
+
+def _gets(enola_stub):
+    return [request for request in enola_stub.requests if request["method"] == "GET"]
+
+
+def test_cached_pages_are_read_without_calling_the_server(enola_stub, tmp_path):
+    get_executions = GetExecutions(token=enola_stub.token, cache_path=str(tmp_path / "cache.db"))
+
+    cold = _read_all(get_executions, CLOSED_RANGE)
+    cold_gets = len(_gets(enola_stub))
+    warm = _read_all(get_executions, CLOSED_RANGE)
+
+    assert warm == cold
+    assert len(cold) == 250
+    assert len(_gets(enola_stub)) == cold_gets
+
+
+def test_pages_of_open_ranges_expire_after_ttl(enola_stub, tmp_path):
+    get_executions = GetExecutions(
+        token=enola_stub.token, cache_path=str(tmp_path / "cache.db"), cache_ttl_seconds=1.0
+    )
+
+    _read_all(get_executions, OPEN_RANGE)
+    cold_gets = len(_gets(enola_stub))
+    _read_all(get_executions, OPEN_RANGE)
+    assert len(_gets(enola_stub)) == cold_gets
+
+    time.sleep(1.1)
+    _read_all(get_executions, OPEN_RANGE)
+    assert len(_gets(enola_stub)) == 2 * cold_gets
+
+
+def test_pages_of_closed_ranges_never_expire(enola_stub, tmp_path):
+    get_executions = GetExecutions(
+        token=enola_stub.token, cache_path=str(tmp_path / "cache.db"), cache_ttl_seconds=0.01
+    )
+
+    _read_all(get_executions, CLOSED_RANGE)
+    cold_gets = len(_gets(enola_stub))
+    time.sleep(0.05)
+    _read_all(get_executions, CLOSED_RANGE)
+
+    assert len(_gets(enola_stub)) == cold_gets
+
+
+def test_least_recently_used_pages_are_evicted(enola_stub, tmp_path):
+    get_executions = GetExecutions(token=enola_stub.token)
+    get_executions.query(**CLOSED_RANGE)
+    connection = get_executions.connection
+    query = get_executions.execution_query_model
+    rows = [{"agentExecId": f"id{i}", "value": "x" * 100} for i in range(5)]
+    cache = EnolaExecutionCache(str(tmp_path / "cache.db"), max_bytes=1500)
+
+    cache.put_page(query.with_page(1), connection, rows)
+    cache.put_page(query.with_page(2), connection, rows)
+    # page 1 is read, page 2 becomes the least recently used
+    time.sleep(0.01)
+    assert cache.get_page(query.with_page(1), connection) == rows
+    time.sleep(0.01)
+    cache.put_page(query.with_page(3), connection, rows)
+
+    assert cache.get_page(query.with_page(1), connection) == rows
+    assert cache.get_page(query.with_page(2), connection) is None
+    assert cache.get_page(query.with_page(3), connection) == rows
+    assert cache.db.execute("SELECT SUM(size) FROM pages").fetchone()[0] <= 1500
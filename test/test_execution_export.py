@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from conftest import execution_row
+from enola.get_executions import GetExecutions, _split_date_range
+
+QUERY = dict(agent_deploy_id_list=["A1"], limit=20)
+
+
+@pytest.fixture
+def hourly_executions(enola_stub):
+    # one execution per hour, from 2024-01-01 00:00 to 2024-01-10 23:00 (UTC)
+    start = datetime(2024, 1, 1)
+    enola_stub.executions = [
+        execution_row(i, (start + timedelta(hours=i)).isoformat(timespec="milliseconds") + "+00:00")
+        for i in range(240)
+    ]
+    return enola_stub
+
+
+def _gets(enola_stub):
+    return [request for request in enola_stub.requests if request["method"] == "GET"]
+
+
+def test_export_with_timezone_aware_dates_returns_each_execution_once(hourly_executions):
+    get_executions = GetExecutions(token=hourly_executions.token)
+
+    executions = get_executions.export(
+        "2024-01-02T00:00:00+00:00", "2024-01-06T00:00:00+00:00", shards=4, workers=2, **QUERY
+    )
+
+    assert [execution.enola_id for execution in executions] == [f"id{i}" for i in range(24, 121)]
+    shard_dates = [(request["query"]["agentExecStartDT"], request["query"]["agentExecStartDTTo"]) for request in _gets(hourly_executions)]
+    assert ("2024-01-03T00:00:00+00:00", "2024-01-04T00:00:00+00:00") in shard_dates
+
+
+def test_export_with_naive_and_aware_dates(hourly_executions):
+    get_executions = GetExecutions(token=hourly_executions.token)
+
+    executions = get_executions.export("2024-01-02T00:00:00", "2024-01-03T00:00:00Z", shards=3, **QUERY)
+
+    assert [execution.enola_id for execution in executions] == [f"id{i}" for i in range(24, 49)]
+
+
+def test_export_keeps_executions_on_shard_boundaries_once(hourly_executions):
+    get_executions = GetExecutions(token=hourly_executions.token)
+
+    executions = get_executions.export("2024-01-01", "2024-01-10", shards=9, workers=3, output="pandas", **QUERY)
+
+    # whole days, consecutive shards both return the executions of their shared day
+    assert len(_gets(hourly_executions)) > 9
+    assert list(executions["enola_id"]) == [f"id{i}" for i in range(240)]
+
+
+def test_failed_shard_fails_the_export(hourly_executions):
+    hourly_executions.fail_call("agentExec/v1/", 2)
+    get_executions = GetExecutions(token=hourly_executions.token, raise_error_if_fail=False)
+
+    with pytest.raises(Exception, match="export of"):
+        get_executions.export("2024-01-01", "2024-01-03", shards=2, workers=1, **QUERY)
+
+
+def test_split_date_range():
+    assert _split_date_range("2024-01-01", "2024-01-03", 4) == [("2024-01-01", "2024-01-02"), ("2024-01-02", "2024-01-03")]
+    assert _split_date_range("2024-01-01T00:00:00Z", "2024-01-01T12:00:00Z", 2) == [
+        ("2024-01-01T00:00:00Z", "2024-01-01T06:00:00+00:00"),
+        ("2024-01-01T06:00:00+00:00", "2024-01-01T12:00:00Z"),
+    ]
+    assert _split_date_range("2024-01-02", "2024-01-01", 4) == [("2024-01-02", "2024-01-01")]
@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from conftest import execution_row
+from enola.base.internal.executions.enola_execution_frame import executions_to_frame
+from enola.get_executions import GetExecutions
+
+QUERY = dict(date_from="2024-01-01", date_to="2024-02-01", agent_deploy_id_list=["A1"], limit=100)
+
+
+def test_get_next_page_as_pandas(enola_stub):
+    get_executions = GetExecutions(token=enola_stub.token)
+    get_executions.query(**QUERY)
+
+    page = get_executions.get_next_page(output="pandas")
+
+    assert isinstance(page.data, pd.DataFrame)
+    assert list(page.data["enola_id"]) == [f"id{i}" for i in range(100)]
+    assert isinstance(page.data["start_dt"].dtype, pd.DatetimeTZDtype)
+    assert page.data["start_dt"][0] == pd.Timestamp("2024-01-01", tz="UTC")
+    assert get_executions.num_rows == 100
+
+
+def test_json_columns_are_expanded_with_prefix():
+    rows = [execution_row(0), execution_row(1)]
+    rows[1]["agentExecTagJson"] = '{"tag": 1, "label": "b"}'
+
+    frame = executions_to_frame(rows, output="pandas", expand_json=True)
+
+    assert list(frame["tag_tag"]) == [0, 1]
+    assert frame["tag_label"].tolist()[1] == "b"
+    assert "tag_json" not in frame.columns
+
+
+def test_arrow_output():
+    pa = pytest.importorskip("pyarrow")
+
+    table = executions_to_frame([execution_row(0)], output="arrow")
+
+    assert isinstance(table, pa.Table)
+    assert table.column("enola_id").to_pylist() == ["id0"]
+
+
+def test_unknown_output_fails(enola_stub):
+    with pytest.raises(ValueError):
+        executions_to_frame([], output="csv")
+
+    get_executions = GetExecutions(token=enola_stub.token)
+    get_executions.query(**QUERY)
+    with pytest.raises(ValueError):
+        get_executions.get_next_page(output="csv")
@@ -0,0 +1,58 @@
+from conftest import execution_row
+from enola.base.internal.executions.enola_execution_sync_store import EnolaExecutionSyncStore
+from enola.get_executions import GetExecutions
+
+QUERY = dict(date_from="2024-01-01", date_to="2024-02-01", agent_deploy_id_list=["A1"], limit=50)
+
+
+def test_sync_stores_only_new_executions(enola_stub, tmp_path):
+    store_path = str(tmp_path / "sync.db")
+    get_executions = GetExecutions(token=enola_stub.token)
+
+    assert get_executions.sync(store_path, **QUERY) == 250
+    assert get_executions.sync(store_path, **QUERY) == 0
+
+    enola_stub.executions.extend(execution_row(i, "2024-01-02T00:00:00.000+00:00") for i in range(250, 260))
+    assert get_executions.sync(store_path, **QUERY) == 10
+
+    store = EnolaExecutionSyncStore(store_path)
+    assert store.count() == 260
+    assert store.load_watermark("default") == (
+        "2024-01-02T00:00:00.000+00:00",
+        {f"id{i}" for i in range(250, 260)},
+    )
+    store.close()
+
+
+def test_sync_sends_dates_with_timezone_as_parsed_by_the_server(enola_stub, tmp_path):
+    store_path = str(tmp_path / "sync.db")
+    get_executions = GetExecutions(token=enola_stub.token)
+    query = dict(QUERY)
+    del query["date_to"]
+
+    get_executions.sync(store_path, **query)
+    first_run = enola_stub.requests[0]["query"]
+    enola_stub.requests.clear()
+    get_executions.sync(store_path, **query)
+    second_run = enola_stub.requests[0]["query"]
+
+    # default date_to is now in UTC, "+00:00" must not arrive as a space
+    assert first_run["agentExecStartDTTo"].endswith("+00:00")
+    assert " " not in first_run["agentExecStartDTTo"]
+    assert second_run["agentExecStartDT"] == "2024-01-01T00:00:00.000+00:00"
+
+
+def test_sync_skips_rows_without_id_in_the_watermark(enola_stub, tmp_path):
+    store_path = str(tmp_path / "sync.db")
+    row = execution_row(0, "2024-01-03T00:00:00.000+00:00")
+    row["agentExecId"] = None
+    enola_stub.executions.append(row)
+
+    GetExecutions(token=enola_stub.token).sync(store_path, **QUERY)
+
+    store = EnolaExecutionSyncStore(store_path)
+    assert store.load_watermark("default") == (
+        "2024-01-01T00:00:00.000+00:00",
+        {f"id{i}" for i in range(250)},
+    )
+    store.close()
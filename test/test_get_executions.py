@@ -0,0 +1,26 @@
+from enola.get_executions import GetExecutions
+
+QUERY = dict(date_from="2024-01-01", date_to="2024-02-01", agent_deploy_id_list=["A1"], limit=50)
+
+
+def _pages_read(enola_stub):
+    return [int(request["query"]["page"]) for request in enola_stub.requests if request["method"] == "GET"]
+
+
+def test_iter_executions_reads_all_pages(enola_stub):
+    get_executions = GetExecutions(token=enola_stub.token)
+
+    ids = [execution.enola_id for execution in get_executions.iter_executions(**QUERY)]
+
+    assert ids == [f"id{i}" for i in range(250)]
+    assert get_executions.num_rows_acum == 250
+    assert _pages_read(enola_stub) == [1, 2, 3, 4, 5, 6]
+
+
+def test_iter_executions_stops_at_max_rows(enola_stub):
+    get_executions = GetExecutions(token=enola_stub.token)
+
+    ids = [execution.enola_id for execution in get_executions.iter_executions(max_rows=120, **QUERY)]
+
+    assert ids == [f"id{i}" for i in range(120)]
+    assert _pages_read(enola_stub) == [1, 2, 3]
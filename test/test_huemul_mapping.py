@@ -0,0 +1,73 @@
+import copy
+import pickle
+
+import pytest
+
+from enola.enola_types import (
+    EnolaSenderModel,
+    EvalType,
+    EvaluationModel,
+    EvaluationResponseModel,
+    Step,
+)
+from enola.tracking import Tracking
+
+
+def _evaluation_model():
+    sender = EnolaSenderModel(
+        app_id=None, app_name="", user_id=None, user_name="", session_id=None, session_name="",
+        channel_id=None, channel_name="", ip=None, external_id="", batch_id="", client_id="", product_id="",
+    )
+    return EvaluationModel("E1", eval_type=EvalType.AUTO, enola_sender=sender)
+
+
+def test_attributes_can_be_read_as_keys():
+    step = Step("retrieve", message_input="question")
+
+    assert step["name"] == "retrieve"
+    assert step.get("message_input") == "question"
+    # properties and lazy parts too
+    assert step["date_start"] == step.date_start
+    assert step["token"] is step.token
+
+
+def test_missing_keys():
+    step = Step("retrieve")
+
+    with pytest.raises(KeyError):
+        step["unknown"]
+    assert step.get("unknown") is None
+    assert step.get("unknown", 0) == 0
+    assert not hasattr(step, "unknown")
+
+
+def test_models_with_attribute_fallback():
+    model = _evaluation_model()
+    response = EvaluationResponseModel(enola_id="E1", successfull=True)
+
+    # missing attributes are None, missing keys still raise
+    assert model.unknown is None
+    assert response.unknown is None
+    assert model["enola_id"] == "E1"
+    with pytest.raises(KeyError):
+        model["unknown"]
+    assert model.get("unknown", "default") == "default"
+    with pytest.raises(AttributeError):
+        model.__unknown__
+
+
+def test_models_with_attribute_fallback_copy_and_pickle():
+    model = _evaluation_model()
+
+    for restored in (copy.copy(model), copy.deepcopy(model), pickle.loads(pickle.dumps(model))):
+        assert restored["enola_id"] == "E1"
+        assert restored.eval_type == model.eval_type
+
+
+def test_tracking_attributes_as_keys(enola_stub):
+    tracking = Tracking(token=enola_stub.token, name="mapped")
+
+    assert tracking["name"] == "mapped"
+    assert tracking.get("first_step") is tracking.first_step
+    with pytest.raises(KeyError):
+        tracking["unknown"]
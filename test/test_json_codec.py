@@ -0,0 +1,52 @@
+import pytest
+
+from enola.base.common import huemul_json
+
+
+@pytest.fixture
+def restore_backend():
+    backend = huemul_json.backend
+    yield
+    huemul_json.set_backend(backend)
+
+
+def _installed_backends():
+    backends = []
+    for name in ["orjson", "msgspec", "ujson", "json"]:
+        try:
+            __import__(name)
+            backends.append(name)
+        except ImportError:
+            pass
+    return backends
+
+
+@pytest.mark.parametrize("name", _installed_backends())
+def test_round_trip_with_each_installed_backend(restore_backend, name):
+    assert huemul_json.set_backend(name) == name
+    value = {"text": "ñandú", "number": 1.5, "list": [1, None, True], "nested": {"a": []}}
+
+    encoded = huemul_json.dumps(value)
+
+    assert isinstance(encoded, bytes)
+    assert huemul_json.loads(encoded) == value
+    assert huemul_json.loads(encoded.decode("utf-8")) == value
+
+
+def test_default_serializes_unknown_objects(restore_backend):
+    huemul_json.set_backend("json")
+
+    class Model:
+        def __init__(self):
+            self.value = 1
+
+    assert huemul_json.loads(huemul_json.dumps({"model": Model()}, default=lambda o: o.__dict__)) == {"model": {"value": 1}}
+
+
+def test_unknown_backend_fails(restore_backend):
+    with pytest.raises(NameError, match="not supported"):
+        huemul_json.set_backend("yaml")
+
+
+def test_default_backend_is_installed():
+    assert huemul_json.backend in _installed_backends()
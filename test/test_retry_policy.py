@@ -0,0 +1,62 @@
+import time
+from email.utils import formatdate
+
+import pytest
+
+from enola.base.common.huemul_retry_policy import HuemulRetryPolicy
+from enola.tracking import Tracking
+
+
+def test_parse_retry_after_accepts_seconds_and_http_date():
+    policy = HuemulRetryPolicy()
+
+    assert policy.parse_retry_after("2") == 2.0
+    assert policy.parse_retry_after("-1") == 0.0
+    assert 8 < policy.parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert policy.parse_retry_after("soon") is None
+    assert policy.parse_retry_after(None) is None
+
+
+def test_next_wait_uses_retry_after_of_429_and_503_only():
+    policy = HuemulRetryPolicy(base_delay=0)
+
+    assert policy.next_wait(1, status_code=503, retry_after="3") == 3.0
+    assert policy.next_wait(1, status_code=429, retry_after="3") == 3.0
+    assert policy.next_wait(1, status_code=500, retry_after="3") == 0.0
+    assert HuemulRetryPolicy(base_delay=0, respect_retry_after=False).next_wait(1, status_code=503, retry_after="3") == 0.0
+
+
+def test_next_wait_stops_after_max_attempts_and_max_total_time():
+    policy = HuemulRetryPolicy(max_attempts=3, base_delay=0, max_total_time=5)
+
+    assert policy.next_wait(2) == 0.0
+    assert policy.next_wait(3) is None
+    assert policy.next_wait(1, started=time.monotonic(), status_code=503, retry_after="10") is None
+
+
+def test_next_wait_jitter_is_bounded_by_max_delay():
+    policy = HuemulRetryPolicy(max_attempts=20, base_delay=1, max_delay=2)
+
+    assert all(0 <= policy.next_wait(attempt) <= 2 for attempt in range(1, 20))
+
+
+def test_tracking_retries_503_after_retry_after(enola_stub):
+    enola_stub.fail_next(503, times=2, retry_after="0.2")
+    tracking = Tracking(token=enola_stub.token, name="retry", retry_policy=HuemulRetryPolicy(base_delay=0))
+
+    started = time.monotonic()
+    tracking.execute(successfull=True)
+
+    assert len(enola_stub.requests_to("agent/execute/v1/")) == 3
+    assert time.monotonic() - started >= 0.4
+    assert tracking.enola_id == "E1"
+
+
+def test_tracking_does_not_retry_client_errors(enola_stub):
+    enola_stub.fail_next(400)
+    tracking = Tracking(token=enola_stub.token, name="no-retry", retry_policy=HuemulRetryPolicy(base_delay=0))
+
+    with pytest.raises(NameError):
+        tracking.execute(successfull=True)
+
+    assert len(enola_stub.requests_to("agent/execute/v1/")) == 1
@@ -0,0 +1,81 @@
+import copy
+import pickle
+
+import pytest
+
+from enola.enola_types import (
+    ErrOrWarnKind,
+    Info,
+    Step,
+    StepCost,
+    StepDoc,
+    StepToken,
+    StepVideo,
+)
+from enola.tracking import Tracking
+
+
+def test_step_models_have_no_instance_dict():
+    for model in (Step("s"), StepVideo(), StepDoc(), StepToken(), StepCost(), Info(type="tag", key="k", value=1)):
+        assert not hasattr(model, "__dict__")
+
+    with pytest.raises(AttributeError):
+        Step("s").unknown_attribute = 1
+
+
+def test_step_parts_are_created_on_first_access():
+    step = Step("s")
+
+    payload = step.to_json()
+    assert step._token is None and step._cost is None and step._extra_info_list is None
+    assert payload["agentExecTokenInput"] == 0
+    assert payload["extraInfo"] == []
+
+    step.token.token_input = 120
+    step.cost.total = 0.5
+    step.add_tag("model", "small")
+    assert step.token is step.token
+    assert step._video is None
+
+    payload = step.to_json()
+    assert payload["agentExecTokenInput"] == 120
+    assert payload["agentExecCostTotal"] == 0.5
+    assert payload["extraInfo"] == [{"type": "tag", "key": "model", "value": "small"}]
+
+
+def test_step_parts_can_be_replaced():
+    step = Step("s")
+    token = StepToken()
+    token.token_output = 7
+
+    step.token = token
+    step.extra_info_list = [Info(type="info", key="k", value="v")]
+
+    assert step.token is token
+    assert step.to_json()["agentExecTokenOutput"] == 7
+    assert len(step.to_json()["extraInfo"]) == 1
+
+
+def test_step_pickles_with_its_parts():
+    step = Step("s", message_input="question")
+    step.token.token_input = 3
+    step.add_error(id="E", message="failed", kind=ErrOrWarnKind.INTERNAL_CONTROLLED)
+    step.close()
+
+    for restored in (pickle.loads(pickle.dumps(step)), copy.deepcopy(step)):
+        assert restored.to_json() == step.to_json()
+        assert restored._video is None
+
+
+def test_tracking_pickles_without_its_lock(enola_stub):
+    tracking = Tracking(token=enola_stub.token, name="pickled")
+    with tracking.step("retrieve") as step:
+        step.token.token_input = 5
+
+    restored = pickle.loads(pickle.dumps(tracking))
+
+    assert restored.name == "pickled"
+    assert [item.to_json() for item in restored.step_list] == [item.to_json() for item in tracking.step_list]
+    with restored.step("after restore"):
+        pass
+    assert restored.steps == tracking.steps + 1
@@ -0,0 +1,74 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import enola.enola_types
+from enola.enola_types import Step
+from enola.tracking import Tracking
+
+# 2024-01-01T00:00:00Z
+START_WALL_NS = 1_704_067_200_000_000_000
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(perf_ns=5_000_000_000, wall_ns=START_WALL_NS)
+    monkeypatch.setattr(
+        enola.enola_types,
+        "time",
+        SimpleNamespace(perf_counter_ns=lambda: clock.perf_ns, time_ns=lambda: clock.wall_ns),
+    )
+    return clock
+
+
+def test_duration_uses_the_monotonic_clock(clock):
+    step = Step("s")
+    clock.perf_ns += 250_000_000
+    # wall clock set back by the system while the step runs
+    clock.wall_ns -= 3_600_000_000_000
+
+    step.close()
+
+    assert step.duration_in_ms == 250
+    assert step.date_start == "2024-01-01T00:00:00.000+00:00"
+    assert step.date_end == "2024-01-01T00:00:00.250+00:00"
+
+
+def test_dates_are_rendered_when_sending(clock):
+    step = Step("s")
+
+    assert step.date_end == step.date_start
+    assert step._date_start is None
+
+    clock.perf_ns += 1_500_000_000
+    step.close()
+    payload = step.to_json()
+
+    assert payload["stepDateStart"] == "2024-01-01T00:00:00.000+00:00"
+    assert payload["stepDateEnd"] == "2024-01-01T00:00:01.500+00:00"
+    assert payload["agentExecDurationMs"] == 1500
+
+
+def test_dates_set_by_hand(clock):
+    step = Step("s")
+    step.date_start = "2023-12-31T23:59:59.000+00:00"
+    clock.perf_ns += 500_000_000
+
+    step.close()
+
+    # compared with the wall clock end
+    assert step.duration_in_ms == 1500
+
+    step.set_score(1.0, group="g", cluster="c", date="2024-02-01T00:00:00.000+00:00")
+    assert step.date_start == step.date_end == "2024-02-01T00:00:00.000+00:00"
+
+
+def test_steps_of_a_tracking_measure_their_block(enola_stub):
+    tracking = Tracking(token=enola_stub.token, name="timed")
+
+    with tracking.step("sleep") as step:
+        time.sleep(0.05)
+
+    assert 45 <= step.duration_in_ms < 5000
+    assert step.date_start < step.date_end
@@ -0,0 +1,60 @@
+import time
+
+import pytest
+
+from enola.base.common.huemul_connection import HuemulConnection
+from enola.base.common.huemul_retry_policy import HuemulRetryPolicy
+from enola.base.common.huemul_timeout_error import HuemulTimeoutError
+from enola.tracking import Tracking
+
+TRACKING_ROUTE = "agent/execute/v1/"
+
+
+def test_read_timeout_raises_huemul_timeout_error(enola_stub):
+    enola_stub.delays[TRACKING_ROUTE] = 1
+    tracking = Tracking(
+        token=enola_stub.token,
+        name="timeout",
+        read_timeout=0.2,
+        retry_policy=HuemulRetryPolicy(max_attempts=2, base_delay=0),
+    )
+
+    with pytest.raises(HuemulTimeoutError):
+        tracking.execute(successfull=True)
+
+    assert len(enola_stub.requests_to(TRACKING_ROUTE)) == 2
+
+
+def test_timeout_error_is_still_a_name_error():
+    assert issubclass(HuemulTimeoutError, NameError)
+
+
+def test_deadline_stops_retries(enola_stub):
+    enola_stub.fail_next(503, times=10, retry_after="0.3")
+    tracking = Tracking(token=enola_stub.token, name="deadline", deadline=1, retry_policy=HuemulRetryPolicy(base_delay=0))
+
+    started = time.monotonic()
+    with pytest.raises(HuemulTimeoutError, match="deadline"):
+        tracking.execute(successfull=True)
+
+    assert time.monotonic() - started < 1
+    assert len(enola_stub.requests_to(TRACKING_ROUTE)) < 5
+
+
+@pytest.mark.parametrize("method", ["put", "auth", "post", "get"])
+def test_no_request_is_sent_after_the_deadline(enola_stub, method):
+    connection = Tracking(token=enola_stub.token, name="deadline", deadline=0.5).connection
+    huemul_connection = HuemulConnection(connect_object=connection, started=time.monotonic() - 1)
+    sent_before = len(enola_stub.requests)
+
+    if method == "put":
+        response = huemul_connection.put_request("agent/execute/v1/", "{}")
+    elif method == "auth":
+        response = huemul_connection.auth_request("authService/v1/sign-in-service/", "data", "O1")
+    elif method == "post":
+        response = huemul_connection.post_request("agent/execute/v1/", "{}")
+    else:
+        response = huemul_connection.get_request("agentExec/v1/")
+
+    assert [error.get("errorId") for error in response.errors] == ["Timeout"]
+    assert len(enola_stub.requests) == sent_before
@@ -0,0 +1,114 @@
+import asyncio
+import json
+
+import pandas as pd
+import pytest
+
+from enola.tracking_batch import AsyncTrackingBatch, TrackingBatch
+
+ROWS = 1000
+BATCH_ROUTE = "eventsToProcess/executeBatch/v1/"
+HEAD_ROUTE = "agentExecBatch/execute/v1/"
+
+
+def _batch_args(enola_stub):
+    dataframe = pd.DataFrame(
+        {"client": [f"c{i}" for i in range(ROWS)], "product": ["p"] * ROWS, "score": [1.0] * ROWS}
+    )
+    return dict(
+        token=enola_stub.token,
+        name="batch",
+        dataframe=dataframe,
+        period="2024-01-01T00:00:00Z",
+        client_id_column_name="client",
+        product_id_column_name="product",
+        score_value_column_name="score",
+    )
+
+
+def _sent_clients(enola_stub):
+    return [row["client_id"] for request in enola_stub.requests_to(BATCH_ROUTE) for row in request["body"]]
+
+
+def test_resume_sends_only_pending_rows(enola_stub, tmp_path):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    enola_stub.fail_call(BATCH_ROUTE, 4)
+
+    results = TrackingBatch(**_batch_args(enola_stub)).execute(batch_size=100, checkpoint_path=str(checkpoint_path))
+
+    assert results == []
+    checkpoint = json.loads(checkpoint_path.read_text())
+    assert checkpoint["batch_id"] == "B1"
+    assert checkpoint["sent"] == [[0, 300]]
+    acknowledged = _sent_clients(enola_stub)[:300]
+
+    enola_stub.requests.clear()
+    enola_stub.failing_calls.clear()
+    results = TrackingBatch(**_batch_args(enola_stub)).execute(
+        batch_size=150, checkpoint_path=str(checkpoint_path), resume=True
+    )
+
+    resumed = _sent_clients(enola_stub)
+    assert enola_stub.requests_to(HEAD_ROUTE) == []
+    assert len(results) == ROWS - 300
+    assert sorted(acknowledged + resumed) == sorted(f"c{i}" for i in range(ROWS))
+    assert not checkpoint_path.exists()
+
+
+def test_failed_chunk_logs_its_own_error(enola_stub, tmp_path, caplog, capsys):
+    enola_stub.fail_call(BATCH_ROUTE, 4)
+
+    TrackingBatch(**_batch_args(enola_stub)).execute(batch_size=100, checkpoint_path=str(tmp_path / "checkpoint.json"))
+
+    assert "batch: chunk 3 (rows 300 to 399) failed: error busy" in caplog.messages
+    assert "batch_id is empty" not in capsys.readouterr().out + caplog.text
+
+
+def test_async_failed_chunk_logs_its_own_error(enola_stub, caplog):
+    enola_stub.fail_call(BATCH_ROUTE, 2)
+
+    results = asyncio.run(AsyncTrackingBatch(**_batch_args(enola_stub)).execute(batch_size=100))
+
+    assert results == []
+    assert "batch: chunk 1 (rows 100 to 199) failed: error busy" in caplog.messages
+
+
+def test_resume_needs_checkpoint_path(enola_stub):
+    with pytest.raises(Exception):
+        TrackingBatch(**_batch_args(enola_stub)).execute(resume=True)
+
+
+def test_resume_without_checkpoint_file_sends_all_rows(enola_stub, tmp_path):
+    results = TrackingBatch(**_batch_args(enola_stub)).execute(
+        batch_size=300, checkpoint_path=str(tmp_path / "missing.json"), resume=True
+    )
+
+    assert len(results) == ROWS
+    assert len(enola_stub.requests_to(HEAD_ROUTE)) == 1
+
+
+def test_each_execute_creates_a_new_head(enola_stub):
+    tracking_batch = TrackingBatch(**_batch_args(enola_stub))
+
+    tracking_batch.execute(batch_size=500)
+    tracking_batch.execute(batch_size=500)
+
+    assert len(enola_stub.requests_to(HEAD_ROUTE)) == 2
+    assert len(_sent_clients(enola_stub)) == 2 * ROWS
+
+
+def test_async_resume_skips_sent_ranges(enola_stub, tmp_path):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    checkpoint_path.write_text(
+        json.dumps({"batch_id": "B9", "name": "batch", "total_rows": ROWS, "sent": [[0, 500], [600, ROWS]]})
+    )
+
+    results = asyncio.run(
+        AsyncTrackingBatch(**_batch_args(enola_stub)).execute(
+            batch_size=40, max_in_flight=3, checkpoint_path=str(checkpoint_path), resume=True
+        )
+    )
+
+    assert len(results) == 100
+    assert sorted(_sent_clients(enola_stub)) == sorted(f"c{i}" for i in range(500, 600))
+    assert not checkpoint_path.exists()
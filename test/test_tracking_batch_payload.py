@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from enola.tracking_batch import TrackingBatch
+
+BATCH_ROUTE = "eventsToProcess/executeBatch/v1/"
+
+
+def _batch_args(enola_stub, dataframe, **columns):
+    return dict(
+        token=enola_stub.token,
+        name="payload",
+        dataframe=dataframe,
+        period="2024-01-01T00:00:00Z",
+        client_id_column_name="client",
+        product_id_column_name="product",
+        **columns,
+    )
+
+
+def test_rows_are_sent_as_native_json_values(enola_stub):
+    dataframe = pd.DataFrame(
+        {
+            "client": ["c0", "c1"],
+            "product": ["p0", "p1"],
+            "score": np.array([0.5, 1.5]),
+            "count": np.array([1, 2], dtype="int64"),
+            "flag": [True, False],
+        }
+    )
+
+    TrackingBatch(**_batch_args(enola_stub, dataframe, score_value_column_name="score")).execute()
+
+    rows = enola_stub.requests_to(BATCH_ROUTE)[0]["body"]
+    assert [row["client_id"] for row in rows] == ["c0", "c1"]
+    assert [row["product_id"] for row in rows] == ["p0", "p1"]
+    assert all(row["agentExecBatchId"] == "B1" for row in rows)
+
+    step = rows[1]["step_list"][0]
+    assert step["agentExecScoreValue"] == 1.5
+    assert step["agentExecName"] == "payload"
+    assert step["agentExecType"] == "SCORE"
+    assert step["stepDateStart"] == step["stepDateEnd"] == "2024-01-01T00:00:00Z"
+    assert step["extraInfo"] == [
+        {"type": "info", "key": "client", "value": "c1"},
+        {"type": "info", "key": "product", "value": "p1"},
+        {"type": "info", "key": "score", "value": 1.5},
+        {"type": "info", "key": "count", "value": 2},
+        {"type": "info", "key": "flag", "value": False},
+    ]
+
+
+def test_rows_do_not_share_step_dicts(enola_stub):
+    dataframe = pd.DataFrame({"client": ["c0", "c1"], "product": ["p", "p"], "score": [0.1, 0.2]})
+
+    TrackingBatch(**_batch_args(enola_stub, dataframe, score_value_column_name="score")).execute()
+
+    rows = enola_stub.requests_to(BATCH_ROUTE)[0]["body"]
+    assert [row["step_list"][0]["agentExecScoreValue"] for row in rows] == [0.1, 0.2]
+
+
+def test_missing_mapped_column_fails_before_sending_rows(enola_stub):
+    dataframe = pd.DataFrame({"client": ["c0"], "product": ["p"]})
+
+    with pytest.raises(Exception, match="not found in dataframe"):
+        TrackingBatch(**_batch_args(enola_stub, dataframe, score_value_column_name="score")).execute()
+
+    assert enola_stub.requests_to(BATCH_ROUTE) == []
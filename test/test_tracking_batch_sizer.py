@@ -0,0 +1,67 @@
+import pandas as pd
+
+from enola.base.internal.tracking_batch.enola_tracking_batch_sizer import EnolaTrackingBatchSizer
+from enola.tracking_batch import TrackingBatch
+
+BATCH_ROUTE = "eventsToProcess/executeBatch/v1/"
+
+
+def test_first_row_always_fits_then_rows_and_bytes_limit_the_chunk():
+    sizer = EnolaTrackingBatchSizer(max_rows=3, max_bytes=100)
+
+    assert sizer.fits(num_rows=0, num_bytes=0, row_bytes=500)
+    assert sizer.fits(num_rows=1, num_bytes=40, row_bytes=40)
+    assert not sizer.fits(num_rows=2, num_bytes=80, row_bytes=40)
+    assert not sizer.fits(num_rows=3, num_bytes=3, row_bytes=1)
+
+
+def test_adaptive_rows_grow_when_fast_and_shrink_when_slow():
+    sizer = EnolaTrackingBatchSizer(max_rows=1000, target_latency_ms=100)
+    assert sizer.rows == 250
+
+    sizer.observe(num_rows=250, round_trip_ms=25)
+    assert sizer.rows == 500
+
+    sizer.observe(num_rows=500, round_trip_ms=400)
+    assert sizer.rows == 250
+
+    # server time over the target backs off even with a fast round trip
+    sizer.observe(num_rows=250, round_trip_ms=50, elapsed_time_ms=150)
+    assert sizer.rows == 125
+
+
+def test_without_target_latency_rows_stay_at_max_rows():
+    sizer = EnolaTrackingBatchSizer(max_rows=200)
+
+    sizer.observe(num_rows=200, round_trip_ms=10000)
+
+    assert sizer.rows == 200
+
+
+def test_batch_bodies_respect_max_batch_bytes(enola_stub):
+    rows = 200
+    dataframe = pd.DataFrame(
+        {
+            "client": [f"c{i}" for i in range(rows)],
+            "product": ["p"] * rows,
+            "score": [1.0] * rows,
+            "text": ["x" * 200] * rows,
+        }
+    )
+    tracking_batch = TrackingBatch(
+        token=enola_stub.token,
+        name="bytes",
+        dataframe=dataframe,
+        period="2024-01-01T00:00:00Z",
+        client_id_column_name="client",
+        product_id_column_name="product",
+        score_value_column_name="score",
+    )
+
+    results = tracking_batch.execute(batch_size=200, max_batch_bytes=20000)
+
+    requests = enola_stub.requests_to(BATCH_ROUTE)
+    assert len(results) == rows
+    assert len(requests) > 1
+    assert sum(len(request["body"]) for request in requests) == rows
+    assert all(request["size"] <= 20000 for request in requests)
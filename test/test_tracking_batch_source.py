@@ -0,0 +1,97 @@
+import pandas as pd
+import pytest
+
+from enola.base.internal.tracking_batch.enola_tracking_batch_source import EnolaTrackingBatchSource
+from enola.tracking_batch import TrackingBatch
+
+BATCH_ROUTE = "eventsToProcess/executeBatch/v1/"
+ROWS = 50
+
+
+def _rows(start=0, end=ROWS):
+    return [{"client": f"c{i}", "product": "p", "score": 1.0} for i in range(start, end)]
+
+
+def _execute(enola_stub, data, **args):
+    tracking_batch = TrackingBatch(
+        token=enola_stub.token,
+        name="stream",
+        dataframe=data,
+        period="2024-01-01T00:00:00Z",
+        client_id_column_name="client",
+        product_id_column_name="product",
+        score_value_column_name="score",
+        read_chunk_size=args.pop("read_chunk_size", 7),
+        **args,
+    )
+    return tracking_batch.execute(batch_size=10)
+
+
+def _sent_rows(enola_stub):
+    return [row for request in enola_stub.requests_to(BATCH_ROUTE) for row in request["body"]]
+
+
+def _extra_info(row):
+    return {info["key"]: info["value"] for info in row["step_list"][0]["extraInfo"]}
+
+
+def test_csv_file_is_counted_and_sent_in_order(enola_stub, tmp_path):
+    path = tmp_path / "rows.csv"
+    pd.DataFrame(_rows()).to_csv(path, index=False)
+
+    results = _execute(enola_stub, str(path))
+
+    assert len(results) == ROWS
+    assert [row["client_id"] for row in _sent_rows(enola_stub)] == [f"c{i}" for i in range(ROWS)]
+
+
+def test_parquet_file_is_sent(enola_stub, tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "rows.parquet"
+    pd.DataFrame(_rows()).to_parquet(path)
+
+    assert len(_execute(enola_stub, str(path))) == ROWS
+
+
+def test_iterator_of_dataframes_needs_total_rows(enola_stub):
+    frames = iter([pd.DataFrame(_rows(0, 20)), pd.DataFrame(_rows(20, ROWS))])
+
+    with pytest.raises(Exception, match="total_rows is required"):
+        _execute(enola_stub, iter([]))
+
+    assert len(_execute(enola_stub, frames, total_rows=ROWS)) == ROWS
+
+
+def test_iterator_of_dicts_keeps_keys_added_by_later_chunks(enola_stub):
+    rows = [dict(row, first=i) for i, row in enumerate(_rows(0, 7))]
+    rows += [dict(row, later=i) for i, row in enumerate(_rows(7, 14))]
+
+    _execute(enola_stub, iter(rows), total_rows=14)
+
+    sent = _sent_rows(enola_stub)
+    assert _extra_info(sent[0])["first"] == 0
+    assert _extra_info(sent[0]).get("later") is None
+    assert _extra_info(sent[13])["later"] == 6
+    assert _extra_info(sent[13])["first"] is None
+
+
+def test_rows_after_total_rows_are_not_sent_and_logged(enola_stub, caplog):
+    results = _execute(enola_stub, iter(_rows()), total_rows=30)
+
+    assert len(results) == 30
+    assert len(_sent_rows(enola_stub)) == 30
+    assert any("more rows than total_rows (30)" in message for message in caplog.messages)
+
+
+def test_iter_frames_reads_only_the_pending_ranges():
+    source = EnolaTrackingBatchSource(iter(_rows()), total_rows=ROWS, read_chunk_size=8)
+
+    frames = list(source.iter_frames([(5, 10), (30, 33)]))
+
+    assert [(position, list(frame["client"])) for position, frame in frames] == [
+        (5, ["c5", "c6", "c7"]),
+        (8, ["c8", "c9"]),
+        (30, ["c30", "c31"]),
+        (32, ["c32"]),
+    ]
+    assert not source.has_extra_rows
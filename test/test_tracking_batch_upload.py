@@ -0,0 +1,65 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from enola.base.internal.tracking_batch.enola_tracking_batch import create_tracking
+from enola.tracking_batch import TrackingBatch
+
+BATCH_ROUTE = "eventsToProcess/executeBatch/v1/"
+
+
+def _tracking_batch(enola_stub, rows):
+    dataframe = pd.DataFrame(
+        {"client": [f"c{i}" for i in range(rows)], "product": ["p"] * rows, "score": [1.0] * rows}
+    )
+    return TrackingBatch(
+        token=enola_stub.token,
+        name="batch",
+        dataframe=dataframe,
+        period="2024-01-01T00:00:00Z",
+        client_id_column_name="client",
+        product_id_column_name="product",
+        score_value_column_name="score",
+    )
+
+
+def test_parallel_upload_sends_each_row_once_in_order(enola_stub):
+    results = _tracking_batch(enola_stub, 1000).execute(batch_size=100, max_workers=4)
+
+    sent = [row["client_id"] for request in enola_stub.requests_to(BATCH_ROUTE) for row in request["body"]]
+    assert sorted(sent) == sorted(f"c{i}" for i in range(1000))
+    assert [result.enola_id for result in results] == [f"c{i}" for i in range(1000)]
+
+
+def test_chunks_failing_at_the_same_time_keep_their_own_error(enola_stub, monkeypatch):
+    connection = _tracking_batch(enola_stub, 1).connection
+    enola_stub.batch_errors = {"a": "chunk a failed", "b": "chunk b failed"}
+    enola_stub.batch_error_barrier = threading.Barrier(2, timeout=5)
+
+    # both uploads log their error before any of them builds its response
+    logged = threading.Barrier(2, timeout=5)
+    log_message_error = connection.huemul_logging.log_message_error
+
+    def log_and_wait(message):
+        log_message_error(message)
+        if message.startswith("error in enolaTracking"):
+            logged.wait()
+
+    monkeypatch.setattr(connection.huemul_logging, "log_message_error", log_and_wait)
+
+    def upload(client_id):
+        return create_tracking(
+            tracking_list_model=[],
+            connection=connection,
+            raise_error_if_fail=False,
+            data_in=json.dumps([{"client_id": client_id}]).encode(),
+        )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result_a, result_b = executor.map(upload, ["a", "b"])
+
+    assert not result_a.successfull and not result_b.successfull
+    assert result_a.message == "error chunk a failed"
+    assert result_b.message == "error chunk b failed"
@@ -0,0 +1,41 @@
+import time
+
+import pytest
+
+from enola.base.internal.tracking.enola_tracking_sender import get_tracking_sender
+from enola.tracking import Tracking
+
+TRACKING_ROUTE = "agent/execute/v1/"
+
+
+def test_background_execute_returns_before_the_server_answers(enola_stub):
+    enola_stub.delays[TRACKING_ROUTE] = 0.5
+    tracking = Tracking(token=enola_stub.token, name="background", background_send=True)
+
+    started = time.monotonic()
+    future = tracking.execute(successfull=True)
+
+    assert time.monotonic() - started < 0.3
+    assert future.result(timeout=5) is True
+    assert tracking.enola_id == "E1"
+
+
+def test_flush_waits_for_every_pending_tracking(enola_stub):
+    enola_stub.delays[TRACKING_ROUTE] = 0.05
+    futures = [
+        Tracking(token=enola_stub.token, name=f"background {i}", background_send=True).execute(successfull=True)
+        for i in range(5)
+    ]
+
+    get_tracking_sender().flush()
+
+    assert all(future.done() for future in futures)
+    assert len(enola_stub.requests_to(TRACKING_ROUTE)) == 5
+
+
+def test_background_errors_are_set_on_the_future(enola_stub):
+    enola_stub.fail_next(400)
+    future = Tracking(token=enola_stub.token, name="background", background_send=True).execute(successfull=True)
+
+    with pytest.raises(NameError):
+        future.result(timeout=5)
@@ -0,0 +1,168 @@
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from enola.enola_types import ErrOrWarnKind, StepType
+from enola.tracking import Tracking, get_current_step, get_current_tracking
+
+
+@pytest.fixture
+def tracking(enola_stub):
+    return Tracking(token=enola_stub.token, name="steps")
+
+
+def test_step_is_closed_and_added_when_the_block_ends(tracking):
+    with tracking.step("retrieve", kind=StepType.TOKEN, message_input="question") as step:
+        step.token.token_input = 120
+        assert tracking.step_list == []
+        assert get_current_step() is step
+        assert get_current_tracking() is tracking
+
+    assert tracking.step_list == [step]
+    assert step.successfull
+    assert step.step_type == StepType.TOKEN
+    assert step._end_ns is not None
+    assert step.to_json()["agentExecTokenInput"] == 120
+    assert get_current_step() is None
+
+
+def test_exception_is_added_as_error_and_raised_again(tracking):
+    with pytest.raises(ValueError, match="bad input"):
+        with tracking.step("parse") as step:
+            raise ValueError("bad input")
+
+    assert tracking.step_list == [step]
+    assert not step.successfull
+    assert step.num_errors == 1
+    assert [(item.id, item.error, item.kind) for item in step.errOrWarn_list] == [
+        ("ValueError", "bad input", ErrOrWarnKind.INTERNAL_CONTROLLED)
+    ]
+
+
+def test_step_with_added_error_is_not_successfull(tracking):
+    with tracking.step("check") as step:
+        step.add_error(id="E1", message="wrong", kind=ErrOrWarnKind.EXTERNAL)
+    with tracking.step("warn") as warned:
+        warned.add_warning(id="W1", message="slow", kind=ErrOrWarnKind.EXTERNAL)
+
+    assert not step.successfull
+    assert warned.successfull
+
+
+def test_nested_steps_are_linked_to_their_parent(tracking):
+    with tracking.step("flat"):
+        pass
+    with tracking.step("parent") as parent:
+        with tracking.step("child") as child:
+            with tracking.step("grandchild") as grandchild:
+                pass
+        with tracking.step("sibling") as sibling:
+            pass
+
+    flat = tracking.step_list[0]
+    assert flat.step_id == ""
+    assert parent.step_id != "" and child.step_id != ""
+    assert child.step_id_prev == sibling.step_id_prev == parent.step_id
+    assert grandchild.step_id_prev == child.step_id
+    assert grandchild.step_id == ""
+    assert [step.name for step in tracking.step_list] == ["flat", "grandchild", "child", "sibling", "parent"]
+
+
+def test_steps_of_another_tracking_are_not_linked(enola_stub, tracking):
+    other = Tracking(token=enola_stub.token, name="other")
+
+    with tracking.step("parent"):
+        with other.step("unrelated") as unrelated:
+            assert get_current_tracking() is other
+
+    assert unrelated.step_id_prev == ""
+
+
+def test_tasks_inherit_the_current_step_and_threads_copy_it(tracking):
+    async def child():
+        with tracking.step("task") as step:
+            return step
+
+    def in_thread(results):
+        with tracking.step("thread") as step:
+            results.append(step)
+
+    async def run():
+        with tracking.step("parent") as parent:
+            task_step = await asyncio.ensure_future(child())
+            results = []
+            thread = threading.Thread(target=in_thread, args=(results,))
+            thread.start()
+            thread.join()
+            copied = []
+            thread = threading.Thread(target=contextvars.copy_context().run, args=(in_thread, copied))
+            thread.start()
+            thread.join()
+        return parent, task_step, results[0], copied[0]
+
+    parent, task_step, thread_step, copied_step = asyncio.run(run())
+
+    assert task_step.step_id_prev == parent.step_id
+    assert thread_step.step_id_prev == ""
+    assert copied_step.step_id_prev == parent.step_id
+
+
+def test_traced_functions(tracking):
+    @tracking.traced
+    def answer(question):
+        return question.upper()
+
+    @tracking.traced(name="retrieve", kind=StepType.TOKEN)
+    def retrieve():
+        get_current_step().token.token_input = 3
+        raise KeyError("missing")
+
+    assert answer("hi") == "HI"
+    assert answer.__name__ == "answer"
+    with pytest.raises(KeyError):
+        retrieve()
+
+    first, second = tracking.step_list
+    assert first.name.endswith("answer") and first.successfull
+    assert second.name == "retrieve" and second.step_type == StepType.TOKEN
+    assert not second.successfull and second.token.token_input == 3
+
+
+def test_traced_coroutines(tracking):
+    @tracking.traced(kind=StepType.AUDIO)
+    async def transcribe(seconds):
+        await asyncio.sleep(seconds)
+        return get_current_step()
+
+    @tracking.traced
+    async def fail():
+        raise RuntimeError("no audio")
+
+    async def run():
+        step = await transcribe(0.02)
+        with pytest.raises(RuntimeError):
+            await fail()
+        return step
+
+    step = asyncio.run(run())
+
+    assert asyncio.iscoroutinefunction(transcribe)
+    assert tracking.step_list[0] is step
+    assert step.step_type == StepType.AUDIO and step.successfull
+    assert step.duration_in_ms >= 15
+    assert tracking.step_list[1].errOrWarn_list[0].error == "no audio"
+
+
+def test_steps_are_sent_with_the_tracking(enola_stub, tracking):
+    with tracking.step("parent"):
+        with tracking.step("child"):
+            pass
+
+    assert tracking.execute(successfull=True)
+
+    sent = enola_stub.requests_to("agent/execute/v1/")[0]["body"]["step_list"]
+    names = [step["agentExecName"] for step in sent]
+    assert names[:2] == ["child", "parent"]
+    assert sent[0]["stepIdPrev"] == sent[1]["stepId"] != ""